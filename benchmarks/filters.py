@@ -0,0 +1,67 @@
+"""Benchmark `ItemsQuery` listing filters on 100k listings.
+
+Compares matching each filter with `Filter.match` with the predicate
+compiled by `compile_filters`.
+
+Usage: python benchmarks/filters.py
+"""
+
+import random
+import timeit
+
+from stockx.ext.inventory.query import ItemsQuery
+from stockx.filter import compile_filters
+from stockx.models import Listing
+
+
+N_LISTINGS = 100_000
+N_STYLES = 500
+REPEAT = 5
+
+
+def make_listings():
+    random.seed(0)
+    return [
+        Listing.from_json({
+            'listingId': f'listing-{i}',
+            'status': 'ACTIVE',
+            'amount': '100',
+            'currencyCode': 'EUR',
+            'inventoryType': 'STANDARD',
+            'product': {
+                'productId': f'product-{style}',
+                'styleId': f'STYLE-{style}/ALT-{style}',
+            },
+            'variant': {
+                'variantId': f'variant-{style}-{size}',
+                'variantValue': str(size),
+            },
+        })
+        for i in range(N_LISTINGS)
+        for style, size in [(random.randrange(N_STYLES), random.randrange(4, 14))]
+    ]
+
+
+def main():
+    listings = make_listings()
+    query = ItemsQuery(inventory=None).filter_by(
+        style_ids=[f'STYLE-{i}' for i in range(0, N_STYLES, 5)],
+        sizes=['9', '10'],
+    )
+    filters = list(query._filters.values())
+
+    def matched():
+        return sum(all(f.match(listing) for f in filters) for listing in listings)
+
+    def compiled():
+        match = compile_filters(filters)
+        return sum(match(listing) for listing in listings)
+
+    assert matched() == compiled()
+    for name, func in (('Filter.match', matched), ('compiled', compiled)):
+        elapsed = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f'{name:<13} {elapsed * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
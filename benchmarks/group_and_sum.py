@@ -0,0 +1,85 @@
+"""Benchmark `stockx.processing.group_and_sum` on 100k items.
+
+Compares the hash-based implementation with the previous sort-based one
+that mutated the input items.
+
+Usage: python benchmarks/group_and_sum.py
+"""
+
+import random
+import timeit
+from functools import reduce
+from itertools import groupby
+from operator import attrgetter
+
+from stockx.processing import group_and_sum
+
+
+N_ITEMS = 100_000
+N_VARIANTS = 2_000
+N_PRICES = 20
+REPEAT = 5
+
+
+class Item:
+    __slots__ = 'variant_id', 'price', 'quantity', 'listing_ids'
+
+    def __init__(self, variant_id, price, quantity, listing_ids):
+        self.variant_id = variant_id
+        self.price = price
+        self.quantity = quantity
+        self.listing_ids = listing_ids
+
+
+def sorted_group_and_sum(iterable, group_keys, sum_attrs):
+    """The previous sort-based implementation."""
+    def reduce_func(accumulated, item):
+        for attr in sum_attrs:
+            item_attr = getattr(item, attr)
+            accumulated_attr = getattr(accumulated, attr)
+            setattr(item, attr, accumulated_attr + item_attr)
+        return item
+
+    iterable = sorted(iterable, key=attrgetter(*group_keys))
+    groups = groupby(iterable, key=attrgetter(*group_keys))
+    for _, group in groups:
+        yield reduce(reduce_func, group)
+
+
+def make_items(n_variants):
+    rng = random.Random(42)
+    return [
+        Item(
+            variant_id=f'variant-{rng.randrange(n_variants)}',
+            price=float(rng.randrange(N_PRICES) * 10),
+            quantity=rng.randint(1, 3),
+            listing_ids=[f'listing-{i}'],
+        )
+        for i in range(N_ITEMS)
+    ]
+
+
+def bench(name, func, n_variants):
+    keys = ('variant_id', 'price')
+    attrs = ('quantity', 'listing_ids')
+    # Fresh items for each run, the sort-based version mutates them
+    timer = timeit.Timer(
+        stmt='list(func(items, keys, attrs))',
+        setup='items = make_items(n_variants)',
+        globals={
+            'func': func,
+            'keys': keys,
+            'attrs': attrs,
+            'make_items': make_items,
+            'n_variants': n_variants,
+        },
+    )
+    best = min(timer.repeat(repeat=REPEAT, number=1))
+    print(f'{name:<12} {n_variants:>7} variants: {best * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    print(f'group_and_sum on {N_ITEMS:,} items (best of {REPEAT})')
+    for n_variants in (N_VARIANTS, 10):
+        bench('hash', group_and_sum, n_variants)
+        bench('sort', sorted_group_and_sum, n_variants)
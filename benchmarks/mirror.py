@@ -0,0 +1,61 @@
+"""Benchmark `CatalogMirror` typeahead searches over 50k products.
+
+Usage: python benchmarks/mirror.py
+"""
+
+import random
+import timeit
+
+from stockx.ext import CatalogMirror
+from stockx.models import Product, ProductAttributes
+
+
+N_PRODUCTS = 50_000
+REPEAT = 5
+
+BRANDS = ['Nike', 'Jordan', 'adidas', 'New Balance', 'Asics', 'Salomon']
+MODELS = ['Dunk', 'Air Max', 'Samba', 'Gel-Kayano', 'XT-6', '990v6', 'Retro']
+WORDS = [
+    'Low', 'High', 'Mid', 'OG', 'SP', 'Panda', 'Chicago', 'Bred', 'Triple',
+    'Cloud', 'Sail', 'Gum', 'Pine', 'University', 'Royal', 'Shadow', 'Grey',
+]
+COLORS = ['White', 'Black', 'Red', 'Blue', 'Green', 'Cream', 'Silver']
+QUERIES = ['du', 'dunk lo', 'jordan 1 chic', 'samba clou', 'gel kayno', 'xt 6']
+
+
+def make_products():
+    random.seed(0)
+    return [
+        Product(
+            product_id=f'product-{i}',
+            style_id=f'{random.choice("ABCDF")}{random.randrange(10**5):05}-{i:05}',
+            brand=(brand := random.choice(BRANDS)),
+            title=' '.join([
+                brand, random.choice(MODELS), *random.sample(WORDS, 3), str(i)
+            ]),
+            product_attributes=ProductAttributes(
+                colorway='/'.join(random.sample(COLORS, 2))
+            ),
+        )
+        for i in range(N_PRODUCTS)
+    ]
+
+
+def main():
+    products = make_products()
+    mirror = CatalogMirror()
+
+    seconds = timeit.timeit(lambda: mirror.update(products), number=1)
+    print(f'Index {N_PRODUCTS} products: {seconds:.2f} s')
+
+    for query in QUERIES:
+        mirror.search(query)  # Build the prefix vocabulary
+        seconds = min(
+            timeit.repeat(lambda: mirror.search(query), number=1, repeat=REPEAT)
+        )
+        hits = mirror.search(query, limit=None)
+        print(f'{query!r:>16}: {seconds * 1000:6.2f} ms, {len(hits)} hits')
+
+
+if __name__ == '__main__':
+    main()
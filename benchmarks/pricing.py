@@ -0,0 +1,75 @@
+"""Benchmark a repricing strategy sweep on 50k items.
+
+Compares vectorized strategy evaluation with calling the scalar payout
+function and strategy once per item.
+
+Usage: python benchmarks/pricing.py
+"""
+
+import random
+import timeit
+
+from stockx.ext.inventory.market import ItemMarketData, MarketValue
+from stockx.ext.inventory.pricing import (
+    Fees,
+    PricingInputs,
+    evaluate_pricing,
+    where,
+)
+
+
+N_ITEMS = 50_000
+REPEAT = 5
+
+FEES = Fees(
+    transaction_fee=0.09,
+    payment_fee=0.03,
+    shipping_fee=5.0,
+    minimum_transaction_fee=5.0,
+)
+
+
+class Item:
+    __slots__ = 'price',
+
+    def __init__(self, price):
+        self.price = price
+
+
+def make_inputs():
+    random.seed(0)
+    items = [Item(random.uniform(50, 500)) for _ in range(N_ITEMS)]
+    market_data = [
+        ItemMarketData(
+            currency='EUR',
+            lowest_ask=MarketValue(item.price * random.uniform(0.8, 1.2), 0.0),
+        )
+        for item in items
+    ]
+    return PricingInputs.from_items(items, market_data, FEES)
+
+
+def undercut(c):
+    new_price = c.lowest_ask - 1
+    return where(c.payout(new_price) > 150, new_price, c.price)
+
+
+def per_item(inputs):
+    for row in inputs.rows():
+        undercut(row)
+
+
+def main():
+    inputs = make_inputs()
+    vectorized = min(timeit.repeat(
+        lambda: evaluate_pricing(inputs, undercut), number=1, repeat=REPEAT
+    ))
+    scalar = min(timeit.repeat(
+        lambda: per_item(inputs), number=1, repeat=REPEAT
+    ))
+    print(f'vectorized: {vectorized * 1000:8.1f} ms')
+    print(f'per item:   {scalar * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
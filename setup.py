@@ -22,6 +22,10 @@ setup(
     python_requires='>=3.12',
     install_requires=['aiohttp>=3.9.5'],
     extras_require={
+        'numpy': ['numpy>=1.26'],
+        'opentelemetry': ['opentelemetry-api>=1.24'],
+        'parquet': ['pyarrow>=15.0'],
+        'prometheus': ['prometheus-client>=0.20'],
         'test': [
             'pytest>=8.3.4',
             'pytest-asyncio>=0.24.0',
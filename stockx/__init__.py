@@ -21,6 +21,7 @@ __all__ = (
     'BatchItemStatus',
     'BatchItemStatuses',
     'BatchOperationStatus',
+    'BatchOperationType',
     'BatchStatus',
     'BatchUpdateInput',
     'BatchUpdateResult',
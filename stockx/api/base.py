@@ -1,3 +1,4 @@
+import asyncio
 from math import ceil
 from typing import AsyncIterator
 
@@ -25,8 +26,13 @@ class StockXAPIBase:
             limit: int | None = None, 
             page_size: int = 10,
             reverse: bool = False,
+            prefetch: bool = False,
     ) -> AsyncIterator[JSON]:
-        """Paginate through API results."""
+        """Paginate through API results.
+        
+        With `prefetch`, the next page is requested as soon as a page is
+        received, so it downloads while the current page is consumed.
+        """
 
         params = params if params else {}
         params['pageSize'] = page_size
@@ -37,31 +43,52 @@ class StockXAPIBase:
         else:
             page_number = 1
 
+        step = 1 if not reverse else -1
         count = 0
-
-        while check(count, limit):
-            params['pageNumber'] = page_number
-            response = await self.client.get(endpoint, params=params)
-
-            if reverse:
-                has_next_page = page_number > 1
-            else:
-                has_next_page = bool(response.data.get('hasNextPage', False))
-
-            results = response.data.get(results_key, [])
-            if reverse:
-                results = reversed(results)
-
-            for item in results:
-                yield item
-                count += 1
-                if not check(count, limit):
+        next_page = None
+
+        try:
+            while check(count, limit):
+                if next_page is not None:
+                    response = await next_page
+                    next_page = None
+                else:
+                    params['pageNumber'] = page_number
+                    response = await self.client.get(endpoint, params=params)
+
+                if reverse:
+                    has_next_page = page_number > 1
+                else:
+                    has_next_page = bool(response.data.get('hasNextPage', False))
+
+                results = response.data.get(results_key, [])
+
+                if (
+                    prefetch 
+                    and has_next_page 
+                    and check(count + len(results), limit)
+                ):
+                    next_page = asyncio.ensure_future(self.client.get(
+                        endpoint, 
+                        params={**params, 'pageNumber': page_number + step},
+                    ))
+
+                if reverse:
+                    results = reversed(results)
+
+                for item in results:
+                    yield item
+                    count += 1
+                    if not check(count, limit):
+                        break
+
+                if not has_next_page: 
                     break
 
-            if not has_next_page: 
-                break
-
-            page_number += 1 if not reverse else -1
+                page_number += step
+        finally:
+            if next_page is not None:
+                next_page.cancel()
 
     async def _page_cursor(
             self, 
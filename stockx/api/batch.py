@@ -1,12 +1,16 @@
 import asyncio
 from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
     Awaitable,
     Callable,
     Iterable,
 )
+from typing import TypeVar
 
 from .base import StockXAPIBase
 from ..errors import StockXBatchTimeout
+from ..metrics import get_metrics
 from ..models import (
     BatchItemStatus,
     BatchOperationStatus,
@@ -19,6 +23,13 @@ from ..models import (
 )
 
 
+MIN_POLL_INTERVAL = 1
+MAX_POLL_INTERVAL = 30
+
+
+R = TypeVar('R', BatchCreateResult, BatchDeleteResult, BatchUpdateResult)
+
+
 class Batch(StockXAPIBase):
     """Interface for creating, updating, and deleting listings in batches."""
 
@@ -61,7 +72,7 @@ class Batch(StockXAPIBase):
     
     async def create_listings_completed(
             self, 
-            batch_ids: Iterable[str], 
+            batch_ids: Iterable[str] | AsyncIterable[str], 
             timeout: int,
     ) -> None:
         """Wait for batch create operations to complete.
@@ -73,6 +84,28 @@ class Batch(StockXAPIBase):
         """
         await batch_completed(batch_ids, self.create_listings_status, timeout)
 
+    def create_listings_results(
+            self,
+            batch_ids: Iterable[str] | AsyncIterable[str],
+            timeout: int,
+    ) -> AsyncIterator[BatchCreateResult]:
+        """Stream item-level results of batch create operations.
+
+        Results are yielded as soon as their batch completes.
+
+        Raises
+        ------
+        `StockXBatchTimeout`
+            If batch operations don't complete within timeout. The exception
+            contains the processed items of the timed out batches.
+        """
+        return batch_results(
+            batch_ids, 
+            self.create_listings_status, 
+            self.create_listings_items, 
+            timeout
+        )
+
     async def delete_listings(
             self,
             listing_ids: Iterable[str],
@@ -112,7 +145,7 @@ class Batch(StockXAPIBase):
     
     async def delete_listings_completed(
             self,
-            batch_ids: Iterable[str], 
+            batch_ids: Iterable[str] | AsyncIterable[str], 
             timeout: int,
     ) -> None:
         """Wait for batch delete operations to complete.
@@ -124,6 +157,28 @@ class Batch(StockXAPIBase):
         """
         await batch_completed(batch_ids, self.delete_listings_status, timeout)
 
+    def delete_listings_results(
+            self,
+            batch_ids: Iterable[str] | AsyncIterable[str],
+            timeout: int,
+    ) -> AsyncIterator[BatchDeleteResult]:
+        """Stream item-level results of batch delete operations.
+
+        Results are yielded as soon as their batch completes.
+
+        Raises
+        ------
+        `StockXBatchTimeout`
+            If batch operations don't complete within timeout. The exception
+            contains the processed items of the timed out batches.
+        """
+        return batch_results(
+            batch_ids, 
+            self.delete_listings_status, 
+            self.delete_listings_items, 
+            timeout
+        )
+
     async def update_listings(
             self,
             items: Iterable[BatchUpdateInput],
@@ -163,7 +218,7 @@ class Batch(StockXAPIBase):
     
     async def update_listings_completed(
             self,
-            batch_ids: Iterable[str], 
+            batch_ids: Iterable[str] | AsyncIterable[str], 
             timeout: int,
     ) -> None:
         """Wait for batch update operations to complete.
@@ -174,18 +229,42 @@ class Batch(StockXAPIBase):
             If batch operations don't complete within timeout
         """
         await batch_completed(batch_ids, self.update_listings_status, timeout)
+
+    def update_listings_results(
+            self,
+            batch_ids: Iterable[str] | AsyncIterable[str],
+            timeout: int,
+    ) -> AsyncIterator[BatchUpdateResult]:
+        """Stream item-level results of batch update operations.
+
+        Results are yielded as soon as their batch completes.
+
+        Raises
+        ------
+        `StockXBatchTimeout`
+            If batch operations don't complete within timeout. The exception
+            contains the processed items of the timed out batches.
+        """
+        return batch_results(
+            batch_ids, 
+            self.update_listings_status, 
+            self.update_listings_items, 
+            timeout
+        )
     
     
 async def batch_completed(
-        batch_ids: Iterable[str], 
+        batch_ids: Iterable[str] | AsyncIterable[str], 
         get_batch_status: Callable[[str], Awaitable[BatchStatus]], 
         timeout: int,
 ) -> None:
-    """Wait for batch operations to complete with exponential backoff.
+    """Wait for batch operations to complete.
+
+    See `batch_completion` for details on how batch statuses are polled.
 
     Parameters
     ----------
-    batch_ids : `Iterable[str]`
+    batch_ids : `Iterable[str] | AsyncIterable[str]`
         Batch operation IDs to monitor
     get_batch_status : `Callable[[str], Awaitable[BatchStatus]]`
         Get batch status callback to use
@@ -197,27 +276,223 @@ async def batch_completed(
     `StockXBatchTimeout`
         If batch operations don't complete within timeout
     """
-    finished_batch_ids = set()
-    queued_batch_ids = set(batch_ids)
+    async for _ in batch_completion(batch_ids, get_batch_status, timeout):
+        pass
 
-    sleep, waited = 1, 0
-    while waited <= timeout:
-        await asyncio.sleep(sleep)
 
-        for batch_id in queued_batch_ids:
-            status = await get_batch_status(batch_id)
-            if status.status == BatchOperationStatus.COMPLETED:
-                finished_batch_ids.add(batch_id)
+async def batch_results(
+        batch_ids: Iterable[str] | AsyncIterable[str],
+        get_batch_status: Callable[[str], Awaitable[BatchStatus]],
+        get_batch_items: Callable[[str], Awaitable[list[R]]],
+        timeout: int,
+) -> AsyncIterator[R]:
+    """Yield item-level results of batch operations as each batch completes.
 
-        queued_batch_ids.difference_update(finished_batch_ids)
-        if len(queued_batch_ids) == 0:
-            return
-        
-        waited += sleep
-        sleep = min(sleep * 2, timeout - waited)
+    A slow batch doesn't delay the results of the batches that already
+    completed.
+
+    Parameters
+    ----------
+    batch_ids : `Iterable[str] | AsyncIterable[str]`
+        Batch operation IDs to monitor
+    get_batch_status : `Callable[[str], Awaitable[BatchStatus]]`
+        Get batch status callback to use
+    get_batch_items : `Callable[[str], Awaitable[list[R]]]`
+        Get batch items callback to use
+    timeout : `int`
+        Maximum wait time in seconds
+
+    Raises
+    ------
+    `StockXBatchTimeout`
+        If batch operations don't complete within timeout. Items already 
+        processed in the timed out batches are available as 
+        `partial_batch_results`.
+    """
+    try:
+        async for batch_id in batch_completion(
+            batch_ids, get_batch_status, timeout
+        ):
+            for result in await get_batch_items(batch_id):
+                if result.status != BatchItemStatus.QUEUED:
+                    yield result
+    except StockXBatchTimeout as e:
+        partial_batch_results = []
+        for batch_id in e.queued_batch_ids:
+            results = await get_batch_items(batch_id)
+            partial_batch_results.extend(
+                result for result in results 
+                if result.status != BatchItemStatus.QUEUED
+            )
+        e.partial_batch_results = partial_batch_results
+        raise
+
+
+async def batch_completion(
+        batch_ids: Iterable[str] | AsyncIterable[str], 
+        get_batch_status: Callable[[str], Awaitable[BatchStatus]], 
+        timeout: int,
+) -> AsyncIterator[str]:
+    """Yield batch IDs as the batch operations complete.
+
+    Statuses of all outstanding batches are requested concurrently (requests
+    are still paced by the client throttle). The first check happens right
+    away, so small batches that complete almost instantly are not delayed.
+    Subsequent checks are scheduled from the progress reported in
+    `BatchStatus.item_statuses`: the processing rate observed between two
+    checks is used to predict when the next batch will complete. When no
+    progress can be measured the delay falls back to exponential backoff.
+
+    Batch IDs can also be provided as an async iterable while the batches
+    are still being submitted: early batches are polled while later ones 
+    are submitted, and the timeout starts once all batches are submitted.
+
+    Parameters
+    ----------
+    batch_ids : `Iterable[str] | AsyncIterable[str]`
+        Batch operation IDs to monitor
+    get_batch_status : `Callable[[str], Awaitable[BatchStatus]]`
+        Get batch status callback to use
+    timeout : `int`
+        Maximum wait time in seconds
+
+    Raises
+    ------
+    `StockXBatchTimeout`
+        If batch operations don't complete within timeout
+    """
+    loop = asyncio.get_running_loop()
+    queued_batch_ids: list[str] = []
+    progress: dict[str, tuple[float, int]] = {}
+    arrived = asyncio.Event()
+    # Submission time of each batch, for completion metrics
+    queued_at: dict[str, float] = {}
+
+    async def collect(batch_ids: AsyncIterable[str]) -> None:
+        async for batch_id in batch_ids:
+            queued_batch_ids.append(batch_id)
+            queued_at[batch_id] = loop.time()
+            arrived.set()
+
+    if isinstance(batch_ids, AsyncIterable):
+        submission = asyncio.ensure_future(collect(batch_ids))
     else:
-        raise StockXBatchTimeout(
-            message='Batch operation timed out.', 
-            queued_batch_ids=queued_batch_ids
-        )
+        queued_batch_ids.extend(dict.fromkeys(batch_ids))
+        queued_at.update(dict.fromkeys(queued_batch_ids, loop.time()))
+        submission = None
+
+    submitted_at = None if submission else loop.time()
+    backoff = MIN_POLL_INTERVAL
+    try:
+        while True:
+            if submitted_at is None and submission.done():
+                submission.result()  # Propagate submission errors
+                submitted_at = loop.time()
+
+            if not queued_batch_ids:
+                if submitted_at is not None:
+                    return
+                # Wait for the next batch to be submitted
+                arrived.clear()
+                waiter = asyncio.ensure_future(arrived.wait())
+                try:
+                    await asyncio.wait(
+                        (submission, waiter), 
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    waiter.cancel()
+                continue
+
+            polled_batch_ids = list(queued_batch_ids)
+            statuses = await asyncio.gather(
+                *(get_batch_status(batch_id) for batch_id in polled_batch_ids)
+            )
+            now = loop.time()
+
+            estimates = []
+            completed = []
+            for batch_id, status in zip(polled_batch_ids, statuses):
+                if status.status == BatchOperationStatus.COMPLETED:
+                    completed.append(batch_id)
+                    continue
+                previous = progress.get(batch_id)
+                estimate = _estimate_completion(previous, status, now)
+                if estimate is not None:
+                    estimates.append(estimate)
+                progress[batch_id] = (now, _processed_items(status))
+
+            queued_batch_ids[:] = [
+                batch_id for batch_id in queued_batch_ids 
+                if batch_id not in completed
+            ]
+            if completed and (metrics := get_metrics()) is not None:
+                operation = _operation_name(get_batch_status)
+                for batch_id in completed:
+                    metrics.batch(operation, now - queued_at[batch_id])
+            for batch_id in completed:
+                yield batch_id
+
+            if not queued_batch_ids:
+                continue
+
+            if submitted_at is None:
+                waited = 0
+            else:
+                waited = loop.time() - submitted_at
+                if waited >= timeout:
+                    break
+
+            if estimates:
+                sleep = max(min(estimates), MIN_POLL_INTERVAL)
+                backoff = MIN_POLL_INTERVAL
+            else:
+                sleep = backoff
+                backoff = min(backoff * 2, MAX_POLL_INTERVAL)
+
+            await asyncio.sleep(min(sleep, MAX_POLL_INTERVAL, timeout - waited))
+    finally:
+        if submission and not submission.done():
+            submission.cancel()
+
+    raise StockXBatchTimeout(
+        message='Batch operation timed out.', 
+        queued_batch_ids=queued_batch_ids,
+        partial_batch_results=[],
+    )
+
+
+def _operation_name(get_batch_status: Callable) -> str:
+    """Name of a batch operation, e.g. 'create_listings' for the
+    `create_listings_status` getter."""
+    name = getattr(get_batch_status, '__name__', 'batch')
+    return name.removesuffix('_status')
+
+
+def _processed_items(status: BatchStatus) -> int:
+    """Number of items of a batch that are no longer queued."""
+    if not status.item_statuses:
+        return 0
+    return status.item_statuses.completed + status.item_statuses.failed
+
+
+def _estimate_completion(
+        previous: tuple[float, int] | None,
+        status: BatchStatus,
+        now: float,
+) -> float | None:
+    """Estimate the seconds left until a batch completes.
+
+    Uses the items processed since the `previous` check to compute the
+    processing rate. Returns `None` if the rate can't be measured.
+    """
+    if not previous or not status.item_statuses:
+        return None
+
+    checked_at, processed = previous
+    elapsed = now - checked_at
+    progressed = _processed_items(status) - processed
+    if elapsed <= 0 or progressed <= 0:
+        return None
 
+    return status.item_statuses.queued * elapsed / progressed
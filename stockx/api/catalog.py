@@ -1,6 +1,8 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from typing import Any
 
 from .base import StockXAPIBase
+from .client import StockXAPIClient
 from ..cache import cache_by
 from ..models import (
     Currency,
@@ -13,6 +15,24 @@ from ..models import (
 class Catalog(StockXAPIBase):
     """Interface for interacting with the StockX catalog."""
 
+    def __init__(self, client: StockXAPIClient) -> None:
+        super().__init__(client)
+        self._product_listeners: list[Callable[[Product], Any]] = []
+
+    def add_product_listener(self, listener: Callable[[Product], Any]) -> None:
+        """Call `listener` with every product decoded from a response.
+
+        Examples
+        --------
+        >>> index = ProductIndex()
+        >>> stockx.catalog.add_product_listener(index.add)
+        """
+        self._product_listeners.append(listener)
+
+    def remove_product_listener(self, listener: Callable[[Product], Any]) -> None:
+        """Stop calling `listener` with decoded products."""
+        self._product_listeners.remove(listener)
+
     @cache_by('product_id')
     async def get_product(
             self, 
@@ -25,7 +45,7 @@ class Catalog(StockXAPIBase):
         Results are cached indefinitely.
         """
         response = await self.client.get(f'/catalog/products/{product_id}')
-        return Product.from_json(response.data)
+        return self._decoded(Product.from_json(response.data))
     
     @cache_by('product_id')
     async def get_all_product_variants(
@@ -114,4 +134,9 @@ class Catalog(StockXAPIBase):
             limit=limit,
             page_size=page_size
         ):
-            yield Product.from_json(product)
+            yield self._decoded(Product.from_json(product))
+
+    def _decoded(self, product: Product) -> Product:
+        for listener in self._product_listeners:
+            listener(product)
+        return product
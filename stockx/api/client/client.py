@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import aiohttp
 import asyncio
+import time
 
 from .retry import retry
 from .throttle import throttle
@@ -10,6 +11,7 @@ from ...errors import (
     stockx_request_error,
 )
 from ...logs import logger
+from ...metrics import endpoint_template, get_metrics
 from ...models import Response
 from ...types_ import JSON, Params
 
@@ -126,6 +128,9 @@ class StockXAPIClient:
             data = {k: v for k, v in data.items() if v is not None}
 
         url = f'{self.url}{endpoint}'
+        metrics = get_metrics()
+        started_at = time.perf_counter() if metrics is not None else 0.0
+        status = None
         try:
             async with self._session.request(
                 method,
@@ -134,6 +139,7 @@ class StockXAPIClient:
                 json=data,
                 headers=self._auth_headers
             ) as response:
+                status = response.status
                 data = await response.json()
                 if 299 >= response.status >= 200:
                     return Response(
@@ -148,11 +154,20 @@ class StockXAPIClient:
                 logger.error(e)
                 raise e
         except aiohttp.ClientResponseError as e:
+            status = e.status
             logger.error(e)
             raise stockx_request_error(e.message, e.status) from e
         except aiohttp.ClientError as e:
             logger.error(e)
             raise stockx_request_error('Request failed.') from e
+        finally:
+            if metrics is not None:
+                metrics.request(
+                    method,
+                    endpoint_template(endpoint),
+                    status,
+                    time.perf_counter() - started_at,
+                )
             
     async def _refresh_token(self) -> None:
         while True:
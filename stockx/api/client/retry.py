@@ -5,6 +5,7 @@ from typing import Any, TypeVar
 
 from ...errors import StockXRequestError
 from ...logs import logger
+from ...metrics import get_metrics
 
 
 T = TypeVar('T')
@@ -44,6 +45,8 @@ class _RetryDecorator:
                     
                     sleep = min(self.delay(attempt), self.timeout - waited)
                     logger.warn(f'Retrying in {sleep} seconds...')
+                    if (metrics := get_metrics()) is not None:
+                        metrics.retry(e.status_code, attempt + 1, sleep)
                     await asyncio.sleep(sleep)
                     waited += sleep
             raise last_error
@@ -5,6 +5,8 @@ from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import Any, TypeVar
 
+from ...metrics import get_metrics
+
 
 T = TypeVar('T')
 
@@ -14,7 +16,7 @@ class _ThrottleDecorator:
     
     def __init__(self, seconds: float) -> None:
         self.seconds = seconds
-        self._queue: deque[tuple[asyncio.Future[T], Awaitable[T]]] = deque()
+        self._queue: deque[tuple[asyncio.Future[T], Awaitable[T], float]] = deque()
         self._task: asyncio.Task | None = None
         self._last_request_time = 0.0
     
@@ -27,12 +29,19 @@ class _ThrottleDecorator:
                 continue
             
             self._last_request_time = now()
-            future, request = self._queue.popleft()
+            future, request, queued_at = self._queue.popleft()
+            if (metrics := get_metrics()) is not None:
+                metrics.throttle(
+                    self._last_request_time - queued_at, len(self._queue)
+                )
             try:
                 result = await request
-                future.set_result(result)
             except Exception as e:
-                future.set_exception(e)
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
 
     def __call__(
             self, 
@@ -47,7 +56,7 @@ class _ThrottleDecorator:
             
             future = loop.create_future()
             request = func(*args, **kwargs)
-            self._queue.append((future, request))
+            self._queue.append((future, request, now()))
             return await future
         return wrapper
     
@@ -3,6 +3,7 @@ from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
 
 from .base import StockXAPIBase
+from ..errors import StockXOperationTimeout
 from ..format import (
     comma_separated,
     iso,
@@ -18,6 +19,10 @@ from ..models import (
 )
 
 
+MIN_OPERATION_POLL_INTERVAL = 0.5
+MAX_OPERATION_POLL_INTERVAL = 8
+
+
 class Listings(StockXAPIBase):
     """Interface for interacting with listings."""
 
@@ -42,16 +47,14 @@ class Listings(StockXAPIBase):
             oldest_first: bool = False,
     ) -> AsyncIterator[Listing]:
         """Get all listings."""
-        params = {
-            'productIds': comma_separated(product_ids),
-            'variantIds': comma_separated(variant_ids),
-            'fromDate': iso_date(from_date),
-            'toDate': iso_date(to_date),
-            'listingStatuses': comma_separated(
-                status.value for status in listing_statuses
-            ) if listing_statuses else None,
-            'inventoryTypes': comma_separated(inventory_types),
-        }
+        params = _listings_params(
+            product_ids=product_ids,
+            variant_ids=variant_ids,
+            from_date=from_date,
+            to_date=to_date,
+            listing_statuses=listing_statuses,
+            inventory_types=inventory_types,
+        )
         async for listing in self._page(
             endpoint='/selling/listings',
             results_key='listings',
@@ -62,6 +65,29 @@ class Listings(StockXAPIBase):
         ):
             yield Listing.from_json(listing)
 
+    async def count_listings(
+            self,
+            product_ids: Iterable[str] | None = None,
+            variant_ids: Iterable[str] | None = None,
+            from_date: datetime | None = None,
+            to_date: datetime | None = None,
+            listing_statuses: Iterable[ListingStatus] | None = None,
+            inventory_types: Iterable[str] | None = None,
+    ) -> int:
+        """Count the listings matching the filters with a single request."""
+        params = _listings_params(
+            product_ids=product_ids,
+            variant_ids=variant_ids,
+            from_date=from_date,
+            to_date=to_date,
+            listing_statuses=listing_statuses,
+            inventory_types=inventory_types,
+        )
+        params['pageSize'] = 1
+        params['pageNumber'] = 1
+        response = await self.client.get('/selling/listings', params=params)
+        return int(response.data.get('count', 0))
+
     async def create_listing(
             self,
             amount: float,
@@ -161,19 +187,125 @@ class Listings(StockXAPIBase):
         ):
             yield Operation.from_json(operation)
 
-    async def operation_succeeded(
+    async def wait_for_operation(
             self,
-            operation: Operation
-    ) -> bool:
-        """Check if a listing operation has succeeded."""
+            operation: Operation,
+            timeout: float = 60,
+    ) -> Operation:
+        """
+        Wait for a listing operation to leave the pending status.
+
+        The operation is polled with exponential backoff, from 0.5 up to 8 
+        seconds between checks, so pending operations don't use up the 
+        request budget of the client.
+
+        Parameters
+        ----------
+        operation : `Operation`
+            The listing operation to wait for.
+        timeout : `float`, default 60
+            Maximum wait time in seconds.
+
+        Returns
+        -------
+        `Operation`
+            The operation in its final status.
+
+        Raises
+        ------
+        `StockXOperationTimeout`
+            If the operation is still pending after `timeout`.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = MIN_OPERATION_POLL_INTERVAL
+
         while operation.status == OperationStatus.PENDING:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise StockXOperationTimeout(
+                    message='Listing operation timed out.',
+                    operation_id=operation.id,
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, MAX_OPERATION_POLL_INTERVAL)
+
             operation = await self.get_listing_operation(
                 listing_id=operation.listing_id,
                 operation_id=operation.id
             )
-        
-        if operation.status == OperationStatus.FAILED:
-            return False
-        
-        return True
 
+        return operation
+
+    async def operation_succeeded(
+            self,
+            operation: Operation,
+            timeout: float = 60,
+    ) -> bool:
+        """
+        Check if a listing operation has succeeded, waiting while pending.
+
+        See `wait_for_operation` for how the operation is polled.
+
+        Raises
+        ------
+        `StockXOperationTimeout`
+            If the operation is still pending after `timeout`.
+        """
+        operation = await self.wait_for_operation(operation, timeout)
+        return operation.status != OperationStatus.FAILED
+
+    async def operations_succeeded(
+            self,
+            operations: Iterable[Operation],
+            timeout: float = 60,
+    ) -> list[bool]:
+        """
+        Check if listing operations have succeeded, waiting concurrently.
+
+        Parameters
+        ----------
+        operations : `Iterable[Operation]`
+            The listing operations to check.
+        timeout : `float`, default 60
+            Maximum wait time in seconds, shared by all operations.
+
+        Returns
+        -------
+        `list[bool]`
+            Whether each operation succeeded, in the same order.
+
+        Raises
+        ------
+        `StockXOperationTimeout`
+            If some operations are still pending after `timeout`. Raised 
+            once all the other operations are settled.
+        """
+        outcomes = await asyncio.gather(
+            *(self.operation_succeeded(op, timeout) for op in operations),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        return outcomes
+
+
+def _listings_params(
+        product_ids: Iterable[str] | None,
+        variant_ids: Iterable[str] | None,
+        from_date: datetime | None,
+        to_date: datetime | None,
+        listing_statuses: Iterable[ListingStatus] | None,
+        inventory_types: Iterable[str] | None,
+) -> dict[str, str | None]:
+    return {
+        'productIds': comma_separated(product_ids),
+        'variantIds': comma_separated(variant_ids),
+        'fromDate': iso_date(from_date),
+        'toDate': iso_date(to_date),
+        'listingStatuses': comma_separated(
+            status.value for status in listing_statuses
+        ) if listing_statuses else None,
+        'inventoryTypes': comma_separated(inventory_types),
+    }
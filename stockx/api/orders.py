@@ -30,9 +30,14 @@ class Orders(StockXAPIBase):
             product_id: str | None = None,
             variant_id: str | None = None, 
             limit: int | None = None, 
-            page_size: int = 10
+            page_size: int = 10,
+            prefetch: bool = False,
     ) -> AsyncIterator[Order]:
-        """Get the history of completed sales orders."""
+        """Get the history of completed sales orders.
+        
+        With `prefetch`, the next page is requested while the current one 
+        is consumed.
+        """
         params = {
             'fromDate': iso_date(from_date),
             'toDate': iso_date(to_date),
@@ -45,7 +50,8 @@ class Orders(StockXAPIBase):
             results_key='orders',
             params=params,
             limit=limit,
-            page_size=page_size
+            page_size=page_size,
+            prefetch=prefetch,
         ):
             yield Order.from_json(order)
 
@@ -56,9 +62,14 @@ class Orders(StockXAPIBase):
             variant_id: str | None = None,
             sort_order: str | None = None, 
             limit: int | None = None, 
-            page_size: int = 10
+            page_size: int = 10,
+            prefetch: bool = False,
     ) -> AsyncIterator[Order]:
-        """Get currently active sales orders."""
+        """Get currently active sales orders.
+        
+        With `prefetch`, the next page is requested while the current one 
+        is consumed.
+        """
         params = {
             'orderStatus': order_status.value if order_status else None,
             'productId': product_id,
@@ -70,6 +81,7 @@ class Orders(StockXAPIBase):
             results_key='orders',
             params=params,
             limit=limit,
-            page_size=page_size
+            page_size=page_size,
+            prefetch=prefetch,
         ):
             yield Order.from_json(order)
\ No newline at end of file
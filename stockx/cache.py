@@ -5,6 +5,8 @@ from functools import wraps
 from inspect import signature
 from typing import Any, TypeVar
 
+from .metrics import get_metrics
+
 
 T = TypeVar('T')
 Cache = OrderedDict[tuple[Any, ...], tuple[T, float]]
@@ -29,6 +31,7 @@ class _CacheDecorator:
             func: Callable[..., Awaitable[T]]
     ) -> Callable[..., Awaitable[T]]:
         sig = signature(func)
+        name = func.__qualname__
 
         def make_key(*args, **kwargs):
             bound_args = sig.bind(*args, **kwargs)
@@ -41,7 +44,10 @@ class _CacheDecorator:
             now = time.time()
             
             cached_value, timestamp = self._cache.get(key, (None, None))
-            if cached_value and (not self.ttl or now - timestamp <= self.ttl):
+            hit = cached_value and (not self.ttl or now - timestamp <= self.ttl)
+            if (metrics := get_metrics()) is not None:
+                metrics.cache(name, bool(hit))
+            if hit:
                 return cached_value
 
             value = await func(*args, **kwargs)
@@ -0,0 +1,51 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+async def map_bounded(
+        func: Callable[[T], Awaitable[R]],
+        iterable: Iterable[T],
+        /,
+        limit: int = 50,
+) -> list[R]:
+    """
+    Apply an async function to all items concurrently, running at most 
+    `limit` calls at a time.
+
+    Parameters
+    ----------
+    func : `Callable[[T], Awaitable[R]]`
+        Async function to apply to each item.
+    iterable : `Iterable[T]`
+        Items to apply the function to.
+    limit : `int`, default 50
+        Maximum number of concurrent calls.
+
+    Returns
+    -------
+    `list[R]`
+        Results in the same order as the input items.
+
+    Examples
+    --------
+    >>> products = await map_bounded(
+    ...     stockx.catalog.get_product, 
+    ...     product_ids, 
+    ...     limit=10
+    ... )
+    """
+    if limit < 1:
+        raise ValueError('Limit must be at least 1.')
+    
+    semaphore = asyncio.Semaphore(limit)
+
+    async def call(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+        
+    return await asyncio.gather(*(call(item) for item in iterable))
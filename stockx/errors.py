@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Literal, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
         BatchCreateResult,
         BatchUpdateResult,
         BatchDeleteResult,
+        BatchOperationType,
     )
     from .ext.inventory import UpdateResult
 
@@ -96,23 +97,28 @@ class StockXIncompleteOperation(StockXException):
         Available results from completed operations.
     timed_out_batch_ids : `Iterable[str]`
         Batch IDs that are still queued after timeout.
+    batch_operations : `Mapping[str, BatchOperationType] | None`, optional
+        Operation of each timed out batch, if known.
 
     Attributes
     ----------
     message : `str`
     partial_results : `list[UpdateResult]`
     timed_out_batch_ids : `list[str]`
+    batch_operations : `dict[str, BatchOperationType]`
     """
     def __init__(
             self, 
             message: str,
             partial_results: Iterable[UpdateResult],
             timed_out_batch_ids: Iterable[str],
+            batch_operations: Mapping[str, BatchOperationType] | None = None,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.partial_results = list(partial_results)
         self.timed_out_batch_ids = list(timed_out_batch_ids)
+        self.batch_operations = dict(batch_operations or {})
 
     def __str__(self) -> str:
         return (
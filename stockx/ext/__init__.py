@@ -1,9 +1,21 @@
 """StockX high-level business logic abstractions."""
 
-from . import search
+from . import export, search
+from .analytics import SalesAggregates, SalesStats
+from .history import HistoryScanner, HistoryWindow
+from .mirror import CatalogMirror, SearchHit
 from .mock import mock_listing
+from .orders import OrderSync
 
 __all__ = (
+    'CatalogMirror',
+    'HistoryScanner',
+    'HistoryWindow',
+    'OrderSync',
+    'SalesAggregates',
+    'SalesStats',
+    'SearchHit',
+    'export',
     'mock_listing',
     'search',
 )
\ No newline at end of file
@@ -0,0 +1,408 @@
+"""
+Rolling sales aggregates over order history.
+
+Orders are aggregated into daily buckets per product, variant and status,
+each a small array allocated only for the days with sales within the last
+`horizon` days. Queries
+such as sales velocity or realized payout sum a few buckets, so pricing
+strategies can consult them without rescanning the history. Aggregates
+are updated incrementally from order streams, persisted to JSON and
+merged across runs, counting each order once by its number.
+
+Examples
+--------
+>>> sales = SalesAggregates.open('sales.json')
+>>> async for order in stockx.orders.get_orders_history(from_date=since):
+...     sales.add(order)
+>>> stats = sales.stats(product_id, variant_id, days=30)
+>>> stats.velocity, stats.realized_ratio
+(0.4, 0.87)
+"""
+
+from __future__ import annotations
+import json
+import os
+import heapq
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+from ..format import pretty_str
+from ..logs import logger
+from ..models import Order, OrderStatusActive, OrderStatusClosed, Payout
+
+
+__all__ = (
+    'FAILED_STATUSES',
+    'SalesAggregates',
+    'SalesStats',
+)
+
+
+FORMAT_VERSION = 1
+
+# Aggregated values of each bucket
+FIELDS = (
+    'count',
+    'amount',
+    'payout',
+    'transaction_fee',
+    'payment_fee',
+    'shipping_cost',
+)
+
+# Statuses of orders that did not result in a sale
+FAILED_STATUSES = frozenset({
+    OrderStatusActive.CCAUTHORIZATIONFAILED.value,
+    OrderStatusClosed.AUTHFAILED.value,
+    OrderStatusClosed.DIDNOTSHIP.value,
+    OrderStatusClosed.CANCELED.value,
+    OrderStatusClosed.RETURNED.value,
+})
+
+Key = tuple[str, str, str]   # Product ID, variant ID and status
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class SalesStats:
+    """
+    Aggregated orders over a window of days.
+
+    Fees are amounts as adjusted on payouts, so usually negative.
+
+    Parameters
+    ----------
+    days : `int`
+        Length of the window in days.
+    count : `int`
+        Number of orders.
+    amount : `float`
+        Total sale amount.
+    payout : `float`
+        Total payout.
+    transaction_fee : `float`
+        Total transaction fees.
+    payment_fee : `float`
+        Total payment processing fees.
+    shipping_cost : `float`
+        Total shipping costs.
+    """
+    days: int
+    count: int = 0
+    amount: float = 0
+    payout: float = 0
+    transaction_fee: float = 0
+    payment_fee: float = 0
+    shipping_cost: float = 0
+
+    @property
+    def velocity(self) -> float:
+        """Orders per day."""
+        return self.count / self.days
+
+    @property
+    def average_price(self) -> float | None:
+        return self.amount / self.count if self.count else None
+
+    @property
+    def realized_ratio(self) -> float | None:
+        """Payout per unit of sale amount."""
+        return self.payout / self.amount if self.amount else None
+
+    def sell_through(self, listed: int) -> float | None:
+        """Share of units sold over the units sold plus still `listed`."""
+        total = self.count + listed
+        return self.count / total if total else None
+
+
+class _Buckets:
+    """Daily buckets of the aggregated values, allocated for days with orders."""
+
+    __slots__ = 'days',
+
+    def __init__(self) -> None:
+        self.days: dict[int, array[float]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.days)
+
+    def add(self, day: int, values: Iterable[float], sign: int = 1) -> None:
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = array('d', bytes(8 * len(FIELDS)))
+        for i, value in enumerate(values):
+            bucket[i] += sign * value
+        if not bucket[0]:   # No orders left
+            del self.days[day]
+
+    def sum(self, first_day: int, last_day: int, totals: list[float]) -> None:
+        for day, bucket in self.days.items():
+            if first_day <= day <= last_day:
+                for i, value in enumerate(bucket):
+                    totals[i] += value
+
+
+class SalesAggregates:
+    """
+    Incremental rolling aggregates of sales orders.
+
+    Each order is counted once, by its number, in the bucket of its
+    creation day: adding an order again (e.g. with a new status) replaces
+    its previous contribution. Orders older than `horizon` days before
+    the newest order are dropped.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike | None`, optional
+        JSON file the aggregates are persisted to by `save`.
+    horizon : `int`, default 365
+        Days of history kept.
+    """
+
+    __slots__ = (
+        '_buckets',
+        '_day_heap',
+        '_days',
+        '_newest',
+        '_orders',
+        '_variants',
+        'horizon',
+        'path',
+    )
+
+    def __init__(
+            self,
+            path: str | os.PathLike | None = None,
+            horizon: int = 365,
+    ) -> None:
+        if horizon < 1:
+            raise ValueError('Horizon must be at least 1 day.')
+        self.path = Path(path) if path else None
+        self.horizon = horizon
+        self._buckets: dict[Key, _Buckets] = {}
+        # Product ID -> keys of its buckets
+        self._variants: dict[str, set[Key]] = {}
+        # Order number -> key, day and values of its contribution
+        self._orders: dict[str, tuple[Key, int, tuple[float, ...]]] = {}
+        # Day -> order numbers, and days with orders, oldest first
+        self._days: dict[int, set[str]] = {}
+        self._day_heap: list[int] = []
+        self._newest = -1
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, **kwargs) -> SalesAggregates:
+        """Create aggregates persisted to `path`, loading them if they exist."""
+        aggregates = cls(path, **kwargs)
+        if aggregates.path.exists():
+            aggregates.load()
+        return aggregates
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_number: str) -> bool:
+        return order_number in self._orders
+
+    def add(self, order: Order) -> None:
+        """Aggregate an order, replacing its previous version."""
+        if order.created_at is None:
+            return
+        status = order.status.value if isinstance(order.status, Enum) else order.status
+        key = (order.product.product_id, order.variant.variant_id, status)
+        day = order.created_at.date().toordinal()
+        self._add(order.number, key, day, _values(order))
+
+    def update(self, orders: Iterable[Order]) -> None:
+        """Aggregate many orders."""
+        for order in orders:
+            self.add(order)
+
+    def merge(self, other: SalesAggregates) -> None:
+        """Merge the orders of other aggregates, which take precedence."""
+        for number, (key, day, values) in other._orders.items():
+            self._add(number, key, day, values)
+
+    def stats(
+            self,
+            product_id: str | None = None,
+            variant_id: str | None = None,
+            statuses: Iterable[str | Enum] | None = None,
+            days: int = 30,
+            until: date | datetime | None = None,
+    ) -> SalesStats:
+        """
+        Aggregate the orders of a window of days.
+
+        Parameters
+        ----------
+        product_id : `str | None`, optional
+            Product of the orders. By default all products.
+        variant_id : `str | None`, optional
+            Variant of the orders. By default all variants.
+        statuses : `Iterable[str | Enum] | None`, optional
+            Statuses of the orders. By default all statuses except the
+            `FAILED_STATUSES`.
+        days : `int`, default 30
+            Length of the window, at most `horizon`.
+        until : `date | datetime | None`, optional
+            Last day of the window. By default the current day.
+
+        Returns
+        -------
+        `SalesStats`
+            Aggregated values of the orders.
+        """
+        if not 1 <= days <= self.horizon:
+            raise ValueError(f'Window must be between 1 and {self.horizon} days.')
+        if until is None:
+            until = datetime.now(timezone.utc)
+        if isinstance(until, datetime):
+            until = until.date()
+        if statuses is not None:
+            statuses = {
+                status.value if isinstance(status, Enum) else status
+                for status in statuses
+            }
+
+        if product_id is None:
+            keys = self._buckets.keys()
+        else:
+            keys = self._variants.get(product_id, ())
+
+        last_day = until.toordinal()
+        first_day = last_day - days + 1
+        totals = [0.0] * len(FIELDS)
+        for key in keys:
+            _, key_variant_id, status = key
+            if variant_id is not None and key_variant_id != variant_id:
+                continue
+            if statuses is None:
+                if status in FAILED_STATUSES:
+                    continue
+            elif status not in statuses:
+                continue
+            self._buckets[key].sum(first_day, last_day, totals)
+
+        count, *sums = totals
+        return SalesStats(days, round(count), *sums)
+
+    def velocity(
+            self,
+            product_id: str,
+            variant_id: str | None = None,
+            days: int = 30,
+    ) -> float:
+        """Get the sales per day of a product or variant."""
+        return self.stats(product_id, variant_id, days=days).velocity
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the aggregated orders to a JSON file, by default to `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to save the sales aggregates to.')
+
+        data = {
+            'version': FORMAT_VERSION,
+            'horizon': self.horizon,
+            'orders': [
+                [number, *key, day, *values]
+                for number, (key, day, values) in self._orders.items()
+            ],
+        }
+        temporary = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        temporary.replace(path)
+
+    def load(self, path: str | os.PathLike | None = None) -> None:
+        """Read aggregated orders from a JSON file, by default from `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to load the sales aggregates from.')
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != FORMAT_VERSION:
+            logger.warning(f'Ignoring sales aggregates with unknown format: {path}')
+            return
+        for number, product_id, variant_id, status, day, *values in data['orders']:
+            self._add(number, (product_id, variant_id, status), day, tuple(values))
+
+    def _add(
+            self,
+            number: str,
+            key: Key,
+            day: int,
+            values: tuple[float, ...],
+    ) -> None:
+        if day <= self._newest - self.horizon:
+            return
+
+        previous = self._orders.pop(number, None)
+        if previous is not None:
+            previous_key, previous_day, previous_values = previous
+            self._buckets[previous_key].add(previous_day, previous_values, sign=-1)
+            self._discard_empty(previous_key)
+            self._days[previous_day].discard(number)
+
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = _Buckets()
+            self._variants.setdefault(key[0], set()).add(key)
+        buckets.add(day, values)
+        self._orders[number] = key, day, values
+
+        numbers = self._days.get(day)
+        if numbers is None:
+            numbers = self._days[day] = set()
+            heapq.heappush(self._day_heap, day)
+        numbers.add(number)
+
+        if day > self._newest:
+            self._newest = day
+            self._evict(day - self.horizon)
+
+    def _evict(self, last_day: int) -> None:
+        """Drop the orders of the days up to `last_day`."""
+        while self._day_heap and self._day_heap[0] <= last_day:
+            day = heapq.heappop(self._day_heap)
+            keys = {
+                self._orders.pop(number)[0]
+                for number in self._days.pop(day, ())
+            }
+            for key in keys:
+                buckets = self._buckets.get(key)
+                if buckets is not None:
+                    buckets.days.pop(day, None)
+                    self._discard_empty(key)
+
+    def _discard_empty(self, key: Key) -> None:
+        """Drop the buckets of `key` if no order is left in them."""
+        if not self._buckets[key]:
+            del self._buckets[key]
+            self._variants[key[0]].discard(key)
+
+
+def _values(order: Order) -> tuple[float, ...]:
+    """Get the aggregated values of an order, in `FIELDS` order."""
+    payout = order.payout
+    if payout is None:
+        return 1.0, order.amount, 0.0, 0.0, 0.0, 0.0
+    return (
+        1.0,
+        order.amount,
+        payout.total_payout,
+        _adjustment(payout, 'Transaction Fee'),
+        _adjustment(payout, 'Payment Proc'),
+        _adjustment(payout, 'Shipping'),
+    )
+
+
+def _adjustment(payout: Payout, adjustment_type: str) -> float:
+    """Sum the adjustment amounts of a type, matched like `Payout` fees."""
+    return sum(
+        fee.amount for fee in payout.adjustments
+        if adjustment_type in fee.adjustment_type
+    )
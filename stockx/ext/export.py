@@ -0,0 +1,329 @@
+"""
+Stream paginated endpoints to NDJSON, CSV or Parquet files.
+
+Records are flattened into columns named by their dotted path (e.g.
+`product.style_id`) and written in chunks, so exports of whole histories
+run in constant memory. Lists of nested models (e.g. `payout.adjustments`)
+are written as JSON text. Parquet requires pyarrow
+(`pip install python-stockx[parquet]`).
+
+Examples
+--------
+>>> await export(
+...     stockx.orders.get_orders_history(page_size=100, prefetch=True),
+...     'orders.parquet',
+...     columns=['order_number', 'amount', 'product.style_id', 'created_at'],
+... )
+"""
+
+from __future__ import annotations
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, Callable, Iterable, Sequence
+from dataclasses import is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from types import UnionType
+from typing import IO, Any, get_args, get_origin
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from ..format import jsonable
+from ..logs import logger
+from ..models.base import StockXBaseModel
+
+
+__all__ = (
+    'FORMATS',
+    'export',
+    'flatten',
+    'model_columns',
+)
+
+
+FORMATS = ('ndjson', 'csv', 'parquet')
+
+SUFFIXES = {
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+}
+
+Row = dict[str, Any]
+
+
+def model_columns(model: type[StockXBaseModel]) -> dict[str, Any]:
+    """
+    Get the flattened columns of a model and their type hints.
+
+    Nested models are expanded into dotted columns (e.g. `product.style_id`),
+    while lists are kept as single columns.
+    """
+    columns = {}
+    for name, type_hint in model.annotations().items():
+        if name not in model.__match_args__:
+            continue
+        nested = _nested_model(type_hint)
+        if nested is None:
+            columns[name] = type_hint
+        else:
+            for column, nested_hint in model_columns(nested).items():
+                columns[f'{name}.{column}'] = nested_hint
+    return columns
+
+
+def flatten(record: Any, columns: Iterable[str]) -> Row:
+    """Extract the values of dotted columns from a record."""
+    return {column: _value(_get(record, column)) for column in columns}
+
+
+async def export(
+        records: AsyncIterable[StockXBaseModel] | Iterable[StockXBaseModel],
+        path: str | os.PathLike,
+        format: str | None = None,
+        columns: Sequence[str] | None = None,
+        chunk_size: int = 1000,
+        rows_per_file: int | None = None,
+) -> int:
+    """
+    Stream records to NDJSON, CSV or Parquet files.
+
+    Parameters
+    ----------
+    records : `AsyncIterable[StockXBaseModel] | Iterable[StockXBaseModel]`
+        Records to export, e.g. `stockx.listings.get_all_listings(...)`.
+    path : `str | os.PathLike`
+        File to write. With `rows_per_file`, files are numbered after
+        the file name, e.g. `orders-00000.csv`.
+    format : `str | None`, optional
+        One of `'ndjson'`, `'csv'` or `'parquet'`. Inferred from the file
+        suffix by default.
+    columns : `Sequence[str] | None`, optional
+        Dotted columns to export, in order. By default all the columns of
+        the first record model (see `model_columns`).
+    chunk_size : `int`, default 1000
+        Rows buffered before each write (row group for Parquet).
+    rows_per_file : `int | None`, optional
+        Maximum rows per file. By default a single file is written. No
+        file is written if there are no records.
+
+    Returns
+    -------
+    `int`
+        Number of exported rows.
+
+    Raises
+    ------
+    `ValueError`
+        If the format is unknown.
+    `ImportError`
+        If the format is Parquet and pyarrow is not installed.
+    """
+    path = Path(path)
+    format = format or SUFFIXES.get(path.suffix.lower())
+    if format not in FORMATS:
+        raise ValueError(f'Unknown export format for {path}: {format}')
+    if format == 'parquet' and pa is None:
+        raise ImportError(
+            'Parquet export requires pyarrow: '
+            'pip install python-stockx[parquet]'
+        )
+
+    writer: _Writer | None = None
+    hints: dict[str, Any] | None = None
+    chunk: list[Row] = []
+    count = 0
+    file_number = 0
+    file_rows = 0
+
+    def flush() -> None:
+        nonlocal writer, file_number, file_rows
+        start = 0
+        while start < len(chunk):
+            if writer is None:
+                file_path = _numbered(path, file_number) if rows_per_file else path
+                writer = WRITERS[format](file_path, columns, hints)
+
+            stop = len(chunk)
+            if rows_per_file:
+                stop = min(stop, start + rows_per_file - file_rows)
+            writer.write(chunk[start:stop])
+            file_rows += stop - start
+            start = stop
+
+            if rows_per_file and file_rows >= rows_per_file:
+                writer.close()
+                writer = None
+                file_number += 1
+                file_rows = 0
+        chunk.clear()
+
+    try:
+        async for record in _aiter(records):
+            if hints is None:
+                model_hints = model_columns(type(record))
+                columns = list(columns or model_hints)
+                hints = {column: model_hints.get(column) for column in columns}
+
+            chunk.append(flatten(record, columns))
+            count += 1
+            if len(chunk) >= chunk_size:
+                flush()
+        flush()
+    finally:
+        if writer is not None:
+            writer.close()
+
+    logger.info(f'Exported {count} rows to {path}.')
+    return count
+
+
+class _Writer(ABC):
+    """Writes chunks of rows to a file."""
+
+    def __init__(
+            self,
+            path: Path,
+            columns: Sequence[str],
+            hints: dict[str, Any],
+    ) -> None:
+        self.path = path
+        self.columns = columns
+        self.hints = hints
+
+    @abstractmethod
+    def write(self, rows: list[Row]) -> None:
+        """Write a chunk of rows."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _NDJSONWriter(_Writer):
+    def __init__(self, path, columns, hints) -> None:
+        super().__init__(path, columns, hints)
+        self._file: IO[str] = path.open('w', encoding='utf-8')
+
+    def write(self, rows: list[Row]) -> None:
+        self._file.writelines(
+            json.dumps(row, default=_text) + '\n' for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CSVWriter(_Writer):
+    def __init__(self, path, columns, hints) -> None:
+        super().__init__(path, columns, hints)
+        self._file: IO[str] = path.open('w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write(self, rows: list[Row]) -> None:
+        self._writer.writerows(
+            [_text(row[column]) for column in self.columns] for row in rows
+        )
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, path, columns, hints) -> None:
+        super().__init__(path, columns, hints)
+        self.schema = pa.schema([
+            (column, _arrow_type(hints.get(column))) for column in columns
+        ])
+        self._writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows: list[Row]) -> None:
+        table = pa.Table.from_pylist(rows, schema=self.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+WRITERS: dict[str, Callable[..., _Writer]] = {
+    'ndjson': _NDJSONWriter,
+    'csv': _CSVWriter,
+    'parquet': _ParquetWriter,
+}
+
+
+async def _aiter(records: AsyncIterable | Iterable):
+    if isinstance(records, AsyncIterable):
+        async for record in records:
+            yield record
+    else:
+        for record in records:
+            yield record
+
+
+def _nested_model(type_hint: Any) -> type[StockXBaseModel] | None:
+    """Get the model of a (possibly optional) nested model type hint."""
+    if get_origin(type_hint) is UnionType:
+        types = [t for t in get_args(type_hint) if t is not type(None)]
+        if len(types) != 1:
+            return None
+        type_hint = types[0]
+    if isinstance(type_hint, type) and issubclass(type_hint, StockXBaseModel):
+        return type_hint
+    return None
+
+
+def _get(record: Any, column: str) -> Any:
+    value = record
+    for name in column.split('.'):
+        value = getattr(value, name, None)
+        if value is None:
+            return None
+    return value
+
+
+def _value(value: Any) -> Any:
+    """Convert a value to a scalar column value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, list | tuple | dict) or is_dataclass(value):
+        return json.dumps(jsonable(value))
+    return value
+
+
+def _text(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _arrow_type(type_hint: Any) -> pa.DataType:
+    """Get the Parquet column type of a model type hint."""
+    if get_origin(type_hint) is UnionType:
+        types = {t for t in get_args(type_hint) if t is not type(None)}
+        if len(types) == 1:
+            return _arrow_type(types.pop())
+        return pa.string()
+
+    if type_hint is bool:
+        return pa.bool_()
+    if type_hint is int:
+        return pa.int64()
+    if type_hint is float:
+        return pa.float64()
+    if type_hint is datetime:
+        return pa.timestamp('us', tz='UTC')
+    return pa.string()
+
+
+def _numbered(path: Path, number: int) -> Path:
+    return path.with_name(f'{path.stem}-{number:05}{path.suffix}')
@@ -0,0 +1,263 @@
+"""
+Partitioned scans of large order histories.
+
+The order history endpoint pages through a date range serially, so a scan
+of years of orders is bound by one chain of requests. The scanner splits
+the range into date windows sized from the order density observed so far,
+and scans them concurrently; all requests still go through the client
+throttle, so a backfill is bound by the rate limit instead.
+
+Examples
+--------
+>>> scanner = HistoryScanner(stockx, concurrency=4)
+>>> async for order in scanner.scan(from_date=datetime(2022, 1, 1)):
+...     print(order.number, order.created_at)
+"""
+
+from __future__ import annotations
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from ..api import StockX
+from ..format import pretty_str
+from ..logs import logger
+from ..models import Order, OrderStatusClosed
+
+
+__all__ = (
+    'HistoryScanner',
+    'HistoryWindow',
+)
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class HistoryWindow:
+    """
+    Date window of an order history scan.
+
+    History dates have no time, so consecutive windows share their
+    boundary day and the orders of that day are deduplicated.
+
+    Parameters
+    ----------
+    index : `int`
+        Position of the window in the scanned range.
+    from_date : `datetime`
+        First day of the window.
+    to_date : `datetime`
+        Last day of the window.
+    """
+    index: int
+    from_date: datetime
+    to_date: datetime
+
+    @property
+    def days(self) -> int:
+        """Number of days of the window, both ends included."""
+        return (self.to_date.date() - self.from_date.date()).days + 1
+
+
+class HistoryScanner:
+    """
+    Concurrent scanner of the order history, partitioned by date windows.
+
+    The first windows have the initial `window` size; the following ones
+    are resized so that each takes about `pages_per_window` pages, given
+    the orders per day of the windows scanned so far. Windows are scanned
+    by up to `concurrency` workers and their orders merged, deduplicated
+    by order number. The observed density carries over to later scans.
+
+    Parameters
+    ----------
+    stockx : `StockX`
+        The StockX API interface instance.
+    window : `timedelta`, default 30 days
+        Size of the windows scanned before any order density is observed.
+    pages_per_window : `int`, default 5
+        Target number of pages of a window.
+    page_size : `int`, default 100
+        Orders requested per page.
+    concurrency : `int`, default 4
+        Maximum number of windows scanned at a time.
+    min_window : `timedelta`, default 1 day
+        Smallest window size.
+    max_window : `timedelta`, default 365 days
+        Largest window size.
+    """
+
+    __slots__ = (
+        '_days',
+        '_orders',
+        'concurrency',
+        'max_window',
+        'min_window',
+        'page_size',
+        'pages_per_window',
+        'stockx',
+        'window',
+    )
+
+    def __init__(
+            self,
+            stockx: StockX,
+            window: timedelta = timedelta(days=30),
+            pages_per_window: int = 5,
+            page_size: int = 100,
+            concurrency: int = 4,
+            min_window: timedelta = timedelta(days=1),
+            max_window: timedelta = timedelta(days=365),
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError('Concurrency must be at least 1.')
+        self.stockx = stockx
+        self.window = window
+        self.pages_per_window = pages_per_window
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.min_window = min_window
+        self.max_window = max_window
+        # Days and orders of the scanned windows, for window sizing
+        self._days = 0
+        self._orders = 0
+
+    def next_window_size(self) -> timedelta:
+        """Get the size of the next window from the observed order density."""
+        if not self._orders:
+            # Empty so far, so double the scanned span
+            size = timedelta(days=2 * self._days) if self._days else self.window
+        else:
+            orders_per_day = self._orders / self._days
+            target = self.pages_per_window * self.page_size
+            size = timedelta(days=round(target / orders_per_day))
+        return min(max(size, self.min_window), self.max_window)
+
+    async def scan(
+            self,
+            from_date: datetime,
+            to_date: datetime | None = None,
+            ordered: bool = True,
+            order_status: OrderStatusClosed | None = None,
+            product_id: str | None = None,
+            variant_id: str | None = None,
+    ) -> AsyncIterator[Order]:
+        """
+        Scan the order history between two dates.
+
+        Parameters
+        ----------
+        from_date : `datetime`
+            Start of the scanned range.
+        to_date : `datetime | None`, optional
+            End of the scanned range. By default the current date, in the
+            time zone of `from_date`.
+        ordered : `bool`, default True
+            If `True`, orders are yielded window by window in date order,
+            holding the windows that complete before previous ones. If
+            `False`, the orders of each window are yielded as soon as it
+            completes.
+        order_status : `OrderStatusClosed | None`, optional
+            Filter orders by status.
+        product_id : `str | None`, optional
+            Filter orders by product.
+        variant_id : `str | None`, optional
+            Filter orders by variant.
+
+        Yields
+        ------
+        `Order`
+            Orders of the history, each one once.
+        """
+        # Naive or aware like from_date, to compare them
+        to_date = to_date or datetime.now(from_date.tzinfo)
+        filters = {
+            'order_status': order_status,
+            'product_id': product_id,
+            'variant_id': variant_id,
+        }
+        windows = self._windows(from_date, to_date)
+        completed: asyncio.Queue[
+            tuple[HistoryWindow, list[Order]] | BaseException | None
+        ] = asyncio.Queue()
+
+        async def worker() -> None:
+            try:
+                for window in windows:
+                    orders = [
+                        order async for order in
+                        self.stockx.orders.get_orders_history(
+                            from_date=window.from_date,
+                            to_date=window.to_date,
+                            page_size=self.page_size,
+                            prefetch=True,
+                            **filters,
+                        )
+                    ]
+                    self._days += window.days
+                    self._orders += len(orders)
+                    completed.put_nowait((window, orders))
+            except Exception as e:
+                completed.put_nowait(e)
+            finally:
+                completed.put_nowait(None)
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(self.concurrency)
+        ]
+        seen: set[str] = set()
+        held: dict[int, list[Order]] = {}
+        next_index = 0
+        running = len(workers)
+        scanned = 0
+
+        try:
+            while running:
+                outcome = await completed.get()
+                if outcome is None:
+                    running -= 1
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+                window, orders = outcome
+                scanned += 1
+                if ordered:
+                    held[window.index] = orders
+                    batches = []
+                    while next_index in held:
+                        batches.append(held.pop(next_index))
+                        next_index += 1
+                else:
+                    batches = [orders]
+
+                for batch in batches:
+                    for order in batch:
+                        if order.number not in seen:
+                            seen.add(order.number)
+                            yield order
+        finally:
+            for task in workers:
+                task.cancel()
+
+        logger.info(
+            f'Scanned order history in {scanned} windows: '
+            f'{len(seen)} orders.'
+        )
+
+    def _windows(
+            self,
+            from_date: datetime,
+            to_date: datetime,
+    ) -> Iterator[HistoryWindow]:
+        """Yield windows covering the range, sized when requested."""
+        start = from_date
+        index = 0
+        while True:
+            end = min(start + self.next_window_size(), to_date)
+            yield HistoryWindow(index, start, end)
+            if end >= to_date:
+                return
+            start = end
+            index += 1
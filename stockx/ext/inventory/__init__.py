@@ -60,21 +60,42 @@ Using async functions:
 """
 
 from .batch.results import ErrorDetail, UpdateResult
+from .batch.sizing import BatchSizeController
+from .index import InventoryIndex
 from .inventory import Amount, Condition, Inventory
-from .item import Item, ListedItem
-from .market import ItemMarketData, MarketValue
-from .query import ItemsQuery
+from .item import Item, ListedItem, SkuSizeRow
+from .journal import Journal
+from .market import ItemMarketData, MarketSnapshot, MarketValue
+from .pricing import Fees, PricingInputs, PricingResult
+from .query import AccessPath, ItemsQuery, QueryPlan, QueryStats
+from .reconcile import BatchReconciler, Reconciliation
+from .simulation import SimulatedPrice, SimulationReport
 
 
 __all__ = (
+    'AccessPath',
     'Amount',
+    'BatchReconciler',
+    'BatchSizeController',
     'Condition',
     'ErrorDetail',
+    'Fees',
     'Inventory',
+    'InventoryIndex',
     'Item',
     'ItemMarketData',
     'ItemsQuery',
+    'Journal',
     'ListedItem', 
+    'MarketSnapshot',
     'MarketValue',
+    'PricingInputs',
+    'PricingResult',
+    'QueryPlan',
+    'QueryStats',
+    'Reconciliation',
+    'SimulatedPrice',
+    'SimulationReport',
+    'SkuSizeRow',
     'UpdateResult',
 )
@@ -1,7 +1,7 @@
 from collections.abc import Iterable, Iterator
 from datetime import datetime
-from itertools import batched
 
+from .sizing import BatchSizeController, chunked
 from ..item import Item, ListedItem
 from ....models import (
     BatchCreateInput, 
@@ -14,7 +14,7 @@ from ....processing import group_and_sum
 def create_listings_inputs(
         items: Iterable[Item], 
         currency: Currency, 
-        batch_size: int
+        batch_size: int | BatchSizeController
 ) -> Iterator[tuple[BatchCreateInput, ...]]:
     """Create batch input items for creating new listings.
 
@@ -27,26 +27,26 @@ def create_listings_inputs(
     )
     inputs = [
         BatchCreateInput(
-            variant_id=item.variant_id, 
-            amount=item.price, 
-            quantity=item.quantity,
+            variant_id=group.variant_id, 
+            amount=group.price, 
+            quantity=group.quantity,
             active=True,
             currency_code=currency
-        ) for item in grouped_items
+        ) for group in grouped_items
     ]
-    return batched(inputs, batch_size)
+    return chunked(inputs, batch_size)
 
 
 def sync_listings_inputs(
         items: Iterable[ListedItem], 
         currency: Currency,
-        batch_size: int
+        batch_size: int | BatchSizeController
 ) -> Iterator[tuple[BatchCreateInput, ...]]:
     """Create batch input items for syncing listing quantities.
 
     Groups items by variant ID and price to minimize API calls.
-    Uses `ListedItem.quantity_to_sync()` to determine how many 
-    listings to create.
+    The quantity to sync of a group (see `ListedItem.quantity_to_sync()`)
+    determines how many listings to create.
     """
     grouped_items = group_and_sum(
         items, 
@@ -55,21 +55,24 @@ def sync_listings_inputs(
     )
     inputs = [
         BatchCreateInput(
-            variant_id=item.variant_id, 
-            amount=item.price, 
-            quantity=item.quantity_to_sync(),
+            variant_id=group.variant_id, 
+            amount=group.price, 
+            quantity=group.quantity - len(group.listing_ids),
             currency_code=currency
-        ) for item in grouped_items
+        ) for group in grouped_items
     ]
-    return batched(inputs, batch_size)
+    return chunked(inputs, batch_size)
 
 
 def update_listings_inputs(
         items: Iterable[ListedItem], 
-        batch_size: int
+        batch_size: int | BatchSizeController
 ) -> Iterator[tuple[BatchUpdateInput, ...]]:
-    """Create batch input items for updating existing listings."""
-    inputs = [
+    """Create batch input items for updating existing listings.
+    
+    Inputs are generated lazily as batches are consumed.
+    """
+    inputs = (
         BatchUpdateInput(
             listing_id=listing_id,
             amount=item.price,
@@ -77,13 +80,13 @@ def update_listings_inputs(
         )
         for item in items
         for listing_id in item.listing_ids
-    ]
-    return batched(inputs, batch_size)
+    )
+    return chunked(inputs, batch_size)
 
 
 def delete_listings_inputs(
         listing_ids: Iterable[str], 
-        batch_size: int
+        batch_size: int | BatchSizeController
 ) -> Iterator[tuple[str, ...]]:
     """Create batched inputs for deleting listings."""
-    return batched(listing_ids, batch_size)
+    return chunked(listing_ids, batch_size)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
+import asyncio
+from collections.abc import (
+    AsyncIterator, 
+    Awaitable, 
+    Callable, 
+    Iterable,
+)
 from itertools import chain
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from .inputs import (
     create_listings_inputs,
@@ -11,10 +17,20 @@ from .inputs import (
     sync_listings_inputs,
 )
 from .results import UpdateResult
+from .sizing import (
+    MAX_BATCH_SIZE,
+    BatchSizeController, 
+    batch_size_controller,
+)
 from ..item import Item, ListedItem
 from ....api import StockX
-from ....errors import StockXBatchTimeout, StockXIncompleteOperation
-from ....models import BatchItemStatus
+from ....api.batch import batch_results
+from ....errors import (
+    StockXBatchTimeout, 
+    StockXIncompleteOperation, 
+    StockXRequestTooLarge,
+)
+from ....models import BatchOperationType
 
 if TYPE_CHECKING:
     from ....models import (
@@ -22,13 +38,24 @@ if TYPE_CHECKING:
         BatchCreateResult,
         BatchUpdateResult,
         BatchDeleteResult,
+        BatchStatus,
         Currency,
     )
 
 
+MAX_SUBMISSIONS_IN_FLIGHT = 4
+
+C = TypeVar('C', bound=tuple)
+R = TypeVar('R')
+
+BatchSize = int | BatchSizeController
+
+
 async def update_quantity(
         stockx: StockX, 
         items: Iterable[ListedItem],
+        timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> list[UpdateResult]:
     """Update listing quantities by creating or deleting listings as needed.
     
@@ -38,6 +65,10 @@ async def update_quantity(
         StockX API interface
     items : `Iterable[ListedItem]`
         Items whose quantities need to be updated
+    timeout : `int`, default 60
+        Maximum time to wait for batch operations to complete
+    batch_size : `int | BatchSizeController`, default 100
+        Number of items per batch or controller adapting it
         
     Returns
     -------
@@ -47,8 +78,9 @@ async def update_quantity(
     Raises
     ------
     `StockXIncompleteOperation`
-        If some batch operations timeout. The exception contains partial 
-        results for operations that completed successfully.
+        If some batch operations timeout or fail to be submitted. The 
+        exception contains partial results for operations that completed 
+        successfully.
     """
     decrease = {item for item in items if item.quantity_to_sync() < 0}
     increase = {item for item in items if item.quantity_to_sync() > 0}
@@ -57,23 +89,30 @@ async def update_quantity(
     delete_ids = (item.listing_ids[item.quantity_to_sync():] for item in decrease)
 
     timed_out_batch_ids = []  # Incomplete batch IDS
+    batch_operations = {}
 
     try:
         deleted_results = await delete_listings(
             stockx=stockx, 
-            listing_ids=chain.from_iterable(delete_ids)
+            listing_ids=chain.from_iterable(delete_ids),
+            timeout=timeout,
+            batch_size=batch_size,
         )
     except StockXIncompleteOperation as e:
         timed_out_batch_ids += e.timed_out_batch_ids
+        batch_operations |= e.batch_operations
         deleted_results = e.partial_results
 
     try:
         increased_results = await increase_listings(
             stockx=stockx, 
-            items=increase
+            items=increase,
+            timeout=timeout,
+            batch_size=batch_size,
         )
     except StockXIncompleteOperation as e:
         timed_out_batch_ids += e.timed_out_batch_ids
+        batch_operations |= e.batch_operations
         increased_results = e.partial_results
 
     # Convert to sets for faster lookup
@@ -112,7 +151,8 @@ async def update_quantity(
         raise StockXIncompleteOperation(
             'Update quantity operation timed out. Partial results available.', 
             partial_results=results, 
-            timed_out_batch_ids=timed_out_batch_ids
+            timed_out_batch_ids=timed_out_batch_ids,
+            batch_operations=batch_operations,
         )
 
     return results
@@ -124,22 +164,26 @@ async def _create_listings(
         inputs_factory: Callable[..., Iterable[Iterable[BatchCreateInput]]],
         currency: Currency | None = None,
         timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> list[UpdateResult]:
     """Create listings in batches using the provided inputs factory."""
+    items = list(items)
     if items and not currency:
-        currency = list(items)[0].currency
+        currency = items[0].currency
 
-    batch_ids = []
-    for inputs in inputs_factory(items, currency, 100):
-        batch_status = await stockx.batch.create_listings(inputs)
-        batch_ids.append(batch_status.batch_id)
+    submission = _Submission(batch_size, BatchOperationType.CREATE)
+    batch_ids = submission.submit(
+        chunks=inputs_factory(items, currency, submission.controller),
+        submit=stockx.batch.create_listings,
+    )
 
     try:            
         create_results = await _batch_results(
             stockx=stockx, 
             batch_ids=batch_ids, 
             func=publish_listings, 
-            timeout=timeout
+            timeout=timeout,
+            submission=submission,
         )
         results = UpdateResult.from_batch_create(items, create_results)
         return list(results)
@@ -151,7 +195,10 @@ async def _create_listings(
         raise StockXIncompleteOperation(
             'Batch create operation timed out. Partial results available.', 
             partial_results=list(partial_results), 
-            timed_out_batch_ids=e.queued_batch_ids
+            timed_out_batch_ids=e.queued_batch_ids,
+            batch_operations=dict.fromkeys(
+                e.queued_batch_ids, BatchOperationType.CREATE
+            ),
         )
     
 
@@ -159,13 +206,15 @@ async def increase_listings(
         stockx: StockX,
         items: Iterable[ListedItem],
         timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> list[UpdateResult]:
     """Bulk create additional listings for items that need increased quantity."""
     return await _create_listings(
         stockx=stockx, 
         items=items, 
         inputs_factory=sync_listings_inputs, 
-        timeout=timeout
+        timeout=timeout,
+        batch_size=batch_size,
     )
 
 
@@ -174,6 +223,7 @@ async def publish_listings(
         items: Iterable[Item],
         currency: Currency,
         timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> list[UpdateResult]:
     """Bulk create new listings for items that haven't been listed yet.
     
@@ -187,6 +237,8 @@ async def publish_listings(
         Currency to publish listings in
     timeout : `int`, default 60
         Maximum time to wait for batch operations to complete
+    batch_size : `int | BatchSizeController`, default 100
+        Number of items per batch or controller adapting it
         
     Returns
     -------
@@ -196,15 +248,17 @@ async def publish_listings(
     Raises
     ------
     `StockXIncompleteOperation`
-        If some batch operations timeout. The exception contains partial 
-        results for operations that completed successfully.
+        If some batch operations timeout or fail to be submitted. The 
+        exception contains partial results for operations that completed 
+        successfully.
     """
     return await _create_listings(
         stockx=stockx, 
         items=items, 
         inputs_factory=create_listings_inputs, 
         currency=currency,
-        timeout=timeout
+        timeout=timeout,
+        batch_size=batch_size,
     )
 
 
@@ -212,6 +266,7 @@ async def update_listings(
         stockx: StockX,
         items: Iterable[ListedItem],
         timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> list[UpdateResult]:
     """Bulk update existing listings with new prices.
     
@@ -223,6 +278,8 @@ async def update_listings(
         Items whose listings need price updates
     timeout : `int`, default 60
         Maximum time to wait for batch operations to complete
+    batch_size : `int | BatchSizeController`, default 100
+        Number of items per batch or controller adapting it
         
     Returns
     -------
@@ -232,20 +289,24 @@ async def update_listings(
     Raises
     ------
     `StockXIncompleteOperation`
-        If some batch operations timeout. The exception contains partial 
-        results for operations that completed successfully.
+        If some batch operations timeout or fail to be submitted. The 
+        exception contains partial results for operations that completed 
+        successfully.
     """
-    batch_ids = []
-    for inputs in update_listings_inputs(items, 100):
-        batch_status = await stockx.batch.update_listings(inputs)
-        batch_ids.append(batch_status.batch_id)
+    items = list(items)
+    submission = _Submission(batch_size, BatchOperationType.UPDATE)
+    batch_ids = submission.submit(
+        chunks=update_listings_inputs(items, submission.controller),
+        submit=stockx.batch.update_listings,
+    )
 
     try:
         update_results = await _batch_results(
             stockx=stockx, 
             batch_ids=batch_ids, 
             func=update_listings, 
-            timeout=timeout
+            timeout=timeout,
+            submission=submission,
         )
         results = UpdateResult.from_batch_update(items, update_results)
         return list(results)
@@ -257,7 +318,10 @@ async def update_listings(
         raise StockXIncompleteOperation(
             'Batch update operation timed out. Partial results available.', 
             partial_results=list(partial_results), 
-            timed_out_batch_ids=e.queued_batch_ids
+            timed_out_batch_ids=e.queued_batch_ids,
+            batch_operations=dict.fromkeys(
+                e.queued_batch_ids, BatchOperationType.UPDATE
+            ),
         )
 
 
@@ -265,6 +329,7 @@ async def delete_listings(
         stockx: StockX,
         listing_ids: Iterable[str],
         timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
 ) -> UpdateResult:
     """Bulk delete existing listings.
     
@@ -276,6 +341,8 @@ async def delete_listings(
         IDs of listings to delete
     timeout : `int`, default 60
         Maximum time to wait for batch operations to complete
+    batch_size : `int | BatchSizeController`, default 100
+        Number of items per batch or controller adapting it
         
     Returns
     -------
@@ -285,20 +352,23 @@ async def delete_listings(
     Raises
     ------
     StockXIncompleteOperation
-        If some batch operations timeout. The exception contains partial 
-        results for operations that completed successfully.
+        If some batch operations timeout or fail to be submitted. The 
+        exception contains partial results for operations that completed 
+        successfully.
     """
-    batch_ids = []
-    for inputs in delete_listings_inputs(listing_ids, 100):
-        batch_status = await stockx.batch.delete_listings(inputs)
-        batch_ids.append(batch_status.batch_id)
+    submission = _Submission(batch_size, BatchOperationType.DELETE)
+    batch_ids = submission.submit(
+        chunks=delete_listings_inputs(listing_ids, submission.controller),
+        submit=stockx.batch.delete_listings,
+    )
 
     try:
         delete_results = await _batch_results(
             stockx=stockx, 
             batch_ids=batch_ids, 
             func=delete_listings, 
-            timeout=timeout
+            timeout=timeout,
+            submission=submission,
         )
         return UpdateResult.from_batch_delete(delete_results)
     except StockXBatchTimeout as e:
@@ -308,49 +378,294 @@ async def delete_listings(
         raise StockXIncompleteOperation(
             'Batch delete operation timed out. Partial results available.', 
             partial_results=[partial_results], 
-            timed_out_batch_ids=e.queued_batch_ids
+            timed_out_batch_ids=e.queued_batch_ids,
+            batch_operations=dict.fromkeys(
+                e.queued_batch_ids, BatchOperationType.DELETE
+            ),
+        )
+
+
+async def stream_update_listings(
+        stockx: StockX,
+        items: Iterable[ListedItem],
+        timeout: int = 60,
+        batch_size: BatchSize = MAX_BATCH_SIZE,
+) -> AsyncIterator[UpdateResult]:
+    """Bulk update existing listings with new prices, streaming results.
+
+    An `UpdateResult` is yielded as soon as all the listings of an item
+    have been processed, without waiting for the remaining batches.
+    
+    Parameters
+    ----------
+    stockx : `StockX`
+        StockX API interface
+    items : `Iterable[ListedItem]`
+        Items whose listings need price updates
+    timeout : `int`, default 60
+        Maximum time to wait for batch operations to complete
+    batch_size : `int | BatchSizeController`, default 100
+        Number of items per batch or controller adapting it
+        
+    Yields
+    ------
+    `UpdateResult`
+        Result of the update operation for an item
+        
+    Raises
+    ------
+    `StockXIncompleteOperation`
+        If some batch operations timeout or fail to be submitted. The 
+        exception contains partial results for the items that were not 
+        yielded yet.
+    """
+    items = list(items)
+    submission = _Submission(batch_size, BatchOperationType.UPDATE)
+    batch_ids = submission.submit(
+        chunks=update_listings_inputs(items, submission.controller),
+        submit=stockx.batch.update_listings,
+    )
+
+    owners = {
+        listing_id: item 
+        for item in items 
+        for listing_id in item.listing_ids
+    }
+    pending: dict[ListedItem, list[BatchUpdateResult]] = {
+        item: [] for item in items if item.listing_ids
+    }
+
+    try:
+        async for result in batch_results(
+            batch_ids, 
+            stockx.batch.update_listings_status, 
+            submission.observe(stockx.batch.update_listings_items), 
+            timeout
+        ):
+            item = owners.get(result.listing_input.listing_id)
+            if item not in pending:
+                continue
+            pending[item].append(result)
+            if len(pending[item]) == len(item.listing_ids):
+                yield _item_update_result(item, pending.pop(item))
+    except StockXBatchTimeout as e:
+        for result in e.partial_batch_results:
+            item = owners.get(result.listing_input.listing_id)
+            if item in pending:
+                pending[item].append(result)
+        raise StockXIncompleteOperation(
+            'Batch update operation timed out. Partial results available.', 
+            partial_results=[
+                _item_update_result(item, results)
+                for item, results in pending.items()
+            ], 
+            timed_out_batch_ids=e.queued_batch_ids,
+            batch_operations=dict.fromkeys(
+                e.queued_batch_ids, BatchOperationType.UPDATE
+            ),
         )
+    except StockXIncompleteOperation as e:
+        # Submission failed
+        raise StockXIncompleteOperation(
+            e.message, 
+            partial_results=[
+                _item_update_result(item, results)
+                for item, results in pending.items()
+            ], 
+            timed_out_batch_ids=e.timed_out_batch_ids,
+            batch_operations=e.batch_operations,
+        ) from e
+
+
+def _item_update_result(
+        item: ListedItem,
+        results: Iterable[BatchUpdateResult],
+) -> UpdateResult:
+    """Create the update result of a single item."""
+    return next(UpdateResult.from_batch_update([item], results))
+
+
+class _Submission:
+    """Submits batch operations and tracks them for the batch size controller.
+
+    Parameters
+    ----------
+    batch_size : `int | BatchSizeController`
+        Number of items per batch or controller adapting it.
+    operation : `BatchOperationType`
+        Operation of the submitted batches.
+    max_in_flight : `int`, default 4
+        Maximum number of pending submissions.
+    """
+
+    __slots__ = '_batches', 'controller', 'max_in_flight', 'operation'
+
+    def __init__(
+            self, 
+            batch_size: BatchSize, 
+            operation: BatchOperationType,
+            max_in_flight: int = MAX_SUBMISSIONS_IN_FLIGHT,
+    ) -> None:
+        self.controller = batch_size_controller(batch_size)
+        self.operation = operation
+        self.max_in_flight = max_in_flight
+        self._batches: dict[str, tuple[float, int]] = {}
+
+    async def submit(
+            self,
+            chunks: Iterable[C],
+            submit: Callable[[C], Awaitable[BatchStatus]],
+    ) -> AsyncIterator[str]:
+        """Submit batch operations and yield their IDs as they are accepted.
+
+        Chunks are consumed lazily and at most `max_in_flight` submissions 
+        are pending at any time, so status polling can start on early 
+        batches while later ones are still being submitted. Chunks rejected
+        as too large are split in halves and submitted again.
+
+        Raises
+        ------
+        `StockXIncompleteOperation`
+            If a submission fails. No more chunks are submitted, and the 
+            batches accepted but not completed yet are the timed out ones.
+        """
+        loop = asyncio.get_running_loop()
+        chunks = iter(chunks)
+        retries: list[C] = []
+        pending: dict[asyncio.Future[BatchStatus], C] = {}
+        error: Exception | None = None
+        try:
+            while True:
+                while error is None and len(pending) < self.max_in_flight:
+                    chunk = retries.pop() if retries else next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending[asyncio.ensure_future(submit(chunk))] = chunk
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    chunk = pending.pop(future)
+                    try:
+                        batch_id = future.result().batch_id
+                    except StockXRequestTooLarge as e:
+                        if len(chunk) <= 1:
+                            error = error or e
+                            continue
+                        self.controller.record_too_large(len(chunk))
+                        half = len(chunk) // 2
+                        retries += [chunk[half:], chunk[:half]]
+                        continue
+                    except Exception as e:
+                        # Batches of the other submissions are still tracked
+                        error = error or e
+                        continue
+                    self._batches[batch_id] = (loop.time(), len(chunk))
+                    yield batch_id
+        finally:
+            # Let submissions already sent finish before giving up
+            if pending:
+                await asyncio.wait(pending)
+                for future, chunk in pending.items():
+                    if not future.cancelled() and future.exception() is None:
+                        batch_id = future.result().batch_id
+                        self._batches[batch_id] = (loop.time(), len(chunk))
+
+        if error is not None:
+            raise StockXIncompleteOperation(
+                'Batch submission failed.', 
+                partial_results=[], 
+                timed_out_batch_ids=list(self._batches),
+                batch_operations=dict.fromkeys(self._batches, self.operation),
+            ) from error
+
+    def observe(
+            self,
+            get_batch_items: Callable[[str], Awaitable[list[R]]],
+    ) -> Callable[[str], Awaitable[list[R]]]:
+        """Wrap a get batch items callback to report completed batches."""
+        async def observed(batch_id: str) -> list[R]:
+            results = await get_batch_items(batch_id)
+            if batch_id in self._batches:
+                submitted_at, size = self._batches.pop(batch_id)
+                latency = asyncio.get_running_loop().time() - submitted_at
+                failed = sum(1 for result in results if result.error)
+                self.controller.record_completion(size, latency, failed)
+            return results
+        return observed
+
 
 async def _batch_results(
         stockx: StockX, 
-        batch_ids: Iterable[str], 
+        batch_ids: Iterable[str] | AsyncIterator[str], 
         func: publish_listings | update_listings | delete_listings, 
-        timeout: int
+        timeout: int,
+        submission: _Submission | None = None,
 ) -> list[BatchCreateResult | BatchUpdateResult | BatchDeleteResult]:
     """Wait for batch operations to complete and retrieve results.
     
     Raises
     ------
     `StockXBatchTimeout`
-        If batch operations don't complete within timeout
+        If batch operations don't complete within timeout, or a submission
+        fails before all batches are accepted
     """
-    timeout_error = None
-
     if func is publish_listings:
-        batch_completed = stockx.batch.create_listings_completed
-        get_items = stockx.batch.create_listings_items
+        operation = BatchOperationType.CREATE
     elif func is update_listings:
-        batch_completed = stockx.batch.update_listings_completed
-        get_items = stockx.batch.update_listings_items
+        operation = BatchOperationType.UPDATE
     elif func is delete_listings:
-        batch_completed = stockx.batch.delete_listings_completed
-        get_items = stockx.batch.delete_listings_items
+        operation = BatchOperationType.DELETE
+    get_status, get_items = batch_getters(stockx, operation)
 
+    if submission:
+        get_items = submission.observe(get_items)
+
+    results = []
     try:
-        await batch_completed(batch_ids, timeout)
+        async for result in batch_results(
+            batch_ids, get_status, get_items, timeout
+        ):
+            results.append(result)
     except StockXBatchTimeout as e:
-        timeout_error = e
-
-    batch_results = []
+        e.partial_batch_results = results + e.partial_batch_results
+        raise
+    except StockXIncompleteOperation as e:
+        # Submission failed, keep the results of the completed batches
+        raise StockXBatchTimeout(
+            message=e.message,
+            queued_batch_ids=e.timed_out_batch_ids,
+            partial_batch_results=results,
+        ) from e
 
-    for batch_id in batch_ids:
-        results = await get_items(batch_id)
-        for result in results:
-            if result.status != BatchItemStatus.QUEUED:
-                batch_results.append(result)
+    return results
 
-    if timeout_error:
-        timeout_error.partial_batch_results = batch_results
-        raise timeout_error
 
-    return batch_results
\ No newline at end of file
+def batch_getters(
+        stockx: StockX, 
+        operation: BatchOperationType,
+) -> tuple[
+    Callable[[str], Awaitable[BatchStatus]], 
+    Callable[[str], Awaitable[list[R]]],
+]:
+    """Get the batch status and items functions of a batch operation."""
+    match operation:
+        case BatchOperationType.CREATE:
+            return (
+                stockx.batch.create_listings_status, 
+                stockx.batch.create_listings_items,
+            )
+        case BatchOperationType.UPDATE:
+            return (
+                stockx.batch.update_listings_status, 
+                stockx.batch.update_listings_items,
+            )
+        case BatchOperationType.DELETE:
+            return (
+                stockx.batch.delete_listings_status, 
+                stockx.batch.delete_listings_items,
+            )
@@ -179,8 +179,10 @@ class UpdateResult:
         error_map = {r.listing_input.listing_id: r.error for r in results}
 
         for item in items:
-            updated = (lid for lid in item.listing_ids if not error_map[lid])
-            failed = (lid for lid in item.listing_ids if error_map[lid])
+            # Listings without a result (e.g. timed out) are left out
+            listing_ids = [lid for lid in item.listing_ids if lid in error_map]
+            updated = (lid for lid in listing_ids if not error_map[lid])
+            failed = tuple(lid for lid in listing_ids if error_map[lid])
             errors = (error_map[listing_id] for listing_id in failed)
             errors_detail = ErrorDetail.from_messages(errors)
 
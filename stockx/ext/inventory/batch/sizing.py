@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TypeVar
+
+
+MAX_BATCH_SIZE = 100
+
+T = TypeVar('T')
+
+
+class BatchSizeController:
+    """Tunes the number of items submitted per batch operation.
+
+    Starts with full batches and adapts the size to the observed batches:
+    - Request size errors lower the maximum size permanently
+    - High item failure rates halve the size, so that partial failures
+      are smaller and recover faster
+    - Completion latencies above `target_latency` shrink the size
+    - Fast and clean batches grow the size back towards `max_size`
+
+    Parameters
+    ----------
+    size : `int`, default 100
+        Initial batch size.
+    min_size : `int`, default 10
+        Smallest batch size the controller can shrink to.
+    max_size : `int`, default 100
+        Largest batch size accepted by the server.
+    target_latency : `float`, default 30.0
+        Batch completion time in seconds above which batches are shrunk.
+    max_failure_rate : `float`, default 0.1
+        Share of failed items above which batches are shrunk.
+
+    Examples
+    --------
+    >>> controller = BatchSizeController(min_size=20, target_latency=15)
+    >>> async with Inventory(stockx, batch_size=controller) as inventory:
+    ...     ...
+    """
+
+    __slots__ = (
+        '_size',
+        'max_failure_rate',
+        'max_size',
+        'min_size',
+        'target_latency',
+    )
+
+    def __init__(
+            self,
+            size: int = MAX_BATCH_SIZE,
+            min_size: int = 10,
+            max_size: int = MAX_BATCH_SIZE,
+            target_latency: float = 30.0,
+            max_failure_rate: float = 0.1,
+    ) -> None:
+        if not 0 < min_size <= max_size:
+            raise ValueError('Batch sizes must satisfy 0 < min_size <= max_size.')
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.max_failure_rate = max_failure_rate
+        self._size = self._bounded(size)
+
+    @classmethod
+    def fixed(cls, size: int) -> BatchSizeController:
+        """Create a controller that always uses the same batch size."""
+        return cls(size=size, min_size=size, max_size=size)
+
+    @property
+    def size(self) -> int:
+        """The batch size to use for the next batch."""
+        return self._size
+
+    def record_completion(
+            self,
+            size: int,
+            latency: float,
+            failed: int = 0,
+    ) -> None:
+        """Adapt the batch size to a completed batch.
+
+        Parameters
+        ----------
+        size : `int`
+            Number of items in the batch.
+        latency : `float`
+            Seconds between the batch submission and its completion.
+        failed : `int`, default 0
+            Number of items that failed.
+        """
+        if size <= 0:
+            return
+        if failed / size > self.max_failure_rate:
+            self._size = self._bounded(self._size // 2)
+        elif latency > self.target_latency:
+            self._size = self._bounded(self._size * 3 // 4)
+        elif size >= self._size:
+            self._size = self._bounded(self._size + max(self._size // 4, 1))
+
+    def record_too_large(self, size: int) -> None:
+        """Lower the maximum batch size after a request size error."""
+        self.max_size = max(self.min_size, size // 2)
+        self._size = self._bounded(self._size)
+
+    def _bounded(self, size: int) -> int:
+        return max(self.min_size, min(size, self.max_size))
+
+
+def batch_size_controller(
+        batch_size: int | BatchSizeController | None,
+) -> BatchSizeController:
+    """Get a controller for a batch size setting.
+
+    `None` creates an adaptive controller, an `int` a fixed one.
+    """
+    if batch_size is None:
+        return BatchSizeController()
+    if isinstance(batch_size, BatchSizeController):
+        return batch_size
+    return BatchSizeController.fixed(batch_size)
+
+
+def chunked(
+        iterable: Iterable[T],
+        batch_size: int | BatchSizeController,
+) -> Iterator[tuple[T, ...]]:
+    """Split an iterable in chunks, reading the size before each chunk."""
+    controller = batch_size_controller(batch_size)
+    iterator = iter(iterable)
+    while chunk := tuple(islice(iterator, controller.size)):
+        yield chunk
@@ -0,0 +1,227 @@
+from __future__ import annotations
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .batch.results import UpdateResult
+from ...api import StockX
+from ...format import jsonable
+from ...logs import logger
+from ...models import Listing, ListingStatus
+
+
+FORMAT_VERSION = 1
+
+# Listings are requested from a date (no time), so incremental syncs
+# start one day before the last sync to not miss any update
+SYNC_OVERLAP = timedelta(days=1)
+
+
+class InventoryIndex:
+    """
+    Local index of active listings, kept in sync incrementally.
+
+    The first sync retrieves all active listings. Following syncs only
+    request the listings from the day before the last sync, and a full
+    sync reconciles the index periodically with the listings on StockX.
+    Results of batch operations performed by the inventory are applied
+    to the index as they complete.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike | None`, optional
+        JSON file the index is persisted to after each sync.
+    max_staleness : `float`, default 60.0
+        Seconds after which the index is synced before being queried.
+    full_sync_interval : `float`, default 86400.0
+        Seconds after which the index is fully reconciled.
+
+    Examples
+    --------
+    >>> index = InventoryIndex.open('inventory.json')
+    >>> async with Inventory(stockx, index=index) as inventory:
+    ...     items = await inventory.items().filter_by(sizes=['10']).all()
+    """
+
+    __slots__ = (
+        '_listings',
+        '_stale',
+        'full_sync_interval',
+        'last_full_sync',
+        'last_sync',
+        'max_staleness',
+        'path',
+    )
+
+    def __init__(
+            self,
+            path: str | os.PathLike | None = None,
+            max_staleness: float = 60.0,
+            full_sync_interval: float = 86400.0,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.max_staleness = max_staleness
+        self.full_sync_interval = full_sync_interval
+        self.last_sync: datetime | None = None
+        self.last_full_sync: datetime | None = None
+        self._listings: dict[str, Listing] = {}
+        self._stale = False
+
+    @classmethod
+    def open(
+            cls,
+            path: str | os.PathLike,
+            **kwargs
+    ) -> InventoryIndex:
+        """Create an index persisted to `path`, loading it if it exists."""
+        index = cls(path, **kwargs)
+        if index.path.exists():
+            index.load()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __contains__(self, listing_id: str) -> bool:
+        return listing_id in self._listings
+
+    def listings(
+            self,
+            product_ids: Iterable[str] | None = None,
+            variant_ids: Iterable[str] | None = None,
+    ) -> Iterator[Listing]:
+        """Iterate over the indexed listings, optionally filtered by IDs."""
+        product_ids = set(product_ids) if product_ids else None
+        variant_ids = set(variant_ids) if variant_ids else None
+        for listing in self._listings.values():
+            if product_ids and listing.product.id not in product_ids:
+                continue
+            if variant_ids and listing.variant.id not in variant_ids:
+                continue
+            yield listing
+
+    def stale(self) -> bool:
+        """Whether the index should be synced before being queried."""
+        if self._stale or self.last_sync is None:
+            return True
+        age = datetime.now(timezone.utc) - self.last_sync
+        return age.total_seconds() > self.max_staleness
+
+    def invalidate(self) -> None:
+        """Sync the index before the next query."""
+        self._stale = True
+
+    async def refresh(self, stockx: StockX) -> None:
+        """Sync the index if stale, fully if a reconcile is due."""
+        now = datetime.now(timezone.utc)
+        if (
+            self.last_full_sync is None
+            or (now - self.last_full_sync).total_seconds() > self.full_sync_interval
+        ):
+            await self.sync(stockx, full=True)
+        elif self.stale():
+            await self.sync(stockx)
+
+    async def sync(self, stockx: StockX, full: bool = False) -> None:
+        """
+        Sync the index with the listings on StockX.
+
+        Parameters
+        ----------
+        stockx : `StockX`
+            The StockX API interface instance.
+        full : `bool`, default False
+            If `True`, replace the index with all active listings. Otherwise
+            only apply the listings since the day before the last sync.
+        """
+        started_at = datetime.now(timezone.utc)
+
+        if full or self.last_sync is None:
+            listings = {}
+            async for listing in stockx.listings.get_all_listings(
+                listing_statuses=[ListingStatus.ACTIVE],
+                page_size=100,
+            ):
+                listings[listing.id] = listing
+            self._listings = listings
+            self.last_full_sync = started_at
+            logger.info(f'Inventory index fully synced: {len(listings)} listings.')
+        else:
+            count = 0
+            async for listing in stockx.listings.get_all_listings(
+                from_date=self.last_sync - SYNC_OVERLAP,
+                page_size=100,
+            ):
+                count += 1
+                if listing.status == ListingStatus.ACTIVE:
+                    self._listings[listing.id] = listing
+                else:
+                    self._listings.pop(listing.id, None)
+            logger.debug(f'Inventory index synced: {count} listings changed.')
+
+        self.last_sync = started_at
+        self._stale = False
+        if self.path:
+            self.save()
+
+    def apply(self, results: Iterable[UpdateResult]) -> None:
+        """
+        Apply the results of listing operations to the index.
+
+        Updated listings take the price of their item and deleted listings
+        are removed. Created listings are added with the next sync.
+        """
+        for result in results:
+            for listing_id in result.deleted:
+                self._listings.pop(listing_id, None)
+
+            if result.item is not None:
+                for listing_id in result.updated:
+                    if listing := self._listings.get(listing_id):
+                        self._listings[listing_id] = replace(
+                            listing, amount=result.item.price
+                        )
+
+            if result.created:
+                self._stale = True
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the index to a JSON file, by default to `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to save the inventory index to.')
+
+        data = {
+            'version': FORMAT_VERSION,
+            'last_sync': jsonable(self.last_sync),
+            'last_full_sync': jsonable(self.last_full_sync),
+            'listings': [jsonable(listing) for listing in self._listings.values()],
+        }
+        # Write to a temporary file first to never leave a partial index
+        temporary = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        temporary.replace(path)
+
+    def load(self, path: str | os.PathLike | None = None) -> None:
+        """Read the index from a JSON file, by default from `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to load the inventory index from.')
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != FORMAT_VERSION:
+            logger.warning(f'Ignoring inventory index with unknown format: {path}')
+            return
+
+        def timestamp(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        self.last_sync = timestamp(data['last_sync'])
+        self.last_full_sync = timestamp(data['last_full_sync'])
+        self._listings = {
+            listing.id: listing
+            for listing in map(Listing.from_json, data['listings'])
+        }
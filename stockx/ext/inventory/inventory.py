@@ -1,5 +1,7 @@
 from __future__ import annotations
+import asyncio
 from collections.abc import (
+    AsyncIterator,
     Callable,
     Iterable, 
     Iterator,
@@ -7,23 +9,46 @@ from collections.abc import (
 from typing import TYPE_CHECKING
 
 from .batch.operations import (
+    batch_getters,
     publish_listings,
+    stream_update_listings,
     update_listings, 
     update_quantity,
 )
 from .batch.results import UpdateResult
+from .batch.sizing import BatchSizeController, batch_size_controller
+from .index import InventoryIndex
 from .item import Item, ListedItem
-from .market import create_item_market_data
+from .journal import Journal
+from .market import ItemMarketData, MarketSnapshot
+from .pricing import (
+    Fees,
+    PricingInputs,
+    PricingResult,
+    PricingStrategy,
+    Values,
+    calculate_payouts,
+    evaluate_pricing,
+)
 from .query import create_items_query
+from .reconcile import BatchReconciler, Reconciliation
+from .simulation import SimulationReport, simulate
 from ..mock import mock_listing
 from ...api import StockX
+from ...api.batch import batch_completed
+from ...concurrency import map_bounded
 from ...errors import StockXIncompleteOperation
 from ...logs import logger
-from ...models import Currency, ListingStatus
+from ...models import (
+    BatchOperationType,
+    Currency, 
+    ListingStatus, 
+    MarketData,
+)
 from ...types_ import ComputedValue, computed_value
 
 if TYPE_CHECKING:
-    from .market import ItemMarketData, MarketValue
+    from .market import MarketValue
     from .query import ItemsQuery
 
 
@@ -59,6 +84,32 @@ class Inventory:
         Current selling fee.
     payment_fee_percentage : `float`, default 3.0%
         Current payment processing fee.
+    batch_size : `int | BatchSizeController | None`, default None
+        Number of items per batch operation. By default the batch size is
+        adapted to the observed batch latencies, failures and request size
+        errors. Pass an `int` for a fixed size or a `BatchSizeController`
+        to tune the adaptation.
+    concurrency : `int`, default 50
+        Maximum number of items whose new price and condition are 
+        evaluated concurrently.
+    market_data_ttl : `float`, default 30.0
+        Seconds during which the market data of a product is reused.
+    index : `InventoryIndex | None`, optional
+        Local index of listings that item queries are answered from. 
+        Results of listing operations are applied to the index.
+    journal : `Journal | None`, optional
+        Journal recording registered changes and timed out batches, so that
+        they can be replayed with `recover` after a crash.
+    reconciler : `BatchReconciler | None`, optional
+        Reconciler the batches timed out in `update` are handed over to.
+        Their results are applied to the index and journal as they complete,
+        and they are awaited on exit.
+
+    Attributes
+    ----------
+    market : `MarketSnapshot`
+        Market data of the inventory products, indexed by product and 
+        variant ID.
 
     Examples
     --------
@@ -80,9 +131,16 @@ class Inventory:
     __slots__ = (
         '_price_updates',
         '_quantity_updates',
+        '_reconciling',
+        'batch_size',
+        'concurrency',
         'currency',
+        'index',
+        'journal',
+        'market',
         'minimum_transaction_fee',
         'payment_fee',
+        'reconciler',
         'shipping_fee',
         'stockx',
         'transaction_fee',
@@ -95,7 +153,13 @@ class Inventory:
             shipping_fee: float = 7.0,
             minimum_transaction_fee: float = 5.0,
             transaction_fee_percentage: float = 0.09,
-            payment_fee_percentage: float = 0.03
+            payment_fee_percentage: float = 0.03,
+            batch_size: int | BatchSizeController | None = None,
+            concurrency: int = 50,
+            market_data_ttl: float = 30.0,
+            index: InventoryIndex | None = None,
+            journal: Journal | None = None,
+            reconciler: BatchReconciler | None = None,
     ) -> None:
         self.stockx = stockx
         self.currency = currency
@@ -103,9 +167,23 @@ class Inventory:
         self.minimum_transaction_fee = minimum_transaction_fee
         self.transaction_fee = transaction_fee_percentage
         self.payment_fee = payment_fee_percentage
+        self.batch_size = batch_size_controller(batch_size)
+        self.concurrency = concurrency
+        self.index = index
+        self.journal = journal
+        self.reconciler = reconciler
+        if reconciler is not None:
+            reconciler.add_callback(self._reconciled)
+        self.market = MarketSnapshot(
+            fetch=self._fetch_market_data,
+            payout_calculator=self.calculate_payout,
+            ttl=market_data_ttl,
+        )
 
         self._price_updates: set[ListedItem] = set()
         self._quantity_updates: set[ListedItem] = set()
+        # Journal keys of the changes of each reconciliation
+        self._reconciling: dict[Reconciliation, dict[ListedItem, str]] = {}
 
     async def __aenter__(self) -> Inventory:
         await self.load()
@@ -113,8 +191,20 @@ class Inventory:
     
     async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
         try:
-            results = await self.update()
-            logger.info(f'Successfully updated {len(results)} items on exit.')
+            try:
+                results = await self.update()
+                logger.info(f'Successfully updated {len(results)} items on exit.')
+            except StockXIncompleteOperation as e:
+                if self.reconciler is None:
+                    raise
+                logger.info(
+                    f'Reconciling {len(e.timed_out_batch_ids)} timed out '
+                    f'batches on exit.'
+                )
+            if self.reconciler is not None:
+                await self.reconciler.wait()
+            if self.index is not None and self.index.path:
+                self.index.save()
         except StockXIncompleteOperation as e:
             logger.warning(
                 f'Incomplete updates on exit: {len(e.partial_results)} items '
@@ -148,6 +238,7 @@ class Inventory:
             if detail.payout:
                 self.transaction_fee = detail.payout.transaction_fee
                 self.payment_fee = detail.payout.payment_fee
+                self.market.invalidate()  # Payouts depend on fees
                 return
         
         async with mock_listing(
@@ -157,6 +248,7 @@ class Inventory:
             if detail and detail.payout:
                 self.transaction_fee = detail.payout.transaction_fee
                 self.payment_fee = detail.payout.payment_fee
+                self.market.invalidate()  # Payouts depend on fees
                 return
         
         raise RuntimeError('Unable to load fees. Default fees applied.')
@@ -189,21 +281,53 @@ class Inventory:
             self, 
             item: Item | ListedItem
     ) -> ItemMarketData:
-        market_data = await self.stockx.catalog.get_product_market_data(
+        """
+        Get the market data of an item, including calculated payouts.
+
+        Market data is looked up in the inventory `market` snapshot, so all
+        sizes of a product share a single request. If no market data is
+        available for the item's variant, all market values are `None`.
+        """
+        market_data = await self.market.variant(
             product_id=item.product_id, 
-            currency=self.currency
+            variant_id=item.variant_id
         )
+        if market_data is None:
+            return ItemMarketData(currency=self.currency)
+        return market_data
+
+    async def prefetch_market_data(
+            self, 
+            items: Iterable[Item | ListedItem]
+    ) -> None:
+        """
+        Fetch the market data of all the items' products concurrently.
 
-        variant_market_data = next(
-            data for data in market_data 
-            if data.variant_id == item.variant_id
+        Market data is fetched once per product and stored in the `market`
+        snapshot, so that the following `get_item_market_data` calls don't 
+        perform requests.
+        """
+        await self.market.prefetch(
+            product_ids=(item.product_id for item in items), 
+            limit=self.concurrency
         )
-        
-        return create_item_market_data(
-            market_data=variant_market_data, 
-            payout_calculator=self.calculate_payout, 
+
+    async def _fetch_market_data(self, product_id: str) -> list[MarketData]:
+        return await self.stockx.catalog.get_product_market_data(
+            product_id=product_id, 
+            currency=self.currency
         )
     
+    @property
+    def fees(self) -> Fees:
+        """The seller fees used to calculate payouts."""
+        return Fees(
+            transaction_fee=self.transaction_fee,
+            payment_fee=self.payment_fee,
+            shipping_fee=self.shipping_fee,
+            minimum_transaction_fee=self.minimum_transaction_fee,
+        )
+
     def calculate_payout(self, amount: float) -> float:
         """
         Calculate the net payout for a given listing (or Ask) amount.
@@ -219,64 +343,403 @@ class Inventory:
             Payout after deducting transaction fees, payment fees,
             and shipping costs.
         """
-        transaction_fee = max(
-            self.transaction_fee * amount,  
-            self.minimum_transaction_fee
+        return calculate_payouts(amount, self.fees)
+    
+    def calculate_payouts(self, amounts: Values) -> Values:
+        """
+        Calculate the net payouts for many listing (or Ask) amounts at once.
+        Vectorized with NumPy if available. See `calculate_payout`.
+        """
+        return calculate_payouts(amounts, self.fees)
+    
+    async def pricing_inputs(self, items: Iterable[ListedItem]) -> PricingInputs:
+        """
+        Collect the prices and market data of items for bulk pricing.
+
+        Market data is fetched once per product, see `prefetch_market_data`.
+
+        Parameters
+        ----------
+        items : `Iterable[ListedItem]`
+            Items to price.
+
+        Returns
+        -------
+        `PricingInputs`
+            Column table of prices and market values, in items order.
+        """
+        items = list(items)
+        await self.prefetch_market_data(items)
+        market_data = await map_bounded(
+            self.get_item_market_data, items, limit=self.concurrency
         )
-        return (
-            amount 
-            - transaction_fee 
-            - self.payment_fee * amount 
-            - self.shipping_fee
+        return PricingInputs.from_items(items, market_data, self.fees)
+    
+    def evaluate_pricing(
+            self, 
+            inputs: PricingInputs, 
+            strategy: PricingStrategy
+    ) -> PricingResult:
+        """
+        Compute new prices for all items with a vectorized pricing strategy.
+        No changes are made to the items. See `stockx.ext.inventory.pricing`.
+
+        Parameters
+        ----------
+        inputs : `PricingInputs`
+            Prices and market data from `pricing_inputs`.
+        strategy : `PricingStrategy`
+            Function of the inputs columns returning the new prices.
+
+        Returns
+        -------
+        `PricingResult`
+            New prices, payouts and change mask.
+        """
+        return evaluate_pricing(inputs, strategy)
+    
+    def simulate(
+            self, 
+            inputs: PricingInputs, 
+            strategy: PricingStrategy
+    ) -> SimulationReport:
+        """
+        Dry-run a pricing strategy and report its impact. 
+        
+        No listings are updated and no requests are made, so strategies can 
+        be tuned by sweeping parameters over the same inputs.
+
+        Parameters
+        ----------
+        inputs : `PricingInputs`
+            Prices and market data from `pricing_inputs`.
+        strategy : `PricingStrategy`
+            Function of the inputs columns returning the new prices, e.g. 
+            `stockx.ext.inventory.pricing.beat_lowest_ask(beat_by=2)`.
+
+        Returns
+        -------
+        `SimulationReport`
+            Per-item old and new prices, payout deltas and total impact.
+        """
+        return simulate(inputs, strategy)
+    
+    async def apply_pricing(self, result: PricingResult) -> list[UpdateResult]:
+        """Update the prices of the items changed by a pricing result."""
+        new_prices = dict(result.changes())
+        return await self.change_price(
+            items=new_prices, 
+            new_price=lambda item: new_prices[item]
         )
     
     def register_price_change(self, item: ListedItem) -> None:
         self._price_updates.add(item)
+        if self.journal is not None:
+            self.journal.record_change(item)
 
     def register_quantity_change(self, item: ListedItem) -> None:
         self._quantity_updates.add(item)
+        if self.journal is not None:
+            self.journal.record_change(item)
+
+    async def update(self, timeout: int = 60) -> list[UpdateResult]:
+        """
+        Apply all pending price and quantity changes.
 
-    async def update(self) -> list[UpdateResult]:
-        """Apply all pending price and quantity changes."""
+        Parameters
+        ----------
+        timeout : `int`, default 60
+            Maximum seconds to wait for the batch operations of each phase.
+            With a `reconciler`, timed out batches keep being tracked in
+            background, so short timeouts don't lose their results.
+
+        Returns
+        -------
+        `list[UpdateResult]`
+            Consolidated results of the price and quantity changes.
+
+        Raises
+        ------
+        `StockXIncompleteOperation`
+            If some batch operations timeout. The exception contains partial
+            results for operations that completed successfully.
+        """
         quantity_results = []
         price_results = []
         timed_out_batch_ids = [] 
+        batch_operations = {}
+
+        price_updates = list(self._price_updates)
+        quantity_updates = list(self._quantity_updates)
 
         # Perform price updates before quantity updates
         # to avoid updating quantities with old prices
-        if self._price_updates:
+        if price_updates:
             try:
                 price_results = await update_listings(
                     stockx=self.stockx, 
-                    items=self._price_updates
+                    items=price_updates,
+                    timeout=timeout,
+                    batch_size=self.batch_size,
                 )
             except StockXIncompleteOperation as e:
                 price_results = e.partial_results
                 timed_out_batch_ids += e.timed_out_batch_ids
+                batch_operations |= e.batch_operations
 
-        if self._quantity_updates:
+        if quantity_updates:
             try:
                 quantity_results = await update_quantity(
                     stockx=self.stockx, 
-                    items=self._quantity_updates
+                    items=quantity_updates,
+                    timeout=timeout,
+                    batch_size=self.batch_size,
                 )
             except StockXIncompleteOperation as e:
                 quantity_results = e.partial_results
                 timed_out_batch_ids += e.timed_out_batch_ids
+                batch_operations |= e.batch_operations
 
         self._price_updates.clear()
         self._quantity_updates.clear()
 
         results = list(UpdateResult.consolidate(quantity_results, price_results))
+        self._index_results(results, timed_out=bool(timed_out_batch_ids))
+        self._journal_results(
+            price_updates=price_updates,
+            quantity_updates=quantity_updates,
+            price_done={result.item for result in price_results},
+            quantity_done={result.item for result in quantity_results},
+            batch_operations=batch_operations,
+        )
 
         if timed_out_batch_ids:
-            raise StockXIncompleteOperation(
+            error = StockXIncompleteOperation(
                 'Inventory items price and quantity updates timed out.',
                 partial_results=results, 
-                timed_out_batch_ids=timed_out_batch_ids
+                timed_out_batch_ids=timed_out_batch_ids,
+                batch_operations=batch_operations,
             )
+            if self.reconciler is not None:
+                items = dict.fromkeys(price_updates + quantity_updates)
+                reconciliation = self.reconciler.reconcile(error, items=items)
+                if self.journal is not None:
+                    # Changes registered meanwhile must not be marked applied
+                    self._reconciling[reconciliation] = self.journal.detach(items)
+            raise error
         
         return results   
+
+    async def stream_update(self) -> AsyncIterator[UpdateResult]:
+        """
+        Apply all pending price and quantity changes, streaming results.
+
+        Like `update`, but price update results are yielded as soon as
+        their batch completes. Quantity update results follow once all
+        quantity changes are applied. Results are not consolidated, so an
+        item with both a price and a quantity change is yielded twice.
+
+        Raises
+        ------
+        `StockXIncompleteOperation`
+            If some batch operations timeout. The exception contains partial
+            results for the items that were not yielded.
+        """
+        price_updates = list(self._price_updates)
+        quantity_updates = list(self._quantity_updates)
+
+        partial_results = []
+        timed_out_batch_ids = []
+        batch_operations = {}
+        price_done = set()
+        quantity_done = set()
+        price_finished = quantity_finished = False
+
+        try:
+            if price_updates:
+                self._price_updates.difference_update(price_updates)
+                try:
+                    async for result in stream_update_listings(
+                        stockx=self.stockx, 
+                        items=price_updates,
+                        batch_size=self.batch_size,
+                    ):
+                        self._index_results([result])
+                        price_done.add(result.item)
+                        yield result
+                except StockXIncompleteOperation as e:
+                    partial_results += e.partial_results
+                    timed_out_batch_ids += e.timed_out_batch_ids
+                    batch_operations |= e.batch_operations
+            price_finished = True
+
+            # Include quantity changes registered during the price phase
+            quantity_updates = list(self._quantity_updates)
+            if quantity_updates:
+                self._quantity_updates.difference_update(quantity_updates)
+                try:
+                    quantity_results = await update_quantity(
+                        stockx=self.stockx, 
+                        items=quantity_updates,
+                        batch_size=self.batch_size,
+                    )
+                except StockXIncompleteOperation as e:
+                    quantity_results = e.partial_results
+                    timed_out_batch_ids += e.timed_out_batch_ids
+                    batch_operations |= e.batch_operations
+                self._index_results(quantity_results)
+                quantity_done.update(result.item for result in quantity_results)
+                quantity_finished = True
+                for result in quantity_results:
+                    yield result
+        finally:
+            # Re-queue the changes of phases that did not run to the end,
+            # e.g. if the consumer stopped early or a batch failed
+            if not price_finished:
+                self._price_updates.update(
+                    item for item in price_updates if item not in price_done
+                )
+            if not quantity_finished:
+                self._quantity_updates.update(
+                    item for item in quantity_updates if item not in quantity_done
+                )
+            self._journal_results(
+                price_updates=price_updates,
+                quantity_updates=quantity_updates,
+                price_done=price_done,
+                quantity_done=quantity_done,
+                batch_operations=batch_operations,
+            )
+
+        if timed_out_batch_ids:
+            self._index_results(partial_results, timed_out=True)
+            raise StockXIncompleteOperation(
+                'Inventory items price and quantity updates timed out.',
+                partial_results=partial_results, 
+                timed_out_batch_ids=timed_out_batch_ids,
+                batch_operations=batch_operations,
+            )
+
+    def _journal_results(
+            self,
+            price_updates: list[ListedItem],
+            quantity_updates: list[ListedItem],
+            price_done: set[ListedItem],
+            quantity_done: set[ListedItem],
+            batch_operations: dict[str, BatchOperationType],
+    ) -> None:
+        """Record applied changes and timed out batches in the journal."""
+        if self.journal is None:
+            return
+        
+        # An item is applied once all its pending changes have a result
+        price_pending = set(price_updates) - price_done
+        quantity_pending = set(quantity_updates) - quantity_done
+        self.journal.record_applied(
+            item for item in dict.fromkeys(price_updates + quantity_updates)
+            if item not in price_pending and item not in quantity_pending
+        )
+        self.journal.record_timed_out(batch_operations)
+
+        if not batch_operations:
+            self.journal.compact()
+
+    def _journal_repriced(
+            self,
+            items: list[ListedItem],
+            done: set[ListedItem],
+            batch_operations: dict[str, BatchOperationType],
+    ) -> None:
+        """Record the results of a direct price change in the journal."""
+        self._journal_results(
+            price_updates=items,
+            # Changes of items with a pending quantity change stay unapplied
+            quantity_updates=[
+                item for item in items if item in self._quantity_updates
+            ],
+            price_done=done,
+            quantity_done=set(),
+            batch_operations=batch_operations,
+        )
+
+    async def recover(self, timeout: int = 300) -> list[UpdateResult]:
+        """
+        Replay the changes of a previous run recorded in the journal.
+
+        Batches that timed out in the previous run are awaited first. Then 
+        the current listings of the journaled items are retrieved, and the
+        journaled prices and quantities are applied to them. Changes whose
+        listings are no longer active are skipped.
+
+        Parameters
+        ----------
+        timeout : `int`, default 300
+            Seconds to wait for the timed out batches of the previous run.
+
+        Returns
+        -------
+        `list[UpdateResult]`
+            Results of the replayed changes.
+
+        Raises
+        ------
+        `StockXBatchTimeout`
+            If the timed out batches of the previous run are still queued.
+        `StockXIncompleteOperation`
+            If the replayed operations timeout.
+        """
+        if self.journal is None:
+            return []
+        
+        state = self.journal.state()
+
+        if state.timed_out_batches:
+            await asyncio.gather(*(
+                batch_completed(
+                    batch_ids=[
+                        batch_id 
+                        for batch_id, op in state.timed_out_batches.items() 
+                        if op is operation
+                    ], 
+                    get_batch_status=batch_getters(self.stockx, operation)[0], 
+                    timeout=timeout,
+                )
+                for operation in set(state.timed_out_batches.values())
+            ))
+            self.journal.record_reconciled(state.timed_out_batches)
+
+        if not state.changes:
+            return []
+        
+        # Refresh listing IDs, which changed if the previous run was partial
+        items = await self.items().filter_by(
+            variant_ids={change.variant_id for change in state.changes}
+        ).all()
+        items_by_listing = {
+            listing_id: item for item in items for listing_id in item.listing_ids
+        }
+
+        for change in state.changes:
+            item = next(
+                (
+                    items_by_listing[listing_id] 
+                    for listing_id in change.listing_ids 
+                    if listing_id in items_by_listing
+                ), 
+                None
+            )
+            if item is None:
+                logger.warning(
+                    f'Skipping journaled change of variant {change.variant_id}: '
+                    f'listings are no longer active.'
+                )
+                continue
+            item.price = change.price
+            item.quantity = change.quantity
+
+        # Replayed changes are journaled again for the current items
+        self.journal.record_applied(keys=[change.key for change in state.changes])
+        return await self.update()
     
     async def sell(self, items: Iterable[Item]) -> list[ListedItem]:
         """
@@ -312,9 +775,15 @@ class Inventory:
         Expected payout: $89.80
         """
         try:
-            results = await publish_listings(self.stockx, items, self.currency)
+            results = await publish_listings(
+                stockx=self.stockx, 
+                items=items, 
+                currency=self.currency,
+                batch_size=self.batch_size,
+            )
         except StockXIncompleteOperation as e:
             results = e.partial_results
+        self._index_results(results)
 
         return [
             ListedItem(result.item, self, result.created)
@@ -361,20 +830,129 @@ class Inventory:
         ...     condition=lambda item: item.payout() > 200
         ... )
         """
-        items_to_update = []
-        for item in items: 
+        items_to_update = await self._reprice(items, new_price, condition)
+        done = set()
+        batch_operations = {}
+
+        # Sync changes to StockX
+        try:
+            results = await update_listings(
+                stockx=self.stockx, 
+                items=items_to_update, 
+                batch_size=self.batch_size,
+            )
+            done.update(result.item for result in results)
+        except StockXIncompleteOperation as e:
+            done.update(result.item for result in e.partial_results)
+            batch_operations = e.batch_operations
+            self._index_results(e.partial_results, timed_out=True)
+            raise
+        finally:
+            self._journal_repriced(items_to_update, done, batch_operations)
+        return self._index_results(results)
+
+    async def stream_change_price(
+            self,
+            items: Iterable[ListedItem],
+            new_price: Amount,
+            condition: Condition = True,
+    ) -> AsyncIterator[UpdateResult]:
+        """
+        Like `change_price`, but yields the result of each item as soon as
+        the batch updating its listings completes.
+
+        Raises
+        ------
+        `StockXIncompleteOperation`
+            If the price update operations timeout. The exception contains 
+            partial results for the items that were not yielded.
+
+        Examples
+        --------
+        >>> async for result in inventory.stream_change_price(
+        ...     items=items,
+        ...     new_price=lambda item: item.price * 0.9,
+        ... ):
+        ...     bookkeeping.record(result)
+        """
+        items_to_update = await self._reprice(items, new_price, condition)
+        done = set()
+        batch_operations = {}
+
+        try:
+            async for result in stream_update_listings(
+                stockx=self.stockx, 
+                items=items_to_update, 
+                batch_size=self.batch_size,
+            ):
+                self._index_results([result])
+                done.add(result.item)
+                yield result
+        except StockXIncompleteOperation as e:
+            done.update(result.item for result in e.partial_results)
+            batch_operations = e.batch_operations
+            self._index_results(e.partial_results, timed_out=True)
+            raise
+        finally:
+            self._journal_repriced(items_to_update, done, batch_operations)
+
+    def _reconciled(self, reconciliation: Reconciliation) -> None:
+        """Apply the results of reconciled batches to the index and journal."""
+        results = reconciliation.result()
+        self._index_results(results)
+        if self.journal is not None:
+            keys = self._reconciling.pop(reconciliation, {})
+            self.journal.record_applied(
+                keys=[keys[result.item] for result in results if result.item in keys]
+            )
+            self.journal.record_reconciled(reconciliation.batch_operations)
+
+    def _index_results(
+            self, 
+            results: list[UpdateResult], 
+            timed_out: bool = False,
+    ) -> list[UpdateResult]:
+        """Apply operation results to the index, if any."""
+        if self.index is not None:
+            self.index.apply(results)
+            if timed_out:
+                # Timed out operations may still change listings
+                self.index.invalidate()
+        return results
+
+    async def _reprice(
+            self,
+            items: Iterable[ListedItem],
+            new_price: Amount,
+            condition: Condition,
+    ) -> list[ListedItem]:
+        """Change the price of the items meeting the condition locally.
+        
+        Conditions and new prices are evaluated concurrently, then changes
+        are applied in the order of the items.
+        """
+        items = list(items)
+
+        async def evaluate(item: ListedItem) -> float | None:
             if await computed_value(item, condition):
-                # Change item's price if condition is met
-                change_to = await computed_value(item, new_price)
-                if change_to != item.price: # Avoid unnecessary updates
-                    item.price = change_to
-                    items_to_update.append(item)
+                return await computed_value(item, new_price)
+            return None
+
+        new_prices = await map_bounded(evaluate, items, limit=self.concurrency)
+
+        items_to_update = []
+        for item, change_to in zip(items, new_prices): 
+            # Change item's price if condition is met
+            if change_to is None:
+                continue
+            if change_to != item.price: # Avoid unnecessary updates
+                item.price = change_to
+                items_to_update.append(item)
 
         # Avoid unnecessary updates when calling Inventory.update()
         self._price_updates.difference_update(items_to_update)
 
-        # Sync changes to StockX
-        return await update_listings(self.stockx, items_to_update)
+        return items_to_update
     
     async def _beat_market_value(
             self,
@@ -401,6 +979,10 @@ class Inventory:
                 return market_value.amount * (1 - change)
             else:
                 return market_value.amount - change
+        
+        # Fetch market data once per product before evaluating the items
+        items = list(items)
+        await self.prefetch_market_data(items)
             
         return await self.change_price(items, new_price, condition)
 
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import AsyncIterable, Iterable
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, NamedTuple
 
+from ...concurrency import map_bounded
 from ...ext import search
 from ...models import Listing
 
@@ -10,7 +12,29 @@ if TYPE_CHECKING:
     from .inventory import Inventory
     from .market import ItemMarketData
     from ...api import StockX
-    from ...models import Currency
+    from ...models import Currency, Variant
+
+
+class SkuSizeRow(NamedTuple):
+    """
+    Row of an import file to create an item from.
+
+    Parameters
+    ----------
+    sku : `str`
+        The product SKU (StockX Style ID).
+    size : `str`
+        The product's US size.
+    price : `float`
+        The price of the item.
+    quantity : `int`, default 1
+        The quantity of the item.
+    """
+    sku: str
+    size: str
+    price: float
+    quantity: int = 1
+
 
 class Item:
     """
@@ -106,6 +130,84 @@ class Item:
             quantity=quantity
         )
 
+    @classmethod
+    async def from_sku_sizes(
+            cls,
+            stockx: StockX,
+            rows: Iterable[SkuSizeRow | tuple],
+            concurrency: int = 10,
+    ) -> tuple[list[Item], list[SkuSizeRow]]:
+        """
+        Create Item instances from many SKU and size rows at once.
+
+        Each distinct SKU is searched once and the variants of each product 
+        are fetched once, concurrently, instead of once per row as with 
+        `from_sku_size`.
+
+        Parameters
+        ----------
+        stockx : `StockX`
+            The StockX API interface instance.
+        rows : `Iterable[SkuSizeRow | tuple]`
+            Rows of SKU, size, price and optional quantity.
+        concurrency : `int`, default 10
+            Maximum number of concurrent requests.
+
+        Returns
+        -------
+        `tuple[list[Item], list[SkuSizeRow]]`
+            The created items and the rows whose product variant is not 
+            found, both in input order.
+
+        Examples
+        --------
+        >>> items, unresolved = await Item.from_sku_sizes(stockx, [
+        ...     ('CW2288-111', '9', 110.00),
+        ...     ('CW2288-111', '8.5', 110.00, 2),
+        ... ])
+        """
+        rows = [SkuSizeRow(*row) for row in rows]
+
+        skus = list(dict.fromkeys(row.sku for row in rows))
+        products = await map_bounded(
+            partial(search.product_by_sku, stockx), skus, limit=concurrency
+        )
+        product_ids = {
+            sku: product.id for sku, product in zip(skus, products) if product
+        }
+
+        unique_product_ids = list(dict.fromkeys(product_ids.values()))
+        all_variants = await map_bounded(
+            stockx.catalog.get_all_product_variants, 
+            unique_product_ids, 
+            limit=concurrency
+        )
+        variants_by_size: dict[str, dict[str, Variant]] = {}
+        for product_id, variants in zip(unique_product_ids, all_variants):
+            sizes = variants_by_size[product_id] = {}
+            for variant in variants:
+                # Keep the first variant of a size, like `from_sku_size`
+                sizes.setdefault(variant.variant_value, variant)
+
+        items = []
+        unresolved = []
+        for row in rows:
+            product_id = product_ids.get(row.sku)
+            variant = variants_by_size.get(product_id, {}).get(row.size)
+            if variant is None:
+                unresolved.append(row)
+                continue
+            items.append(
+                cls(
+                    product_id=product_id,
+                    variant_id=variant.id,
+                    price=row.price,
+                    quantity=row.quantity,
+                )
+            )
+
+        return items, unresolved
+
     @property
     def price(self) -> float:
         return self._price
@@ -220,6 +322,32 @@ class ListedItem:
         listings : `AsyncIterable[Listing]`
             Async iterable of listings to process.
 
+        Returns
+        -------
+        `list[ListedItem]`
+            List of created ListedItem instances.
+        """
+        return cls.from_listings(
+            inventory=inventory, 
+            listings=[listing async for listing in listings],
+        )
+    
+    @classmethod
+    def from_listings(
+            cls, 
+            inventory: Inventory,
+            listings: Iterable[Listing]
+    ) -> list[ListedItem]:
+        """
+        Group listings by variant and amount into ListedItem instances.
+
+        Parameters
+        ----------
+        inventory : `Inventory`
+            The inventory instance.
+        listings : `Iterable[Listing]`
+            Listings to group.
+
         Returns
         -------
         `list[ListedItem]`
@@ -227,7 +355,7 @@ class ListedItem:
         """
         items: dict[str, dict[float, ListedItem]] = {}
 
-        async for listing in listings:
+        for listing in listings:
             amounts_dict = items.setdefault(listing.variant.id, {})
             
             if listing.amount in amounts_dict:
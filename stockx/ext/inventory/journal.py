@@ -0,0 +1,256 @@
+from __future__ import annotations
+import json
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+from uuid import uuid4
+
+from ...format import pretty_str
+from ...logs import logger
+from ...models import BatchOperationType
+
+if TYPE_CHECKING:
+    from .item import ListedItem
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class JournaledChange:
+    """
+    Latest registered change of an item, not yet applied.
+
+    Prices and quantities are absolute targets, so replaying a change that
+    was already applied has no effect.
+
+    Parameters
+    ----------
+    key : `str`
+        Journal key of the item.
+    product_id : `str`
+        The item product ID.
+    variant_id : `str`
+        The item variant ID.
+    listing_ids : `tuple[str, ...]`
+        Listing IDs of the item when the change was registered.
+    price : `float`
+        Target price.
+    quantity : `int`
+        Target quantity.
+    """
+    key: str
+    product_id: str
+    variant_id: str
+    listing_ids: tuple[str, ...]
+    price: float
+    quantity: int
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class JournalState:
+    """
+    Unapplied changes and timed out batches recorded in a journal.
+
+    Parameters
+    ----------
+    changes : `tuple[JournaledChange, ...]`
+        Latest change of each item not marked as applied.
+    timed_out_batches : `dict[str, BatchOperationType]`
+        Operation of each batch that timed out and was not reconciled.
+    """
+    changes: tuple[JournaledChange, ...] = field(default_factory=tuple)
+    timed_out_batches: dict[str, BatchOperationType] = field(default_factory=dict)
+
+    def empty(self) -> bool:
+        return not self.changes and not self.timed_out_batches
+
+
+class Journal:
+    """
+    Append-only journal of inventory changes, for recovery after crashes.
+
+    Each registered price or quantity change is appended as a JSON line
+    before being applied. Applied changes and timed out batches are
+    recorded too, so that `Inventory.recover` can replay the changes that
+    were lost. The journal is compacted once nothing is pending.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike`
+        Journal file, created if missing.
+    fsync : `bool`, default False
+        If `True`, sync each record to disk. Records are always flushed,
+        which is enough to survive the process (but not the host) crashing.
+
+    Examples
+    --------
+    >>> journal = Journal('inventory.journal')
+    >>> async with Inventory(stockx, journal=journal) as inventory:
+    ...     await inventory.recover()   # Replay changes of a previous run
+    ...     for item in items:
+    ...         item.price -= 5
+    """
+
+    __slots__ = '_file', '_keys', 'fsync', 'path'
+
+    def __init__(self, path: str | os.PathLike, fsync: bool = False) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self._file: IO[str] | None = None
+        self._keys: dict[ListedItem, str] = {}
+
+    def record_change(self, item: ListedItem) -> None:
+        """Record the current price and quantity of an item as its target."""
+        key = self._keys.setdefault(item, uuid4().hex)
+        self._append({
+            'type': 'change',
+            'key': key,
+            'product_id': item.product_id,
+            'variant_id': item.variant_id,
+            'listing_ids': list(item.listing_ids),
+            'price': item.price,
+            'quantity': item.quantity,
+        })
+
+    def record_applied(
+            self, 
+            items: Iterable[ListedItem] = (), 
+            keys: Iterable[str] = (),
+    ) -> None:
+        """Mark the changes of items, or of journal keys, as applied."""
+        keys = [
+            *(key for item in items if (key := self._keys.pop(item, None))),
+            *keys,
+        ]
+        if keys:
+            self._append({'type': 'applied', 'keys': keys})
+
+    def detach(self, items: Iterable[ListedItem]) -> dict[ListedItem, str]:
+        """
+        Detach the keys of the items changes, e.g. once submitted.
+
+        Later changes of the items are recorded under new keys, so marking
+        the detached keys as applied doesn't cover them.
+        """
+        return {
+            item: key for item in items 
+            if (key := self._keys.pop(item, None))
+        }
+
+    def record_timed_out(
+            self, 
+            batch_operations: Mapping[str, BatchOperationType]
+    ) -> None:
+        """Record batches that timed out, to reconcile them on recovery."""
+        if batch_operations:
+            self._append({
+                'type': 'timed_out', 
+                'batches': {
+                    batch_id: operation.value 
+                    for batch_id, operation in batch_operations.items()
+                },
+            })
+
+    def record_reconciled(self, batch_ids: Iterable[str]) -> None:
+        """Mark timed out batches as reconciled."""
+        if batch_ids := list(batch_ids):
+            self._append({'type': 'reconciled', 'batch_ids': batch_ids})
+
+    def state(self) -> JournalState:
+        """Read the unapplied changes and unreconciled batches."""
+        changes: dict[str, JournaledChange] = {}
+        batches: dict[str, BatchOperationType] = {}
+
+        for record in self._records():
+            match record['type']:
+                case 'change':
+                    changes[record['key']] = JournaledChange(
+                        key=record['key'],
+                        product_id=record['product_id'],
+                        variant_id=record['variant_id'],
+                        listing_ids=tuple(record['listing_ids']),
+                        price=record['price'],
+                        quantity=record['quantity'],
+                    )
+                case 'applied':
+                    for key in record['keys']:
+                        changes.pop(key, None)
+                case 'timed_out':
+                    batches.update(
+                        (batch_id, BatchOperationType(operation))
+                        for batch_id, operation in record['batches'].items()
+                    )
+                case 'reconciled':
+                    for batch_id in record['batch_ids']:
+                        batches.pop(batch_id, None)
+
+        return JournalState(tuple(changes.values()), batches)
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the pending records."""
+        state = self.state()
+        self.close()
+
+        temporary = self.path.with_name(f'{self.path.name}.tmp')
+        with temporary.open('w', encoding='utf-8') as file:
+            for change in state.changes:
+                record = {'type': 'change', **_change_json(change)}
+                file.write(json.dumps(record) + '\n')
+            if state.timed_out_batches:
+                record = {
+                    'type': 'timed_out',
+                    'batches': {
+                        batch_id: operation.value
+                        for batch_id, operation in state.timed_out_batches.items()
+                    },
+                }
+                file.write(json.dumps(record) + '\n')
+        temporary.replace(self.path)
+
+        # Keep the keys of the pending changes of this session only
+        pending = {change.key for change in state.changes}
+        self._keys = {
+            item: key for item, key in self._keys.items() if key in pending
+        }
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: dict) -> None:
+        if self._file is None:
+            self._file = self.path.open('a', encoding='utf-8')
+        record['at'] = datetime.now(timezone.utc).isoformat()
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _records(self) -> Iterable[dict]:
+        if self._file is not None:
+            self._file.flush()
+        if not self.path.exists():
+            return
+        with self.path.open(encoding='utf-8') as file:
+            for number, line in enumerate(file, start=1):
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash while appending leaves a partial last line
+                    logger.warning(f'Skipping corrupt journal line {number}.')
+
+
+def _change_json(change: JournaledChange) -> dict:
+    return {
+        'key': change.key,
+        'product_id': change.product_id,
+        'variant_id': change.variant_id,
+        'listing_ids': list(change.listing_ids),
+        'price': change.price,
+        'quantity': change.quantity,
+    }
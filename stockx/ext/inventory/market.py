@@ -1,7 +1,9 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 from typing import NamedTuple
 
+from ...concurrency import map_bounded
 from ...format import pretty_str    
 from ...models import Currency, MarketData
 
@@ -85,3 +87,92 @@ def create_item_market_data(
         sell_faster=market_value(market_data.sell_faster_amount),
         flex_lowest_ask=market_value(market_data.flex_lowest_ask_amount),
     )
+
+
+VariantsMarketData = dict[str, ItemMarketData]
+
+
+class MarketSnapshot:
+    """
+    Market data index keyed by product ID and then variant ID.
+
+    Market data is fetched once per product for all its variants, and
+    payouts are computed once when the product is indexed. Concurrent 
+    lookups for variants of the same product share a single fetch.
+
+    Parameters
+    ----------
+    fetch : `Callable[[str], Awaitable[list[MarketData]]]`
+        Function that fetches the market data of all variants of a product.
+    payout_calculator : `Callable[[float], float]`
+        Function that calculates the payout for a given amount.
+    ttl : `float`, default 30.0
+        Seconds after which the market data of a product is fetched again.
+    """
+
+    __slots__ = '_products', 'fetch', 'payout_calculator', 'ttl'
+
+    def __init__(
+            self,
+            fetch: Callable[[str], Awaitable[list[MarketData]]],
+            payout_calculator: Callable[[float], float],
+            ttl: float = 30.0,
+    ) -> None:
+        self.fetch = fetch
+        self.payout_calculator = payout_calculator
+        self.ttl = ttl
+        self._products: dict[
+            str, tuple[float, asyncio.Future[VariantsMarketData]]
+        ] = {}
+
+    async def product(self, product_id: str) -> VariantsMarketData:
+        """Get the market data of all variants of a product by variant ID."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        fetched_at, future = self._products.get(product_id, (None, None))
+        if future is None or now - fetched_at > self.ttl:
+            future = asyncio.ensure_future(self._index(product_id))
+            self._products[product_id] = (now, future)
+
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # Don't keep failed fetches in the snapshot
+            if self._products.get(product_id, (None, None))[1] is future:
+                del self._products[product_id]
+            raise
+
+    async def variant(
+            self, 
+            product_id: str, 
+            variant_id: str
+    ) -> ItemMarketData | None:
+        """Get the market data of a variant, if available."""
+        variants = await self.product(product_id)
+        return variants.get(variant_id)
+    
+    async def prefetch(
+            self, 
+            product_ids: Iterable[str], 
+            limit: int = 50
+    ) -> None:
+        """Fetch the market data of multiple products concurrently."""
+        await map_bounded(self.product, dict.fromkeys(product_ids), limit=limit)
+
+    def invalidate(self, product_id: str | None = None) -> None:
+        """Discard the market data of a product, or of all products."""
+        if product_id is None:
+            self._products.clear()
+        else:
+            self._products.pop(product_id, None)
+
+    async def _index(self, product_id: str) -> VariantsMarketData:
+        market_data = await self.fetch(product_id)
+        return {
+            data.variant_id: create_item_market_data(
+                market_data=data, 
+                payout_calculator=self.payout_calculator
+            )
+            for data in market_data
+        }
@@ -0,0 +1,374 @@
+"""
+Vectorized payout and pricing calculations for bulk repricing.
+
+Pricing strategies are plain functions of a `PricingInputs` table, written
+as vector expressions over its columns. With NumPy installed
+(`pip install python-stockx[numpy]`) a strategy is evaluated once over
+whole arrays; otherwise the same strategy is evaluated row by row with
+scalar values. Missing market values are `nan`, and a `nan` new price
+keeps the current price.
+
+Examples
+--------
+Beat the Lowest Ask by 1 where the payout stays above 150:
+>>> def undercut(c: PricingInputs):
+...     new_price = c.lowest_ask - 1
+...     return where(c.payout(new_price) > 150, new_price, c.price)
+...
+>>> inputs = await inventory.pricing_inputs(items)
+>>> result = inventory.evaluate_pricing(inputs, undercut)
+>>> result.changes()
+[(ListedItem(...), 189.0), ...]
+"""
+
+from __future__ import annotations
+import math
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from .item import ListedItem
+    from .market import ItemMarketData
+
+
+# A float, a sequence of floats or a NumPy array
+Values = Any
+PricingStrategy = Callable[['PricingInputs'], Values]
+
+MARKET_VALUES = (
+    'lowest_ask',
+    'highest_bid',
+    'earn_more',
+    'sell_faster',
+    'flex_lowest_ask',
+)
+
+
+class Fees(NamedTuple):
+    """
+    Seller fees used to calculate payouts.
+
+    Parameters
+    ----------
+    transaction_fee : `float`
+        Transaction fee rate.
+    payment_fee : `float`
+        Payment processing fee rate.
+    shipping_fee : `float`
+        Fixed shipping fee.
+    minimum_transaction_fee : `float`
+        Minimum transaction fee amount.
+    """
+    transaction_fee: float
+    payment_fee: float
+    shipping_fee: float
+    minimum_transaction_fee: float
+
+
+def calculate_payouts(amounts: Values, fees: Fees) -> Values:
+    """
+    Calculate the net payouts for listing (or Ask) amounts.
+
+    Parameters
+    ----------
+    amounts : `Values`
+        A single amount, a sequence or an array of amounts.
+    fees : `Fees`
+        Seller fees to deduct.
+
+    Returns
+    -------
+    `Values`
+        Payouts after deducting transaction fees (with the minimum
+        transaction fee floor), payment fees and shipping costs. An array
+        if NumPy is installed and `amounts` is not a scalar.
+    """
+    if isinstance(amounts, int | float):
+        return _payout(amounts, fees)
+    if np is None:
+        return tuple(_payout(amount, fees) for amount in amounts)
+
+    amounts = np.asarray(amounts, dtype=float)
+    transaction_fee = np.maximum(
+        amounts * fees.transaction_fee,
+        fees.minimum_transaction_fee
+    )
+    return (
+        amounts
+        - transaction_fee
+        - amounts * fees.payment_fee
+        - fees.shipping_fee
+    )
+
+
+def _payout(amount: float, fees: Fees) -> float:
+    transaction_fee = max(
+        amount * fees.transaction_fee,
+        fees.minimum_transaction_fee
+    )
+    return amount - transaction_fee - amount * fees.payment_fee - fees.shipping_fee
+
+
+def where(condition: Values, x: Values, y: Values) -> Values:
+    """Choose `x` where `condition` is true and `y` elsewhere."""
+    if isinstance(condition, bool) or np is None:
+        return x if condition else y
+    return np.where(condition, x, y)
+
+
+def isnan(values: Values) -> Values:
+    """Check which values are missing."""
+    if np is None:
+        if isinstance(values, int | float):
+            return math.isnan(values)
+        return tuple(math.isnan(value) for value in values)
+    return np.isnan(values)
+
+
+def column(values: Iterable[float | None]) -> Values:
+    """Create a column of values, with `None` values as `nan`."""
+    values = tuple(math.nan if value is None else value for value in values)
+    return values if np is None else np.array(values, dtype=float)
+
+
+@dataclass(slots=True, frozen=True)
+class PricingInputs:
+    """
+    Column table of items prices and market values.
+
+    Each column holds one value per item, in the order of `items`, as a
+    NumPy array if available or as a tuple of floats otherwise. Missing
+    market values are `nan`.
+
+    Parameters
+    ----------
+    items : `tuple[ListedItem, ...]`
+        The items being priced.
+    fees : `Fees`
+        Seller fees used to calculate payouts.
+    price : `Values`
+        Current listing prices.
+    quantity : `Values`
+        Listed quantities.
+    lowest_ask : `Values`
+        Lowest Ask amounts.
+    highest_bid : `Values`
+        Highest Bid amounts.
+    earn_more : `Values`
+        Earn More amounts.
+    sell_faster : `Values`
+        Sell Faster amounts.
+    flex_lowest_ask : `Values`
+        Flex Lowest Ask amounts.
+    """
+    items: tuple[ListedItem, ...]
+    fees: Fees
+    price: Values
+    quantity: Values
+    lowest_ask: Values
+    highest_bid: Values
+    earn_more: Values
+    sell_faster: Values
+    flex_lowest_ask: Values
+
+    @classmethod
+    def from_items(
+            cls,
+            items: Iterable[ListedItem],
+            market_data: Iterable[ItemMarketData],
+            fees: Fees,
+    ) -> PricingInputs:
+        """Build the table from items and their market data, in the same order."""
+        items = tuple(items)
+        market_data = tuple(market_data)
+        if len(items) != len(market_data):
+            raise ValueError('Items and market data must have the same length.')
+
+        market_columns = {
+            name: column(
+                value.amount if (value := getattr(data, name)) else None
+                for data in market_data
+            )
+            for name in MARKET_VALUES
+        }
+        return cls(
+            items=items,
+            fees=fees,
+            price=column(item.price for item in items),
+            quantity=column(item.quantity for item in items),
+            **market_columns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def payout(self, amounts: Values) -> Values:
+        """Calculate the payouts for the given amounts."""
+        return calculate_payouts(amounts, self.fees)
+
+    def rows(self) -> Iterator[PricingInputs]:
+        """Iterate over single-item inputs with scalar values."""
+        columns = ('price', 'quantity', *MARKET_VALUES)
+        for i, item in enumerate(self.items):
+            yield replace(
+                self,
+                items=(item,),
+                **{name: float(getattr(self, name)[i]) for name in columns},
+            )
+
+
+@dataclass(slots=True, frozen=True)
+class PricingResult:
+    """
+    New prices computed by a pricing strategy.
+
+    Parameters
+    ----------
+    inputs : `PricingInputs`
+        The inputs the strategy was evaluated on.
+    new_prices : `Values`
+        New price of each item. Items with no new price keep their price.
+    payouts : `Values`
+        Payout of each item at its new price.
+    changed : `Values`
+        Whether the price of each item changes.
+    """
+    inputs: PricingInputs
+    new_prices: Values
+    payouts: Values
+    changed: Values
+
+    def changes(self) -> list[tuple[ListedItem, float]]:
+        """Get the items whose price changes, with their new price."""
+        return [
+            (item, float(new_price))
+            for item, new_price, changed
+            in zip(self.inputs.items, self.new_prices, self.changed)
+            if changed
+        ]
+
+
+def evaluate_pricing(
+        inputs: PricingInputs,
+        strategy: PricingStrategy,
+) -> PricingResult:
+    """
+    Evaluate a pricing strategy on all items at once.
+
+    Parameters
+    ----------
+    inputs : `PricingInputs`
+        Prices and market values of the items.
+    strategy : `PricingStrategy`
+        Function returning the new prices for the inputs. Can return a
+        scalar to set the same price on all items.
+
+    Returns
+    -------
+    `PricingResult`
+        New prices, payouts and change mask.
+    """
+    if np is not None:
+        new_prices = np.broadcast_to(
+            np.asarray(strategy(inputs), dtype=float),
+            (len(inputs),)
+        )
+        new_prices = np.where(np.isnan(new_prices), inputs.price, new_prices)
+        changed = new_prices != inputs.price
+    else:
+        new_prices = tuple(
+            price if math.isnan(new_price := float(strategy(row))) else new_price
+            for row, price in zip(inputs.rows(), inputs.price)
+        )
+        changed = tuple(
+            new_price != price
+            for new_price, price in zip(new_prices, inputs.price)
+        )
+
+    return PricingResult(
+        inputs=inputs,
+        new_prices=new_prices,
+        payouts=inputs.payout(new_prices),
+        changed=changed,
+    )
+
+
+def beat_market_value(
+        market_value: str,
+        beat_by: float = 0,
+        percentage: bool = False,
+        condition: Callable[[PricingInputs], Values] | None = None,
+) -> PricingStrategy:
+    """
+    Create a strategy beating a market value, like `Inventory.beat_lowest_ask`.
+
+    Items without the market value, or already priced at it, keep their price.
+
+    Parameters
+    ----------
+    market_value : `str`
+        Name of the market value column, e.g. `'lowest_ask'`.
+    beat_by : `float`, default 0
+        Amount to beat the market value by.
+    percentage : `bool`, default False
+        If `True`, beat_by is treated as percentage on the market value.
+    condition : `Callable[[PricingInputs], Values] | None`, optional
+        Vector condition that must be met to change the price.
+
+    Returns
+    -------
+    `PricingStrategy`
+        The pricing strategy.
+    """
+    if market_value not in MARKET_VALUES:
+        raise ValueError(f'Unknown market value: {market_value}')
+
+    def strategy(c: PricingInputs) -> Values:
+        value = getattr(c, market_value)
+        new_price = value * (1 - beat_by) if percentage else value - beat_by
+        new_price = where(value == c.price, c.price, new_price)
+        if condition is None:
+            return new_price
+        return where(condition(c), new_price, c.price)
+
+    return strategy
+
+
+def beat_lowest_ask(
+        beat_by: float = 1,
+        percentage: bool = False,
+        condition: Callable[[PricingInputs], Values] | None = None,
+) -> PricingStrategy:
+    """Strategy beating the Lowest Ask. See `beat_market_value`."""
+    return beat_market_value('lowest_ask', beat_by, percentage, condition)
+
+
+def beat_sell_faster(
+        beat_by: float = 0,
+        percentage: bool = False,
+        condition: Callable[[PricingInputs], Values] | None = None,
+) -> PricingStrategy:
+    """Strategy beating the "Sell Faster" price. See `beat_market_value`."""
+    return beat_market_value('sell_faster', beat_by, percentage, condition)
+
+
+def beat_earn_more(
+        beat_by: float = 0,
+        percentage: bool = False,
+        condition: Callable[[PricingInputs], Values] | None = None,
+) -> PricingStrategy:
+    """Strategy beating the "Earn More" price. See `beat_market_value`."""
+    return beat_market_value('earn_more', beat_by, percentage, condition)
+
+
+def accept_highest_bid(
+        condition: Callable[[PricingInputs], Values] | None = None,
+) -> PricingStrategy:
+    """Strategy accepting the Highest Bid. See `beat_market_value`."""
+    return beat_market_value('highest_bid', condition=condition)
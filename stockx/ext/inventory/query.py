@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import ( 
-    AsyncIterable, 
     AsyncIterator, 
     Callable,
     Iterable,
 )
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from math import ceil
+from operator import attrgetter
 from typing import TYPE_CHECKING
     
 from .item import ListedItem
-from ...filter import Filter
+from ..search import product_by_sku
+from ...concurrency import map_bounded
+from ...filter import Filter, compile_filters
+from ...format import pretty_str
+from ...logs import logger
 from ...models import Listing, ListingStatus
 
 if TYPE_CHECKING:
@@ -18,6 +27,94 @@ if TYPE_CHECKING:
 
 ANY = None
 
+PAGE_SIZE = 100
+
+
+class AccessPath(Enum):
+    """How listings are retrieved for a query.
+
+    - `INDEX`: from the inventory local index
+    - `TARGETED`: listings requested by product and/or variant IDs
+    - `FULL_SCAN`: all active listings requested
+    - `EMPTY`: no listing can match the filters, nothing is requested
+    """
+    INDEX = 'index'
+    TARGETED = 'targeted'
+    FULL_SCAN = 'full_scan'
+    EMPTY = 'empty'
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class QueryPlan:
+    """
+    Describes how an `ItemsQuery` retrieves listings.
+
+    Parameters
+    ----------
+    access_path : `AccessPath`
+        How listings are retrieved.
+    product_ids : `frozenset[str] | None`
+        Product IDs the listings are requested for, all if `None`.
+    variant_ids : `frozenset[str] | None`
+        Variant IDs the listings are requested for, all if `None`.
+    server_filters : `tuple[str, ...]`
+        Filters applied by StockX through the requested IDs.
+    memory_filters : `tuple[str, ...]`
+        Filters and custom conditions applied in-memory.
+    lookups : `int`
+        Catalog lookups to resolve style IDs and sizes. Lookups are cached,
+        so repeated queries may not perform requests.
+    estimated_rows : `int | None`
+        Listings to scan, if counted.
+    estimated_pages : `int | None`
+        Listing pages to request, if counted.
+    estimated_requests : `int | None`
+        Total requests including lookups, if counted.
+    """
+    access_path: AccessPath
+    product_ids: frozenset[str] | None = None
+    variant_ids: frozenset[str] | None = None
+    server_filters: tuple[str, ...] = field(default_factory=tuple)
+    memory_filters: tuple[str, ...] = field(default_factory=tuple)
+    lookups: int = 0
+    estimated_rows: int | None = None
+    estimated_pages: int | None = None
+    estimated_requests: int | None = None
+
+
+@pretty_str
+@dataclass(slots=True)
+class QueryStats:
+    """
+    Execution statistics of an `ItemsQuery`.
+
+    Parameters
+    ----------
+    access_path : `AccessPath | None`
+        How listings were retrieved.
+    estimated_pages : `int`
+        Listing pages requested, estimated from the listings scanned (short
+        pages are not detected).
+    estimated_requests : `int`
+        Catalog lookups planned plus the estimated listing pages.
+    listings_scanned : `int`
+        Listings retrieved.
+    listings_matched : `int`
+        Listings matching the filters.
+    items_returned : `int`
+        Items returned after custom conditions.
+    elapsed : `float`
+        Execution time in seconds.
+    """
+    access_path: AccessPath | None = None
+    estimated_pages: int = 0
+    estimated_requests: int = 0
+    listings_scanned: int = 0
+    listings_matched: int = 0
+    items_returned: int = 0
+    elapsed: float = 0.0
+
 
 class ItemsQuery:
     """
@@ -32,93 +129,404 @@ class ItemsQuery:
     -----
     Performance considerations:
     - Filtering by `product_ids` / `variant_ids` uses targeted API requests
-    - Other filters (`style_ids`, `sizes`) require retrieving all listings
-    - Custom filter conditions are always applied in-memory
+    - `style_ids` are resolved to product IDs with catalog searches (cached),
+      and `sizes` to variant IDs of the targeted products, so that they 
+      also use targeted API requests
+    - `sizes` alone, or style IDs that can't be resolved to a product with
+      that exact style ID, require retrieving all listings
+    - All filters are also applied in-memory, as well as custom conditions
     - For best performance, prefer `product_ids` / `variant_ids` filters 
       when possible
+    - If the inventory has an `InventoryIndex`, queries are answered from 
+      the index, which is synced incrementally when stale
     """
 
-    __slots__ = '_conditions', '_filters', '_inventory'
+    __slots__ = '_conditions', '_filters', '_inventory', 'stats'
 
     def __init__(self, inventory: Inventory) -> None:
         self._inventory = inventory
         self._filters = {
             'product_ids': Filter(
                 Listing, 
-                getter=lambda listing: listing.product.id, 
-                condition=lambda product_id, allowed: product_id in allowed
+                getter=attrgetter('product.product_id'), 
             ),
             'variant_ids': Filter(
                 Listing, 
-                getter=lambda listing: listing.variant.id, 
-                condition=lambda variant_id, allowed: variant_id in allowed
+                getter=attrgetter('variant.variant_id'), 
             ),
             'style_ids': Filter(
                 Listing, 
-                getter=lambda listing: listing.style_id.split('/'), 
-                condition=lambda style_ids, allowed: not (
-                    set(style_ids).isdisjoint(allowed)
-                )
+                getter=attrgetter('product.style_id'), 
+                # Style IDs of a listing are joined by '/'
+                condition=lambda style_id, allowed: not (
+                    allowed.isdisjoint(style_id.split('/'))
+                ),
+                memoize=True,
             ),
             'sizes': Filter(
                 Listing, 
-                getter=lambda listing: listing.variant_value, 
-                condition=lambda size, allowed: size in allowed
+                getter=attrgetter('variant.variant_value'), 
             ),
         }
         self._conditions = list()
+        self.stats: QueryStats | None = None
 
     async def all(self) -> list[ListedItem]:
         """
         Retrieve all items matching the query filters.
 
+        Execution statistics are available in `stats` afterwards.
+
         Returns
         -------
         `list[ListedItem]`
             List of items matching all filter conditions.
         """
-        items = await ListedItem.from_inventory_listings(
-            inventory=self._inventory,
-            listings=self._listings(),
-        )
+        return [item async for item in self._items(partitioned=False)]
+    
+    async def stream(self) -> AsyncIterator[ListedItem]:
+        """
+        Yield items matching the query filters as soon as they are complete.
+
+        Items are yielded product by product, once all the listings of a
+        product are retrieved:
+
+        - Targeted queries request listings one product (or variant) at a 
+          time, up to the inventory `concurrency` at once, and yield the 
+          items of each product as its requests complete.
+        - Full scans count the active listings of each product when it is
+          first scanned, and yield its items as soon as they are all 
+          scanned, while the rest of the inventory is still loading.
+        - Queries answered from the index yield the items of each product
+          of the index.
+
+        Custom conditions are applied as items are yielded.
+
+        Partitioning takes at least one request per product, so prefer 
+        `all()` when many products have few listings each.
+
+        Examples
+        --------
+        >>> query = inventory.items().filter_by(style_ids=skus)
+        >>> async for item in query.stream():
+        ...     item.price -= 5     # Start repricing the first products
+        """
+        async for item in self._items(partitioned=True):
+            yield item
+
+    async def _items(self, partitioned: bool) -> AsyncIterator[ListedItem]:
+        stats = self.stats = QueryStats()
+        started_at = time.perf_counter()
+
+        plan = await self._plan()
+        stats.access_path = plan.access_path
+        stats.estimated_requests += plan.lookups
+
+        match = compile_filters(self._filters.values())
+
+        async for listings in self._groups(plan, stats, partitioned):
+            matched = [listing for listing in listings if match(listing)]
+            stats.listings_matched += len(matched)
+            items = ListedItem.from_listings(
+                inventory=self._inventory, 
+                listings=matched,
+            )
+            for item in items:
+                if all(condition(item) for condition in self._conditions):
+                    stats.items_returned += 1
+                    stats.elapsed = time.perf_counter() - started_at
+                    yield item
+
+        stats.elapsed = time.perf_counter() - started_at
+
+    async def _groups(
+            self, 
+            plan: QueryPlan, 
+            stats: QueryStats, 
+            partitioned: bool,
+    ) -> AsyncIterator[list[Listing]]:
+        """Yield groups of listings, each with all listings of its items."""
+        if not partitioned:
+            yield [listing async for listing in self._listings(plan, stats)]
+        elif plan.access_path is AccessPath.TARGETED:
+            async for listings in self._partitioned(plan, stats):
+                yield listings
+        elif plan.access_path is AccessPath.FULL_SCAN:
+            async for listings in self._scan_by_product(plan, stats):
+                yield listings
+        elif plan.access_path is AccessPath.INDEX:
+            products: dict[str, list[Listing]] = {}
+            async for listing in self._listings(plan, stats):
+                products.setdefault(listing.product.id, []).append(listing)
+            for listings in products.values():
+                yield listings
+
+    async def _partitioned(
+            self, 
+            plan: QueryPlan, 
+            stats: QueryStats,
+    ) -> AsyncIterator[list[Listing]]:
+        """Yield the listings of each partition of a targeted plan as they
+        are retrieved, retrieving up to `concurrency` partitions at a time."""
+        semaphore = asyncio.Semaphore(self._inventory.concurrency)
+
+        async def retrieve(partition: QueryPlan) -> list[Listing]:
+            async with semaphore:
+                return [
+                    listing async for listing in self._listings(partition, stats)
+                ]
 
+        tasks = [
+            asyncio.ensure_future(retrieve(partition)) 
+            for partition in self._partitions(plan)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _scan_by_product(
+            self, 
+            plan: QueryPlan, 
+            stats: QueryStats,
+    ) -> AsyncIterator[list[Listing]]:
+        """Yield the listings of each product of a full scan as soon as its
+        active listings, counted when the product is first scanned, are all
+        scanned. Products not complete are yielded at the end of the scan,
+        e.g. when their listings changed during the scan."""
+        stockx = self._inventory.stockx
+        semaphore = asyncio.Semaphore(self._inventory.concurrency)
+        # Scanned listings, product IDs counted, and None when scanned
+        events: asyncio.Queue[Listing | str | None] = asyncio.Queue()
+
+        async def scan() -> None:
+            try:
+                async for listing in self._listings(plan, stats):
+                    events.put_nowait(listing)
+            finally:
+                events.put_nowait(None)
+
+        async def count(product_id: str) -> int:
+            async with semaphore:
+                return await stockx.listings.count_listings(
+                    product_ids=[product_id],
+                    listing_statuses=[ListingStatus.ACTIVE],
+                )
+
+        scanner = asyncio.ensure_future(scan())
+        counts: dict[str, asyncio.Future[int]] = {}
+        products: dict[str, list[Listing]] = {}
+        try:
+            while (event := await events.get()) is not None:
+                if isinstance(event, str):
+                    product_id = event
+                else:
+                    product_id = event.product.id
+                    products.setdefault(product_id, []).append(event)
+                    if product_id not in counts:
+                        counts[product_id] = asyncio.ensure_future(
+                            count(product_id)
+                        )
+                        counts[product_id].add_done_callback(
+                            lambda _, product_id=product_id: (
+                                events.put_nowait(product_id)
+                            )
+                        )
+                        stats.estimated_requests += 1
+
+                counted = counts[product_id]
+                if (
+                    product_id in products
+                    and counted.done() 
+                    and not counted.cancelled()
+                    and counted.exception() is None
+                    and len(products[product_id]) >= counted.result()
+                ):
+                    yield products.pop(product_id)
+
+            scanner.result()  # Propagate scan errors
+            for listings in products.values():
+                yield listings
+        finally:
+            scanner.cancel()
+            for counted in counts.values():
+                counted.cancel()
+
+    @staticmethod
+    def _partitions(plan: QueryPlan) -> list[QueryPlan]:
+        """Split a targeted plan in one plan per product, or per variant."""
+        if plan.access_path is not AccessPath.TARGETED:
+            return [plan]
+        if plan.product_ids:
+            return [
+                replace(plan, product_ids=frozenset({product_id}))
+                for product_id in sorted(plan.product_ids)
+            ]
         return [
-            item for item in items
-            if all(condition(item) for condition in self._conditions)
+            replace(plan, variant_ids=frozenset({variant_id}))
+            for variant_id in sorted(plan.variant_ids)
         ]
     
-    def _listings(self) -> AsyncIterator[Listing]:
-        if all(
-            _filter.empty()
-            for key, _filter in self._filters.items()
-            if key not in ('product_ids', 'variant_ids')
-        ):
-            # filter by variant_id and product_id if no other filters are applied
-            product_ids = self._filters['product_ids'].allowed_values
-            variant_ids = self._filters['variant_ids'].allowed_values
-            filtered = lambda x: x
-        else:
-            # otherwise retrieve all
-            product_ids, variant_ids = None, None
-            filtered = self._filtered
-
-        return filtered(
-            self._inventory.stockx.listings.get_all_listings(
-                product_ids=product_ids,
-                variant_ids=variant_ids,
-                listing_statuses=[ListingStatus.ACTIVE], 
-                page_size=100,
-            )
+    async def explain(self, count: bool = False) -> QueryPlan:
+        """
+        Describe how the query would be executed, without retrieving listings.
+
+        Resolving `style_ids` and `sizes` filters may perform catalog 
+        requests, which are cached and reused by the query execution.
+
+        Parameters
+        ----------
+        count : `bool`, default False
+            If `True`, count the listings to scan with one extra request to
+            estimate the number of pages and requests.
+
+        Returns
+        -------
+        `QueryPlan`
+            The access path, filters location and estimated requests.
+
+        Examples
+        --------
+        >>> plan = await inventory.items().filter_by(sizes=['10']).explain()
+        >>> plan.access_path
+        <AccessPath.FULL_SCAN: 'full_scan'>
+        """
+        plan = await self._plan()
+        if not count or plan.access_path in (AccessPath.INDEX, AccessPath.EMPTY):
+            return plan
+        
+        rows = await self._inventory.stockx.listings.count_listings(
+            product_ids=plan.product_ids,
+            variant_ids=plan.variant_ids,
+            listing_statuses=[ListingStatus.ACTIVE],
+        )
+        pages = max(1, ceil(rows / PAGE_SIZE))
+        return replace(
+            plan, 
+            estimated_rows=rows, 
+            estimated_pages=pages, 
+            estimated_requests=plan.lookups + pages,
         )
     
-    async def _filtered(
+    async def _listings(
             self, 
-            listings: AsyncIterable[Listing],
-            /,
+            plan: QueryPlan, 
+            stats: QueryStats,
     ) -> AsyncIterator[Listing]:
-        async for listing in listings:
-            if all(_filter.match(listing) for _filter in self._filters.values()):
+        """Yield the listings to scan for a plan, filtered in-memory later."""
+        if plan.access_path is AccessPath.EMPTY:
+            return  # No listing can match the filters
+        
+        if plan.access_path is AccessPath.INDEX:
+            index = self._inventory.index
+            await index.refresh(self._inventory.stockx)
+            listings = index.listings(plan.product_ids, plan.variant_ids)
+            for listing in listings:
+                stats.listings_scanned += 1
                 yield listing
+            return
+
+        scanned = 0
+        async for listing in self._inventory.stockx.listings.get_all_listings(
+            product_ids=plan.product_ids,
+            variant_ids=plan.variant_ids,
+            listing_statuses=[ListingStatus.ACTIVE], 
+            page_size=PAGE_SIZE,
+        ):
+            scanned += 1
+            stats.listings_scanned += 1
+            yield listing
+
+        pages = max(1, ceil(scanned / PAGE_SIZE))
+        stats.estimated_pages += pages
+        stats.estimated_requests += pages
+
+    async def _plan(self) -> QueryPlan:
+        """Resolve the filters to the product and variant IDs to request."""
+        filters = {key: f.allowed_values for key, f in self._filters.items()}
+        memory_filters = [key for key, values in filters.items() if values]
+        memory_filters += [f'filter({i})' for i in range(len(self._conditions))]
+        
+        if self._inventory.index is not None:
+            return QueryPlan(
+                access_path=AccessPath.INDEX,
+                product_ids=frozenset(filters['product_ids']) or None,
+                variant_ids=frozenset(filters['variant_ids']) or None,
+                memory_filters=tuple(memory_filters),
+                estimated_requests=0,
+            )
+
+        stockx = self._inventory.stockx
+        product_ids = set(filters['product_ids']) or None
+        variant_ids = set(filters['variant_ids']) or None
+        server_filters = [
+            key for key in ('product_ids', 'variant_ids') if filters[key]
+        ]
+        lookups = 0
+
+        if style_ids := filters['style_ids']:
+            products = await map_bounded(
+                lambda style_id: product_by_sku(stockx, style_id), 
+                style_ids,
+                limit=self._inventory.concurrency,
+            )
+            lookups += len(style_ids)
+            # Search hits may only contain the style ID, like a partial match
+            if all(
+                product is not None and style_id in product.style_id.split('/')
+                for style_id, product in zip(style_ids, products)
+            ):
+                style_product_ids = {product.id for product in products}
+                product_ids = (
+                    style_product_ids if product_ids is None 
+                    else product_ids & style_product_ids
+                )
+                server_filters.append('style_ids')
+            else:
+                logger.debug('Unresolved style IDs, retrieving all listings.')
+        
+        if (sizes := filters['sizes']) and product_ids:
+            variants = await map_bounded(
+                stockx.catalog.get_all_product_variants, 
+                product_ids,
+                limit=self._inventory.concurrency,
+            )
+            lookups += len(product_ids)
+            size_variant_ids = {
+                variant.id 
+                for product_variants in variants 
+                for variant in product_variants
+                if variant.variant_value in sizes
+            }
+            variant_ids = (
+                size_variant_ids if variant_ids is None 
+                else variant_ids & size_variant_ids
+            )
+            server_filters.append('sizes')
+
+        if product_ids is not None and not product_ids:
+            access_path = AccessPath.EMPTY
+        elif variant_ids is not None and not variant_ids:
+            access_path = AccessPath.EMPTY
+        elif product_ids or variant_ids:
+            access_path = AccessPath.TARGETED
+        else:
+            access_path = AccessPath.FULL_SCAN
+
+        empty = access_path is AccessPath.EMPTY
+        return QueryPlan(
+            access_path=access_path,
+            product_ids=frozenset(product_ids) if product_ids else None,
+            variant_ids=frozenset(variant_ids) if variant_ids else None,
+            server_filters=tuple(server_filters),
+            memory_filters=tuple(memory_filters),
+            lookups=lookups,
+            estimated_rows=0 if empty else None,
+            estimated_pages=0 if empty else None,
+            estimated_requests=lookups if empty else None,
+        )
 
     def filter(
             self, 
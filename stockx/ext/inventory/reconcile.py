@@ -0,0 +1,358 @@
+from __future__ import annotations
+import asyncio
+from collections.abc import Callable, Generator, Iterable, Mapping
+from itertools import chain
+from typing import Any
+
+from .batch.operations import batch_getters
+from .batch.results import UpdateResult
+from .item import Item, ListedItem
+from ...api import StockX
+from ...api.batch import batch_results
+from ...errors import StockXBatchTimeout, StockXIncompleteOperation
+from ...logs import logger
+from ...models import BatchOperationType
+
+
+Callback = Callable[['Reconciliation'], Any]
+
+
+class Reconciliation:
+    """
+    Awaitable handle of timed out batches being reconciled in background.
+
+    Awaiting the handle returns the item results of the batches once they
+    all complete, like the operation that timed out would have.
+
+    Parameters
+    ----------
+    batch_operations : `dict[str, BatchOperationType]`
+        Operation of each reconciled batch.
+    items : `tuple[Item | ListedItem, ...]`
+        Items the batch operations were performed on.
+
+    Raises
+    ------
+    `StockXIncompleteOperation`
+        When awaited, if some batches are still queued after the reconciler
+        timeout. The exception contains the results of the other batches.
+    """
+
+    __slots__ = '_callbacks', '_task', 'batch_operations', 'items'
+
+    def __init__(
+            self,
+            batch_operations: Mapping[str, BatchOperationType],
+            items: Iterable[Item | ListedItem],
+    ) -> None:
+        self.batch_operations = dict(batch_operations)
+        self.items = tuple(items)
+        self._callbacks: list[Callback] = []
+        self._task: asyncio.Task[list[UpdateResult]] | None = None
+
+    def __await__(self) -> Generator[Any, None, list[UpdateResult]]:
+        return asyncio.shield(self._task).__await__()
+
+    def done(self) -> bool:
+        """Whether all batches completed, or the reconciliation stopped."""
+        return self._task.done()
+
+    def result(self) -> list[UpdateResult]:
+        """Get the item results of a done reconciliation."""
+        return self._task.result()
+
+    def cancel(self) -> None:
+        """Stop polling the batches."""
+        self._task.cancel()
+
+    def add_done_callback(self, callback: Callback) -> None:
+        """
+        Call `callback` with the handle once all batches completed.
+
+        The callback is called right away if the reconciliation completed
+        already. It's not called if the reconciliation times out.
+        """
+        if self._task is not None and self._task.done():
+            self._call(callback)
+        else:
+            self._callbacks.append(callback)
+
+    def _complete(self, task: asyncio.Task[list[UpdateResult]]) -> None:
+        if task.cancelled() or task.exception() is not None:
+            return
+        for callback in self._callbacks:
+            self._call(callback)
+        self._callbacks.clear()
+
+    def _call(self, callback: Callback) -> None:
+        try:
+            callback(self)
+        except Exception as e:
+            logger.error(f'Error in reconciliation callback: {e}')
+
+
+class BatchReconciler:
+    """
+    Reconciles timed out batch operations in background.
+
+    Batch operations that time out keep being processed by StockX. The
+    reconciler keeps polling their statuses with backoff and, as they
+    complete, resolves their items into `UpdateResult`s: listing IDs of
+    created and deleted listings are patched into the `ListedItem`s and
+    completion callbacks are fired. Foreground operations can then use
+    short timeouts without losing track of their outcome.
+
+    Parameters
+    ----------
+    stockx : `StockX`
+        The StockX API interface instance.
+    timeout : `int`, default 3600
+        Maximum seconds to keep polling the batches of a reconciliation.
+    callbacks : `Iterable[Callable[[Reconciliation], Any]]`, optional
+        Called with each reconciliation once all its batches completed.
+
+    Examples
+    --------
+    >>> reconciler = BatchReconciler(stockx)
+    >>> try:
+    ...     results = await update_listings(stockx, items, timeout=10)
+    ... except StockXIncompleteOperation as e:
+    ...     results = e.partial_results
+    ...     results += await reconciler.reconcile(e, items)
+    """
+
+    __slots__ = '_pending', 'callbacks', 'stockx', 'timeout'
+
+    def __init__(
+            self,
+            stockx: StockX,
+            timeout: int = 3600,
+            callbacks: Iterable[Callback] = (),
+    ) -> None:
+        self.stockx = stockx
+        self.timeout = timeout
+        self.callbacks = list(callbacks)
+        self._pending: set[Reconciliation] = set()
+
+    @property
+    def pending(self) -> tuple[Reconciliation, ...]:
+        """Reconciliations still polling their batches."""
+        return tuple(self._pending)
+
+    def add_callback(self, callback: Callback) -> None:
+        """Call `callback` with each reconciliation once it completes."""
+        self.callbacks.append(callback)
+
+    def reconcile(
+            self,
+            error: StockXIncompleteOperation,
+            items: Iterable[Item | ListedItem] = (),
+    ) -> Reconciliation:
+        """
+        Start reconciling the timed out batches of an incomplete operation.
+
+        Parameters
+        ----------
+        error : `StockXIncompleteOperation`
+            The incomplete operation, with the operation of each timed out
+            batch in `batch_operations`.
+        items : `Iterable[Item | ListedItem]`, optional
+            Items the operation was performed on. Results of batch items
+            that don't belong to any of them are left out.
+
+        Returns
+        -------
+        `Reconciliation`
+            Awaitable handle of the reconciliation.
+
+        Raises
+        ------
+        `ValueError`
+            If the operation of some timed out batches is unknown.
+        """
+        unknown = set(error.timed_out_batch_ids) - error.batch_operations.keys()
+        if unknown:
+            raise ValueError(
+                f'Unknown operation of timed out batches: {', '.join(unknown)}'
+            )
+
+        reconciliation = Reconciliation(error.batch_operations, items)
+        for callback in self.callbacks:
+            reconciliation.add_done_callback(callback)
+
+        task = asyncio.ensure_future(self._run(reconciliation))
+        task.add_done_callback(reconciliation._complete)
+        reconciliation._task = task
+        self._pending.add(reconciliation)
+        return reconciliation
+
+    async def wait(self) -> list[UpdateResult]:
+        """
+        Wait for all pending reconciliations to complete.
+
+        Returns
+        -------
+        `list[UpdateResult]`
+            Item results of all the reconciled batches.
+
+        Raises
+        ------
+        `StockXIncompleteOperation`
+            If some batches are still queued after the timeout. The exception
+            contains the results of the other batches.
+        """
+        outcomes = await asyncio.gather(
+            *self._pending, return_exceptions=True
+        )
+        return _merge(outcomes)
+
+    def close(self) -> None:
+        """Stop polling the batches of all pending reconciliations."""
+        for reconciliation in self._pending:
+            reconciliation.cancel()
+        self._pending.clear()
+
+    async def _run(self, reconciliation: Reconciliation) -> list[UpdateResult]:
+        operations: dict[BatchOperationType, list[str]] = {}
+        for batch_id, operation in reconciliation.batch_operations.items():
+            operations.setdefault(operation, []).append(batch_id)
+
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    self._resolve(operation, batch_ids, reconciliation.items)
+                    for operation, batch_ids in operations.items()
+                ),
+                return_exceptions=True,
+            )
+            results = _merge(outcomes)
+        except StockXIncompleteOperation as e:
+            logger.warning(
+                f'Reconciliation timed out: {len(e.timed_out_batch_ids)} '
+                f'batches still queued.'
+            )
+            raise
+        finally:
+            self._pending.discard(reconciliation)
+
+        logger.info(
+            f'Reconciled {len(reconciliation.batch_operations)} batches: '
+            f'{len(results)} item results.'
+        )
+        return results
+
+    async def _resolve(
+            self,
+            operation: BatchOperationType,
+            batch_ids: list[str],
+            items: tuple[Item | ListedItem, ...],
+    ) -> list[UpdateResult]:
+        """Wait for batches of an operation and resolve their item results."""
+        get_status, get_items = batch_getters(self.stockx, operation)
+
+        results = []
+        try:
+            async for result in batch_results(
+                batch_ids, get_status, get_items, self.timeout
+            ):
+                results.append(result)
+        except StockXBatchTimeout as e:
+            raise StockXIncompleteOperation(
+                'Batch reconciliation timed out. Partial results available.',
+                partial_results=_item_results(
+                    operation, items, results + e.partial_batch_results
+                ),
+                timed_out_batch_ids=e.queued_batch_ids,
+                batch_operations=dict.fromkeys(e.queued_batch_ids, operation),
+            )
+
+        return _item_results(operation, items, results)
+
+
+def _item_results(
+        operation: BatchOperationType,
+        items: tuple[Item | ListedItem, ...],
+        results: list,
+) -> list[UpdateResult]:
+    """Resolve batch item results into item results, patching listing IDs."""
+    listed_items = [item for item in items if isinstance(item, ListedItem)]
+
+    match operation:
+        case BatchOperationType.CREATE:
+            item_results = list(UpdateResult.from_batch_create(items, results))
+            for result in item_results:
+                if isinstance(result.item, ListedItem):
+                    result.item.listing_ids.extend(
+                        listing_id for listing_id in result.created
+                        if listing_id not in result.item.listing_ids
+                    )
+            return item_results
+
+        case BatchOperationType.UPDATE:
+            return [
+                result
+                for result in UpdateResult.from_batch_update(listed_items, results)
+                if result.updated or result.failed
+            ]
+
+        case BatchOperationType.DELETE:
+            deleted_result = UpdateResult.from_batch_delete(results)
+            deleted_set = set(deleted_result.deleted)
+            failed_set = set(deleted_result.failed)
+            error_map = {
+                error.listing_id: error
+                for error in deleted_result.errors_detail
+            }
+
+            item_results = []
+            for item in listed_items:
+                deleted = tuple(l for l in item.listing_ids if l in deleted_set)
+                failed = tuple(l for l in item.listing_ids if l in failed_set)
+                if not deleted and not failed:
+                    continue
+                item.listing_ids = [
+                    l for l in item.listing_ids if l not in deleted_set
+                ]
+                item_results.append(
+                    UpdateResult(
+                        item,
+                        deleted=deleted,
+                        failed=failed,
+                        errors_detail=tuple(
+                            error_map[l] for l in failed if l in error_map
+                        ),
+                    )
+                )
+            return item_results
+
+
+def _merge(
+        outcomes: Iterable[list[UpdateResult] | BaseException],
+) -> list[UpdateResult]:
+    """Merge results of concurrent resolutions, raising any timeout at last."""
+    results: list[UpdateResult] = []
+    incomplete: list[StockXIncompleteOperation] = []
+
+    for outcome in outcomes:
+        if isinstance(outcome, StockXIncompleteOperation):
+            results += outcome.partial_results
+            incomplete.append(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results += outcome
+
+    if incomplete:
+        raise StockXIncompleteOperation(
+            'Batch reconciliation timed out. Partial results available.',
+            partial_results=results,
+            timed_out_batch_ids=chain.from_iterable(
+                e.timed_out_batch_ids for e in incomplete
+            ),
+            batch_operations={
+                batch_id: operation
+                for e in incomplete
+                for batch_id, operation in e.batch_operations.items()
+            },
+        )
+    return results
@@ -0,0 +1,128 @@
+"""
+Dry-run repricing strategies and report their impact.
+
+Simulations evaluate vectorized pricing strategies (see
+`stockx.ext.inventory.pricing`) against cached market data and never
+update listings, so parameter sweeps cost no API calls once the pricing
+inputs are collected.
+
+Examples
+--------
+>>> inputs = await inventory.pricing_inputs(items)
+>>> for beat_by in (0.5, 1, 2, 5):
+...     report = inventory.simulate(inputs, beat_lowest_ask(beat_by))
+...     print(beat_by, report.changed_count, report.total_payout_delta)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import pricing
+from .pricing import (
+    PricingInputs,
+    PricingResult,
+    PricingStrategy,
+    Values,
+    evaluate_pricing,
+)
+
+if TYPE_CHECKING:
+    from .item import ListedItem
+
+
+class SimulatedPrice(NamedTuple):
+    """
+    Simulated price change of an item.
+
+    Parameters
+    ----------
+    item : `ListedItem`
+        The simulated item.
+    old_price : `float`
+        Current listing price.
+    new_price : `float`
+        Price set by the strategy.
+    payout_delta : `float`
+        Payout change per unit.
+    """
+    item: ListedItem
+    old_price: float
+    new_price: float
+    payout_delta: float
+
+
+@dataclass(slots=True, frozen=True)
+class SimulationReport:
+    """
+    What-if report of a pricing strategy.
+
+    Parameters
+    ----------
+    result : `PricingResult`
+        The evaluated strategy.
+    payout_deltas : `Values`
+        Payout change per unit of each item, zero if the price doesn't change.
+    changed_count : `int`
+        Number of items whose price changes.
+    total_payout_delta : `float`
+        Payout change over all listed units.
+    """
+    result: PricingResult
+    payout_deltas: Values
+    changed_count: int
+    total_payout_delta: float
+
+    @classmethod
+    def from_result(cls, result: PricingResult) -> SimulationReport:
+        """Create the report of an evaluated pricing strategy."""
+        inputs = result.inputs
+        old_payouts = inputs.payout(inputs.price)
+
+        if pricing.np is not None:
+            np = pricing.np
+            deltas = np.where(result.changed, result.payouts - old_payouts, 0.0)
+            return cls(
+                result=result,
+                payout_deltas=deltas,
+                changed_count=int(np.count_nonzero(result.changed)),
+                total_payout_delta=float(np.dot(deltas, inputs.quantity)),
+            )
+
+        deltas = tuple(
+            new - old if changed else 0.0
+            for new, old, changed
+            in zip(result.payouts, old_payouts, result.changed)
+        )
+        return cls(
+            result=result,
+            payout_deltas=deltas,
+            changed_count=sum(result.changed),
+            total_payout_delta=sum(
+                delta * quantity
+                for delta, quantity in zip(deltas, inputs.quantity)
+            ),
+        )
+
+    def prices(self, changed_only: bool = True) -> list[SimulatedPrice]:
+        """Get the per-item old and new prices and payout deltas."""
+        inputs = self.result.inputs
+        return [
+            SimulatedPrice(item, float(old), float(new), float(delta))
+            for item, old, new, delta, changed in zip(
+                inputs.items,
+                inputs.price,
+                self.result.new_prices,
+                self.payout_deltas,
+                self.result.changed,
+            )
+            if changed or not changed_only
+        ]
+
+
+def simulate(
+        inputs: PricingInputs, 
+        strategy: PricingStrategy
+) -> SimulationReport:
+    """Evaluate a pricing strategy and report its impact, without updating items."""
+    return SimulationReport.from_result(evaluate_pricing(inputs, strategy))
@@ -0,0 +1,349 @@
+"""
+Offline full-text search over a local mirror of the catalog.
+
+The mirror indexes the products seen by the SDK in an inverted index over
+their title, brand, style ID and colorway, so that queries (e.g. typeahead
+suggestions) are answered locally in milliseconds instead of going through
+the rate-limited search API.
+
+Examples
+--------
+>>> mirror = CatalogMirror.open('catalog.json')
+>>> stockx.catalog.add_product_listener(mirror.add)   # Keep mirror updated
+>>> for hit in mirror.search('jordn 1 chica', limit=5):
+...     print(hit.product.title, hit.score)
+"""
+
+from __future__ import annotations
+import heapq
+import json
+import math
+import os
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..format import jsonable, pretty_str
+from ..logs import logger
+from ..models import Product
+
+
+FORMAT_VERSION = 1
+
+# Weight of a match in each product field
+FIELD_WEIGHTS = {
+    'style_id': 4.0,
+    'title': 3.0,
+    'brand': 2.0,
+    'colorway': 1.0,
+}
+
+# Weight of a query token matching an index token exactly, as a prefix
+# of it or within one edit of it
+EXACT_MATCH = 1.0
+PREFIX_MATCH = 0.8
+FUZZY_MATCH = 0.5
+
+# Index tokens a query token can expand to as a prefix
+MAX_PREFIX_EXPANSIONS = 100
+
+# Shortest query token matched with typos
+MIN_FUZZY_LENGTH = 4
+
+
+@pretty_str
+@dataclass(slots=True, frozen=True)
+class SearchHit:
+    """
+    Product matching a mirror search.
+
+    Parameters
+    ----------
+    product : `Product`
+        The matching product.
+    score : `float`
+        Relevance of the product, higher is better.
+    """
+    product: Product
+    score: float
+
+
+class CatalogMirror:
+    """
+    Local mirror of catalog products with full-text search.
+
+    Products are tokenized into an inverted index over their title, brand,
+    style ID and colorway. Searches match all query tokens, each one
+    exactly, as a prefix (so partial input matches while typing) or, if
+    `fuzzy`, within one typo. Hits are ranked by field weight and token
+    rarity.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike | None`, optional
+        JSON file the mirror is persisted to by `save`.
+
+    Examples
+    --------
+    >>> mirror = CatalogMirror()
+    >>> stockx.catalog.add_product_listener(mirror.add)
+    >>> await stockx.catalog.get_product(product_id)   # Mirrored
+    >>> mirror.search('dunk low pan')
+    """
+
+    __slots__ = (
+        '_deletes',
+        '_postings',
+        '_products',
+        '_tokens',
+        '_vocabulary',
+        'path',
+    )
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._products: dict[str, Product] = {}
+        # Token -> product ID -> weight, and product ID -> token -> weight
+        self._postings: dict[str, dict[str, float]] = {}
+        self._tokens: dict[str, dict[str, float]] = {}
+        # Single deletion variants of tokens, for typo matching
+        self._deletes: dict[str, set[str]] = {}
+        # Sorted tokens for prefix matching, rebuilt after changes
+        self._vocabulary: list[str] | None = None
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> CatalogMirror:
+        """Create a mirror persisted to `path`, loading it if it exists."""
+        mirror = cls(path)
+        if mirror.path.exists():
+            mirror.load()
+        return mirror
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product_id: str) -> bool:
+        return product_id in self._products
+
+    def get(self, product_id: str) -> Product | None:
+        """Get a mirrored product by its ID."""
+        return self._products.get(product_id)
+
+    def add(self, product: Product) -> None:
+        """Add a product to the mirror, replacing its previous version."""
+        self.remove(product.id)
+        self._products[product.id] = product
+
+        tokens = self._tokens[product.id] = _product_tokens(product)
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for variant in _deletes(token):
+                    self._deletes.setdefault(variant, set()).add(token)
+                self._vocabulary = None
+            postings[product.id] = weight
+
+    def update(self, products: Iterable[Product]) -> None:
+        """Add many products to the mirror."""
+        for product in products:
+            self.add(product)
+
+    def remove(self, product_id: str) -> None:
+        """Remove a product from the mirror, if mirrored."""
+        if self._products.pop(product_id, None) is None:
+            return
+
+        for token in self._tokens.pop(product_id):
+            postings = self._postings[token]
+            del postings[product_id]
+            if postings:
+                continue
+            del self._postings[token]
+            for variant in _deletes(token):
+                tokens = self._deletes[variant]
+                tokens.discard(token)
+                if not tokens:
+                    del self._deletes[variant]
+            self._vocabulary = None
+
+    def search(
+            self,
+            query: str,
+            limit: int | None = 10,
+            fuzzy: bool = True,
+    ) -> list[SearchHit]:
+        """
+        Search the mirrored products.
+
+        Parameters
+        ----------
+        query : `str`
+            Search query, e.g. a partial title, SKU or colorway.
+        limit : `int | None`, default 10
+            Maximum number of hits, or `None` for all.
+        fuzzy : `bool`, default True
+            If `True`, query tokens of 4 or more characters also match
+            tokens within one typo (insertion, deletion or substitution).
+
+        Returns
+        -------
+        `list[SearchHit]`
+            Products matching all query tokens, best first.
+        """
+        query_tokens = list(dict.fromkeys(_tokenize(query)))
+        if not query_tokens:
+            return []
+
+        scores: dict[str, float] | None = None
+        for query_token in query_tokens:
+            token_scores = self._token_scores(query_token, fuzzy)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    product_id: score + token_scores[product_id]
+                    for product_id, score in scores.items()
+                    if product_id in token_scores
+                }
+            if not scores:
+                return []
+
+        def rank(item: tuple[str, float]) -> tuple[float, int]:
+            product_id, score = item
+            return -score, len(self._products[product_id].title)
+
+        if limit is None:
+            ranked = sorted(scores.items(), key=rank)
+        else:
+            ranked = heapq.nsmallest(limit, scores.items(), key=rank)
+        return [
+            SearchHit(self._products[product_id], score)
+            for product_id, score in ranked
+        ]
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the mirrored products to a JSON file, by default to `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to save the catalog mirror to.')
+
+        data = {
+            'version': FORMAT_VERSION,
+            'products': [jsonable(product) for product in self._products.values()],
+        }
+        temporary = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        temporary.replace(path)
+
+    def load(self, path: str | os.PathLike | None = None) -> None:
+        """Read mirrored products from a JSON file, by default from `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to load the catalog mirror from.')
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != FORMAT_VERSION:
+            logger.warning(f'Ignoring catalog mirror with unknown format: {path}')
+            return
+        self.update(map(Product.from_json, data['products']))
+
+    def _token_scores(self, query_token: str, fuzzy: bool) -> dict[str, float]:
+        """Score the products matching a query token by their best match."""
+        matches = {query_token: EXACT_MATCH} if query_token in self._postings else {}
+
+        for token in self._prefixed(query_token):
+            matches.setdefault(token, PREFIX_MATCH)
+
+        if fuzzy and len(query_token) >= MIN_FUZZY_LENGTH:
+            for token in self._similar(query_token):
+                matches.setdefault(token, FUZZY_MATCH)
+
+        scores: dict[str, float] = {}
+        for token, quality in matches.items():
+            postings = self._postings[token]
+            rarity = math.log(1 + len(self._products) / len(postings))
+            for product_id, weight in postings.items():
+                score = quality * weight * rarity
+                if score > scores.get(product_id, 0.0):
+                    scores[product_id] = score
+        return scores
+
+    def _prefixed(self, prefix: str) -> Iterator[str]:
+        """Yield index tokens starting with `prefix`, other than itself."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        stop = min(start + MAX_PREFIX_EXPANSIONS + 1, len(vocabulary))
+        for token in vocabulary[start:stop]:
+            if not token.startswith(prefix):
+                return
+            if token != prefix:
+                yield token
+
+    def _similar(self, query_token: str) -> set[str]:
+        """Get the index tokens within one edit of a query token."""
+        candidates = set(self._deletes.get(query_token, ()))
+        for variant in _deletes(query_token):
+            if variant in self._postings:
+                candidates.add(variant)
+            candidates.update(self._deletes.get(variant, ()))
+        return {
+            token for token in candidates
+            if token != query_token and _within_one_edit(token, query_token)
+        }
+
+
+def _tokenize(text: str) -> list[str]:
+    return re.findall(r'[a-z0-9]+', text.lower())
+
+
+def _product_tokens(product: Product) -> dict[str, float]:
+    """Get the tokens of a product with the weight of their best field."""
+    attributes = product.product_attributes
+    fields = {
+        'style_id': product.style_id,
+        'title': product.title,
+        'brand': product.brand,
+        'colorway': attributes.colorway if attributes else '',
+    }
+
+    tokens: dict[str, float] = {}
+    for field, text in fields.items():
+        weight = FIELD_WEIGHTS[field]
+        field_tokens = _tokenize(text)
+        if field == 'style_id':
+            # Whole SKUs, e.g. 'dd1391100' for 'DD1391-100'
+            field_tokens += [
+                ''.join(_tokenize(style_id)) for style_id in text.split('/')
+            ]
+        for token in field_tokens:
+            if token and weight > tokens.get(token, 0.0):
+                tokens[token] = weight
+    return tokens
+
+
+def _deletes(token: str) -> set[str]:
+    """Get the variants of a token with one character deleted."""
+    if len(token) < MIN_FUZZY_LENGTH - 1:
+        return set()
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Whether `a` becomes `b` with one insertion, deletion or substitution."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
@@ -0,0 +1,211 @@
+from __future__ import annotations
+import json
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ..api import StockX
+from ..concurrency import map_bounded
+from ..format import jsonable
+from ..logs import logger
+from ..models import Order, OrderStatusActive
+
+
+FORMAT_VERSION = 1
+
+# History is requested from a date (no time), so incremental syncs start
+# one day before the high-water mark to not miss any order
+SYNC_OVERLAP = timedelta(days=1)
+
+
+class OrderSync:
+    """
+    Incremental sync of sales orders into a local store.
+
+    Orders are upserted by order number. The first sync pulls the whole
+    order history (or from `from_date`), following syncs only the window
+    since the high-water mark, i.e. the latest `updated_at` (or
+    `created_at`) of the stored orders. Orders in transitional (active)
+    statuses are re-checked with a single sweep of the active orders, and
+    the ones that left it are requested individually.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike | None`, optional
+        JSON file the store is persisted to after each sync.
+    page_size : `int`, default 100
+        Orders requested per page.
+    concurrency : `int`, default 5
+        Maximum number of concurrent order requests.
+
+    Examples
+    --------
+    >>> orders = OrderSync.open('orders.json')
+    >>> changed = await orders.sync(stockx)
+    >>> completed = [
+    ...     order for order in orders.orders()
+    ...     if order.status == OrderStatusClosed.COMPLETED
+    ... ]
+    """
+
+    __slots__ = (
+        '_orders',
+        'concurrency',
+        'high_water_mark',
+        'last_sync',
+        'page_size',
+        'path',
+    )
+
+    def __init__(
+            self,
+            path: str | os.PathLike | None = None,
+            page_size: int = 100,
+            concurrency: int = 5,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.high_water_mark: datetime | None = None
+        self.last_sync: datetime | None = None
+        self._orders: dict[str, Order] = {}
+
+    @classmethod
+    def open(cls, path: str | os.PathLike, **kwargs) -> OrderSync:
+        """Create a store persisted to `path`, loading it if it exists."""
+        store = cls(path, **kwargs)
+        if store.path.exists():
+            store.load()
+        return store
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_number: str) -> bool:
+        return order_number in self._orders
+
+    def get(self, order_number: str) -> Order | None:
+        """Get a stored order by its number."""
+        return self._orders.get(order_number)
+
+    def orders(self) -> Iterator[Order]:
+        """Iterate over the stored orders."""
+        return iter(self._orders.values())
+
+    def pending(self) -> list[Order]:
+        """Get the stored orders in transitional (active) statuses."""
+        return [
+            order for order in self._orders.values()
+            if isinstance(order.status, OrderStatusActive)
+        ]
+
+    async def sync(
+            self,
+            stockx: StockX,
+            from_date: datetime | None = None,
+    ) -> list[Order]:
+        """
+        Sync the store with the orders on StockX.
+
+        Parameters
+        ----------
+        stockx : `StockX`
+            The StockX API interface instance.
+        from_date : `datetime | None`, optional
+            Start of the history pulled by the first sync. By default the
+            whole history is pulled.
+
+        Returns
+        -------
+        `list[Order]`
+            Orders that were added or changed.
+        """
+        started_at = datetime.now(timezone.utc)
+        changed: dict[str, Order] = {}
+
+        if self.high_water_mark is not None:
+            from_date = self.high_water_mark - SYNC_OVERLAP
+        async for order in stockx.orders.get_orders_history(
+            from_date=from_date,
+            page_size=self.page_size,
+            prefetch=True,
+        ):
+            self._upsert(order, changed)
+
+        # Re-check transitional orders. Active orders are swept at once,
+        # which also picks up new sales
+        pending = {
+            order.number for order in self.pending()
+            if order.number not in changed
+        }
+        async for order in stockx.orders.get_active_orders(
+            page_size=self.page_size,
+            prefetch=True,
+        ):
+            pending.discard(order.number)
+            self._upsert(order, changed)
+
+        # Orders no longer active but outside of the history window
+        if pending:
+            for order in await map_bounded(
+                stockx.orders.get_order, pending, limit=self.concurrency
+            ):
+                self._upsert(order, changed)
+
+        self.last_sync = started_at
+        logger.info(
+            f'Orders synced: {len(changed)} changed, '
+            f'{len(pending)} requested individually.'
+        )
+        if self.path:
+            self.save()
+        return list(changed.values())
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the store to a JSON file, by default to `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to save the orders to.')
+
+        data = {
+            'version': FORMAT_VERSION,
+            'high_water_mark': jsonable(self.high_water_mark),
+            'last_sync': jsonable(self.last_sync),
+            'orders': [jsonable(order) for order in self._orders.values()],
+        }
+        # Write to a temporary file first to never leave a partial store
+        temporary = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        temporary.replace(path)
+
+    def load(self, path: str | os.PathLike | None = None) -> None:
+        """Read the store from a JSON file, by default from `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to load the orders from.')
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != FORMAT_VERSION:
+            logger.warning(f'Ignoring orders with unknown format: {path}')
+            return
+
+        def timestamp(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        self.high_water_mark = timestamp(data['high_water_mark'])
+        self.last_sync = timestamp(data['last_sync'])
+        self._orders = {
+            order.number: order
+            for order in map(Order.from_json, data['orders'])
+        }
+
+    def _upsert(self, order: Order, changed: dict[str, Order]) -> None:
+        """Store an order, tracking changes and the high-water mark."""
+        if self._orders.get(order.number) != order:
+            self._orders[order.number] = order
+            changed[order.number] = order
+
+        if timestamp := order.updated_at or order.created_at:
+            if self.high_water_mark is None or timestamp > self.high_water_mark:
+                self.high_water_mark = timestamp
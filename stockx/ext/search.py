@@ -1,14 +1,206 @@
+from __future__ import annotations
+import json
+import os
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from urllib.parse import urlparse
+
 from ..api import StockX
 from ..cache import cache_by
+from ..concurrency import map_bounded
+from ..format import jsonable
+from ..logs import logger
 from ..models import Product
 
 
 __all__ = (
+    'ProductIndex',
     'product_by_sku',
     'product_by_url',
+    'use_index',
 )
 
 
+FORMAT_VERSION = 1
+
+
+class ProductIndex:
+    """
+    Local index of products by style ID, URL key and title.
+
+    Style IDs are indexed by token (multi-SKU style IDs are split on `/`),
+    so lookups match whole SKUs instead of substrings. Once warmed up, SKU
+    and URL resolution with `product_by_sku` and `product_by_url` is local.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike | None`, optional
+        JSON file the index is persisted to by `save`.
+
+    Examples
+    --------
+    >>> index = ProductIndex.open('products.json')
+    >>> search.use_index(index)                         # Check index first
+    >>> stockx.catalog.add_product_listener(index.add)  # Index decoded products
+    >>> await index.warm(stockx, ['nike dunk low', 'jordan 1 high'])
+    >>> product = await search.product_by_sku(stockx, 'DD1391-100')
+    """
+
+    __slots__ = '_products', '_style_ids', '_titles', '_url_keys', 'path'
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._products: dict[str, Product] = {}
+        self._style_ids: dict[str, str] = {}
+        self._url_keys: dict[str, str] = {}
+        self._titles: dict[str, str] = {}
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> ProductIndex:
+        """Create an index persisted to `path`, loading it if it exists."""
+        index = cls(path)
+        if index.path.exists():
+            index.load()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product_id: str) -> bool:
+        return product_id in self._products
+
+    def add(self, product: Product) -> None:
+        """Index a product by its style ID tokens, URL key and title."""
+        self._products[product.id] = product
+        for token in _style_tokens(product.style_id):
+            self._style_ids[token] = product.id
+        if product.url_key:
+            self._url_keys[product.url_key.lower()] = product.id
+        if title := _normalize_title(product.title):
+            self._titles[title] = product.id
+
+    def update(self, products: Iterable[Product]) -> None:
+        """Index many products."""
+        for product in products:
+            self.add(product)
+
+    def by_sku(self, sku: str) -> Product | None:
+        """Get the product with a style ID token equal to `sku`."""
+        return self._get(self._style_ids, _normalize_sku(sku))
+
+    def by_url(self, stockx_url: str) -> Product | None:
+        """Get the product of a StockX URL or URL key."""
+        return self._get(self._url_keys, _url_key(stockx_url))
+
+    def by_title(self, title: str) -> Product | None:
+        """Get the product with a matching title, ignoring case and punctuation."""
+        return self._get(self._titles, _normalize_title(title))
+
+    async def warm(
+            self,
+            stockx: StockX,
+            queries: Iterable[str],
+            limit: int = 50,
+            concurrency: int = 5,
+    ) -> int:
+        """
+        Index the products found by catalog searches.
+
+        Parameters
+        ----------
+        stockx : `StockX`
+            The StockX API interface instance.
+        queries : `Iterable[str]`
+            Search queries, e.g. brands, models or SKU prefixes.
+        limit : `int`, default 50
+            Maximum number of products indexed per query.
+        concurrency : `int`, default 5
+            Maximum number of concurrent searches.
+
+        Returns
+        -------
+        `int`
+            Number of products added to the index.
+        """
+        async def sweep(query: str) -> list[Product]:
+            return [
+                product async for product in stockx.catalog.search_catalog(
+                    query=query, 
+                    page_size=50, 
+                    limit=limit,
+                )
+            ]
+
+        count = len(self)
+        for products in await map_bounded(sweep, queries, limit=concurrency):
+            self.update(products)
+        added = len(self) - count
+
+        logger.info(f'Product index warmed up: {added} products added.')
+        if self.path:
+            self.save()
+        return added
+
+    def save(self, path: str | os.PathLike | None = None) -> None:
+        """Write the index to a JSON file, by default to `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to save the product index to.')
+
+        data = {
+            'version': FORMAT_VERSION,
+            'products': [jsonable(product) for product in self._products.values()],
+        }
+        temporary = path.with_name(f'{path.name}.tmp')
+        temporary.write_text(json.dumps(data), encoding='utf-8')
+        temporary.replace(path)
+
+    def load(self, path: str | os.PathLike | None = None) -> None:
+        """Read the index from a JSON file, by default from `path`."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError('No path to load the product index from.')
+
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('version') != FORMAT_VERSION:
+            logger.warning(f'Ignoring product index with unknown format: {path}')
+            return
+        self.update(map(Product.from_json, data['products']))
+
+    def _get(self, keys: dict[str, str], key: str) -> Product | None:
+        product_id = keys.get(key)
+        return self._products[product_id] if product_id else None
+
+
+_index: ProductIndex | None = None
+
+
+def use_index(index: ProductIndex | None) -> None:
+    """Make `product_by_sku` and `product_by_url` check `index` first."""
+    global _index
+    _index = index
+
+
+def _normalize_sku(sku: str) -> str:
+    return '-'.join(sku.strip().upper().split())
+
+
+def _style_tokens(style_id: str) -> Iterable[str]:
+    return (
+        token for token in map(_normalize_sku, style_id.split('/')) if token
+    )
+
+
+def _url_key(stockx_url: str) -> str:
+    path = urlparse(stockx_url).path or stockx_url
+    return path.strip('/').rsplit('/', 1)[-1].lower()
+
+
+def _normalize_title(title: str) -> str:
+    return ' '.join(re.findall(r'[a-z0-9]+', title.lower()))
+
+
 @cache_by('sku')
 async def product_by_sku(stockx: StockX, sku: str) -> Product | None:
     """Search a product by SKU.
@@ -28,7 +220,11 @@ async def product_by_sku(stockx: StockX, sku: str) -> Product | None:
     Notes
     -----
     Since product data rarely changes, results are cached indefinitely.
+    If an index is in use (see `use_index`), it's checked first.
     """
+    if _index is not None and (product := _index.by_sku(sku)):
+        return product
+    
     async for product in stockx.catalog.search_catalog(
         query=sku,
         page_size=50,
@@ -59,7 +255,11 @@ async def product_by_url(stockx: StockX, stockx_url: str) -> Product | None:
     Notes
     -----
     Since product data rarely changes, results are cached indefinitely.
+    If an index is in use (see `use_index`), it's checked first.
     """
+    if _index is not None and (product := _index.by_url(stockx_url)):
+        return product
+    
     async for product in stockx.catalog.search_catalog(
         query=stockx_url, 
         page_size=50, 
@@ -6,17 +6,21 @@ from typing import TypeVar, Any, Generic
 
 T = TypeVar('T')
 
+Predicate = Callable[[T], bool]
+
 
 class Filter(Generic[T]):
     def __init__(
             self,
             class_: type[T],
             getter: Callable[[T], Any],
-            condition: Callable[[Any, set[Any]], bool],
+            condition: Callable[[Any, frozenset[Any]], bool] | None = None,
+            memoize: bool = False,
     ) -> None:
         self.class_ = class_
         self.extractor = getter
         self.condition = condition
+        self.memoize = memoize
         self.allowed_values = set()
 
     def include(self, values: Iterable[Any]) -> None:
@@ -36,17 +40,76 @@ class Filter(Generic[T]):
         if self.empty():
             return True
         value = self.extractor(obj)
+        if self.condition is None:
+            return value in self.allowed_values
         return self.condition(value, self.allowed_values)
-    
+
     def empty(self) -> bool:
         return not self.allowed_values
-    
+
+    def compile(self) -> Predicate[T] | None:
+        """
+        Compile the filter into a predicate for its current allowed values.
+
+        Allowed values are frozen, so later changes to the filter require a
+        new compilation. Without a condition, the predicate checks that the
+        extracted value is allowed. With `memoize`, condition results are
+        cached by extracted value, which must be hashable.
+
+        Returns
+        -------
+        `Predicate[T] | None`
+            The predicate, or `None` if the filter is empty and matches all.
+        """
+        if self.empty():
+            return None
+
+        allowed = frozenset(self.allowed_values)
+        extractor = self.extractor
+        condition = self.condition
+
+        if condition is None:
+            return lambda obj: extractor(obj) in allowed
+
+        if not self.memoize:
+            return lambda obj: condition(extractor(obj), allowed)
+
+        results: dict[Any, bool] = {}
+
+        def predicate(obj: T) -> bool:
+            value = extractor(obj)
+            try:
+                return results[value]
+            except KeyError:
+                result = results[value] = condition(value, allowed)
+                return result
+
+        return predicate
+
 
 def create_filter(
     class_: type[T],
     /,
     getter: Callable[[T], Any],
-    condition: Callable[[Any, set[Any]], bool],
+    condition: Callable[[Any, frozenset[Any]], bool] | None = None,
+    memoize: bool = False,
 ) -> Filter[T]:
-    return Filter(class_, getter, condition)
+    return Filter(class_, getter, condition, memoize)
+
+
+def compile_filters(filters: Iterable[Filter[T]]) -> Predicate[T]:
+    """Compile filters into a single predicate, skipping empty filters."""
+    predicates = tuple(
+        predicate for _filter in filters
+        if (predicate := _filter.compile()) is not None
+    )
 
+    match predicates:
+        case ():
+            return lambda obj: True
+        case (predicate,):
+            return predicate
+        case (first, second):
+            return lambda obj: first(obj) and second(obj)
+        case _:
+            return lambda obj: all(predicate(obj) for predicate in predicates)
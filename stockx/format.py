@@ -5,7 +5,8 @@ from dataclasses import (
     is_dataclass,
 )
 from datetime import datetime
-from typing import TypeVar
+from enum import Enum
+from typing import Any, TypeVar
 
 
 def iso(datetime: datetime | None) -> str | None:
@@ -25,6 +26,34 @@ def iso_date(datetime: datetime | None) -> str | None:
     return datetime.strftime('%Y-%m-%d') if datetime else None
 
 
+def jsonable(value: Any) -> Any:
+    """
+    Convert a value to JSON serializable data.
+
+    Dataclasses (e.g. models) become objects with camelCase keys, so that
+    models can be recreated with `from_json`.
+    """
+    if is_dataclass(value):
+        return {
+            _camel(field.name): jsonable(getattr(value, field.name))
+            for field in fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: jsonable(val) for key, val in value.items()}
+    if isinstance(value, list | tuple):
+        return [jsonable(val) for val in value]
+    return value
+
+
+def _camel(name: str) -> str:
+    first, *others = name.split('_')
+    return first + ''.join(word.capitalize() for word in others)
+
+
 T = TypeVar('T')
 
 def pretty_str(cls: type[T]) -> type[T]:
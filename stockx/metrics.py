@@ -0,0 +1,428 @@
+"""
+Instrumentation hooks of the API client.
+
+A `Metrics` sink receives the requests made by the client (per endpoint
+template, e.g. `/catalog/products/{id}`), the time requests wait in the
+throttle queue, retries, `cache_by` hits and misses and batch completion
+durations. `MetricsRecorder` aggregates them in memory, with latencies in
+log-bucketed histograms; `PrometheusMetrics` and `OpenTelemetryMetrics`
+export them (`pip install python-stockx[prometheus]` or
+`python-stockx[opentelemetry]`). Without a sink, each hook is a single
+`None` check.
+
+The sink is installed with `use_metrics`, the single entry point: it is
+process-wide, so it receives the metrics of all clients.
+
+Examples
+--------
+>>> metrics = MetricsRecorder()
+>>> use_metrics(metrics)
+>>> ...
+>>> for (method, endpoint), latency in metrics.latency.items():
+...     print(method, endpoint, latency.quantile(0.5), latency.quantile(0.99))
+>>> metrics.throttle_wait.quantile(0.99)   # Time lost in our own throttle
+"""
+
+from __future__ import annotations
+import math
+import re
+from collections import Counter
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:
+    otel_metrics = None
+
+
+__all__ = (
+    'Histogram',
+    'Metrics',
+    'MetricsRecorder',
+    'OpenTelemetryMetrics',
+    'PrometheusMetrics',
+    'endpoint_template',
+    'get_metrics',
+    'use_metrics',
+)
+
+
+# Bucket boundaries in seconds of the exported histograms
+LATENCY_BUCKETS = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+BATCH_BUCKETS = (1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)
+
+# Path segments with digits are IDs, e.g. product UUIDs and order numbers
+_ID_SEGMENT = re.compile(r'(?<=/)[^/]*\d[^/]*')
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace the IDs of an endpoint path with `{id}`."""
+    return _ID_SEGMENT.sub('{id}', endpoint)
+
+
+class Metrics:
+    """
+    Sink of client metrics, ignoring all of them.
+
+    Subclasses override the hooks they record. Hooks are called on the
+    event loop and should not block.
+    """
+
+    __slots__ = ()
+
+    def request(
+            self,
+            method: str,
+            endpoint: str,
+            status: int | None,
+            seconds: float,
+    ) -> None:
+        """
+        Record a request to the API, including each retried attempt.
+
+        `endpoint` is the endpoint template and `status` is `None` if no
+        response was received.
+        """
+
+    def throttle(self, seconds: float, depth: int) -> None:
+        """Record the time a request waited in the throttle queue, and the
+        number of requests still queued behind it."""
+
+    def retry(self, status: int | None, attempt: int, delay: float) -> None:
+        """Record a failed attempt retried after `delay` seconds."""
+
+    def cache(self, function: str, hit: bool) -> None:
+        """Record a lookup in the `cache_by` cache of a function."""
+
+    def batch(self, operation: str, seconds: float) -> None:
+        """Record the time from submission to completion of a batch."""
+
+
+_metrics: Metrics | None = None
+
+
+def use_metrics(metrics: Metrics | None) -> None:
+    """Set the sink of the metrics of all clients, or `None` to disable
+    them."""
+    global _metrics
+    _metrics = metrics
+
+
+def get_metrics() -> Metrics | None:
+    """Get the sink of the client metrics, if enabled."""
+    return _metrics
+
+
+class Histogram:
+    """
+    Log-bucketed histogram of positive values.
+
+    Bucket boundaries grow by `growth`, so quantiles are estimated within
+    a relative error of `growth - 1` whatever the range of the values.
+
+    Parameters
+    ----------
+    growth : `float`, default 2 ** (1 / 8)
+        Ratio between consecutive bucket boundaries (about 9%).
+    """
+
+    __slots__ = '_buckets', '_log_growth', 'count', 'growth', 'max', 'min', 'sum'
+
+    def __init__(self, growth: float = 2 ** (1 / 8)) -> None:
+        if growth <= 1:
+            raise ValueError('Growth must be greater than 1.')
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self._buckets: Counter[int] = Counter()
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self._buckets[self._bucket(value)] += 1
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate a quantile of the values, e.g. `0.99` for the p99.
+
+        Returns the upper boundary of the bucket of the quantile, capped
+        by the maximum value, or `None` if the histogram is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('Quantile must be between 0 and 1.')
+        if not self.count:
+            return None
+
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self.growth ** (bucket + 1), self.max)
+        return self.max
+
+    def merge(self, other: Histogram) -> None:
+        """Add the values of a histogram with the same growth."""
+        if other.growth != self.growth:
+            raise ValueError('Cannot merge histograms of different growth.')
+        self._buckets.update(other._buckets)
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _bucket(self, value: float) -> int:
+        if value <= 0:
+            return -(2 ** 31)   # Below any boundary
+        return math.floor(math.log(value) / self._log_growth)
+
+
+class MetricsRecorder(Metrics):
+    """
+    Sink aggregating the client metrics in memory.
+
+    Attributes
+    ----------
+    requests : `Counter[tuple[str, str, int | None]]`
+        Requests by method, endpoint template and status.
+    latency : `dict[tuple[str, str], Histogram]`
+        Request latencies in seconds by method and endpoint template.
+    throttle_wait : `Histogram`
+        Seconds requests waited in the throttle queue.
+    max_queue_depth : `int`
+        Most requests seen waiting in the throttle queue.
+    retries : `Counter[int | None]`
+        Retried attempts by status.
+    cache_hits : `Counter[str]`
+        Cache hits by function.
+    cache_misses : `Counter[str]`
+        Cache misses by function.
+    batch_durations : `dict[str, Histogram]`
+        Batch completion durations in seconds by operation.
+    """
+
+    __slots__ = (
+        'batch_durations',
+        'cache_hits',
+        'cache_misses',
+        'latency',
+        'max_queue_depth',
+        'requests',
+        'retries',
+        'throttle_wait',
+    )
+
+    def __init__(self) -> None:
+        self.requests: Counter[tuple[str, str, int | None]] = Counter()
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.throttle_wait = Histogram()
+        self.max_queue_depth = 0
+        self.retries: Counter[int | None] = Counter()
+        self.cache_hits: Counter[str] = Counter()
+        self.cache_misses: Counter[str] = Counter()
+        self.batch_durations: dict[str, Histogram] = {}
+
+    def request(self, method, endpoint, status, seconds) -> None:
+        self.requests[method, endpoint, status] += 1
+        latency = self.latency.get((method, endpoint))
+        if latency is None:
+            latency = self.latency[method, endpoint] = Histogram()
+        latency.record(seconds)
+
+    def throttle(self, seconds, depth) -> None:
+        self.throttle_wait.record(seconds)
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def retry(self, status, attempt, delay) -> None:
+        self.retries[status] += 1
+
+    def cache(self, function, hit) -> None:
+        if hit:
+            self.cache_hits[function] += 1
+        else:
+            self.cache_misses[function] += 1
+
+    def batch(self, operation, seconds) -> None:
+        durations = self.batch_durations.get(operation)
+        if durations is None:
+            durations = self.batch_durations[operation] = Histogram()
+        durations.record(seconds)
+
+
+class PrometheusMetrics(Metrics):
+    """
+    Sink exporting the client metrics to Prometheus.
+
+    Parameters
+    ----------
+    registry : `prometheus_client.CollectorRegistry | None`, optional
+        Registry of the metrics. By default the global registry.
+    namespace : `str`, default 'stockx'
+        Prefix of the metric names.
+
+    Raises
+    ------
+    `ImportError`
+        If `prometheus_client` is not installed.
+    """
+
+    __slots__ = (
+        '_batch',
+        '_cache',
+        '_latency',
+        '_queue_depth',
+        '_requests',
+        '_retries',
+        '_throttle_wait',
+    )
+
+    def __init__(self, registry=None, namespace: str = 'stockx') -> None:
+        if prometheus_client is None:
+            raise ImportError(
+                'Prometheus metrics require prometheus_client: '
+                'pip install python-stockx[prometheus]'
+            )
+        options = {
+            'namespace': namespace,
+            'registry': registry or prometheus_client.REGISTRY,
+        }
+        self._requests = prometheus_client.Counter(
+            'requests', 'StockX API requests.',
+            ['method', 'endpoint', 'status'], **options,
+        )
+        self._latency = prometheus_client.Histogram(
+            'request_duration_seconds', 'StockX API request latency.',
+            ['method', 'endpoint'], buckets=LATENCY_BUCKETS, **options,
+        )
+        self._throttle_wait = prometheus_client.Histogram(
+            'throttle_wait_seconds', 'Time requests waited in the throttle queue.',
+            buckets=LATENCY_BUCKETS, **options,
+        )
+        self._queue_depth = prometheus_client.Gauge(
+            'throttle_queue_depth', 'Requests waiting in the throttle queue.',
+            **options,
+        )
+        self._retries = prometheus_client.Counter(
+            'retries', 'Retried StockX API requests.', ['status'], **options,
+        )
+        self._cache = prometheus_client.Counter(
+            'cache_lookups', 'Cache lookups.', ['function', 'result'], **options,
+        )
+        self._batch = prometheus_client.Histogram(
+            'batch_duration_seconds', 'Batch operation completion time.',
+            ['operation'], buckets=BATCH_BUCKETS, **options,
+        )
+
+    def request(self, method, endpoint, status, seconds) -> None:
+        self._requests.labels(method, endpoint, str(status)).inc()
+        self._latency.labels(method, endpoint).observe(seconds)
+
+    def throttle(self, seconds, depth) -> None:
+        self._throttle_wait.observe(seconds)
+        self._queue_depth.set(depth)
+
+    def retry(self, status, attempt, delay) -> None:
+        self._retries.labels(str(status)).inc()
+
+    def cache(self, function, hit) -> None:
+        self._cache.labels(function, 'hit' if hit else 'miss').inc()
+
+    def batch(self, operation, seconds) -> None:
+        self._batch.labels(operation).observe(seconds)
+
+
+class OpenTelemetryMetrics(Metrics):
+    """
+    Sink exporting the client metrics to OpenTelemetry.
+
+    Parameters
+    ----------
+    meter : `opentelemetry.metrics.Meter | None`, optional
+        Meter creating the instruments. By default the `'stockx'` meter of
+        the global meter provider.
+
+    Raises
+    ------
+    `ImportError`
+        If `opentelemetry-api` is not installed.
+    """
+
+    __slots__ = (
+        '_batch',
+        '_cache',
+        '_latency',
+        '_queue_depth',
+        '_requests',
+        '_retries',
+        '_throttle_wait',
+    )
+
+    def __init__(self, meter=None) -> None:
+        if otel_metrics is None:
+            raise ImportError(
+                'OpenTelemetry metrics require opentelemetry-api: '
+                'pip install python-stockx[opentelemetry]'
+            )
+        meter = meter or otel_metrics.get_meter('stockx')
+        self._requests = meter.create_counter(
+            'stockx.requests', unit='{request}',
+            description='StockX API requests.',
+        )
+        self._latency = meter.create_histogram(
+            'stockx.request.duration', unit='s',
+            description='StockX API request latency.',
+        )
+        self._throttle_wait = meter.create_histogram(
+            'stockx.throttle.wait', unit='s',
+            description='Time requests waited in the throttle queue.',
+        )
+        self._queue_depth = meter.create_histogram(
+            'stockx.throttle.queue_depth', unit='{request}',
+            description='Requests waiting in the throttle queue.',
+        )
+        self._retries = meter.create_counter(
+            'stockx.retries', unit='{request}',
+            description='Retried StockX API requests.',
+        )
+        self._cache = meter.create_counter(
+            'stockx.cache.lookups', unit='{lookup}',
+            description='Cache lookups.',
+        )
+        self._batch = meter.create_histogram(
+            'stockx.batch.duration', unit='s',
+            description='Batch operation completion time.',
+        )
+
+    def request(self, method, endpoint, status, seconds) -> None:
+        attributes = {'method': method, 'endpoint': endpoint, 'status': str(status)}
+        self._requests.add(1, attributes)
+        self._latency.record(seconds, attributes)
+
+    def throttle(self, seconds, depth) -> None:
+        self._throttle_wait.record(seconds)
+        self._queue_depth.record(depth)
+
+    def retry(self, status, attempt, delay) -> None:
+        self._retries.add(1, {'status': str(status)})
+
+    def cache(self, function, hit) -> None:
+        self._cache.add(1, {'function': function, 'result': 'hit' if hit else 'miss'})
+
+    def batch(self, operation, seconds) -> None:
+        self._batch.record(seconds, {'operation': operation})
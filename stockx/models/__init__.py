@@ -9,6 +9,7 @@ from .batch import (
     BatchItemStatus,
     BatchItemStatuses,
     BatchOperationStatus,
+    BatchOperationType,
     BatchStatus,
     BatchUpdateInput,
     BatchUpdateResult,
@@ -55,6 +56,7 @@ __all__ = (
     'BatchItemStatus',
     'BatchItemStatuses',
     'BatchOperationStatus',
+    'BatchOperationType',
     'BatchStatus',
     'BatchUpdateInput',
     'BatchUpdateResult',
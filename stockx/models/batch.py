@@ -22,6 +22,18 @@ class BatchOperationStatus(Enum):
     COMPLETED = 'COMPLETED'
 
 
+class BatchOperationType(Enum):
+    """Batch listing operations, valued by their endpoint path.
+
+    `CREATE`
+    `UPDATE`
+    `DELETE`
+    """
+    CREATE = 'create-listing'
+    UPDATE = 'update-listing'
+    DELETE = 'delete-listing'
+
+
 @dataclass(frozen=True, slots=True)
 class BatchStatus(StockXBaseModel):
     """Represents the status of a batch operation.
@@ -1,8 +1,7 @@
 from collections.abc import Iterable, Iterator
-from functools import reduce
-from itertools import groupby
 from operator import attrgetter
-from typing import TypeVar
+from types import SimpleNamespace
+from typing import Any, TypeVar
 
 
 T = TypeVar('T')
@@ -13,10 +12,15 @@ def group_and_sum(
         /, 
         group_keys: Iterable[str], 
         sum_attrs: Iterable[str],
-) -> Iterator[T]:
+) -> Iterator[SimpleNamespace]:
     """
     Group items by `group_keys` and sum values of `sum_attrs` within each group.
 
+    Items are grouped in a single pass with a hash map, so the input can be
+    any iterable (e.g. a generator) and group keys only need to be hashable.
+    Input items are never modified: each group is a new object holding the
+    group keys and the summed attributes. List attributes are concatenated.
+
     Parameters
     ----------
     iterable : `Iterable[T]`
@@ -29,8 +33,9 @@ def group_and_sum(
 
     Returns
     -------
-    `Iterator[T]`
-        An iterator yielding one object per group, with summed attributes.
+    `Iterator[SimpleNamespace]`
+        An iterator yielding one object per group, in order of first 
+        appearance, with the group keys and summed attributes.
 
     Examples
     --------
@@ -44,20 +49,45 @@ def group_and_sum(
     ...     group_keys=('variant_id', 'price'),
     ...     sum_attrs=('quantity',)
     ... )
-    >>> list(grouped)  # Returns 2 items:
+    >>> list(grouped)  # Returns 2 groups:
     [
-        Item(variant_id='123', price=100, quantity=5),  # 2 + 3 = 5
-        Item(variant_id='456', price=200, quantity=1)
+        namespace(variant_id='123', price=100, quantity=5),  # 2 + 3 = 5
+        namespace(variant_id='456', price=200, quantity=1)
     ]
     """
-    def reduce_func(accumulated, item):
-        for attr in sum_attrs:
-            item_attr = getattr(item, attr)
-            accumulated_attr = getattr(accumulated, attr)
-            setattr(item, attr, accumulated_attr + item_attr)
-        return item
-    
-    iterable = sorted(iterable, key=attrgetter(*group_keys))
-    groups = groupby(iterable, key=attrgetter(*group_keys))
-    for _, group in groups:
-        yield reduce(reduce_func, group)
\ No newline at end of file
+    group_keys = tuple(group_keys)
+    sum_attrs = tuple(sum_attrs)
+    get_key = attrgetter(*group_keys)
+    get_values = attrgetter(*sum_attrs)
+    single_value = len(sum_attrs) == 1
+
+    groups: dict[Any, list[Any]] = {}
+    for item in iterable:
+        key = get_key(item)
+        values = get_values(item)
+        if single_value:
+            values = (values,)
+
+        sums = groups.get(key)
+        if sums is None:
+            groups[key] = [_initial(value) for value in values]
+            continue
+        for i, value in enumerate(values):
+            if isinstance(value, (list, tuple)):
+                sums[i].extend(value)
+            else:
+                sums[i] += value
+
+    for key, sums in groups.items():
+        keys = key if len(group_keys) > 1 else (key,)
+        yield SimpleNamespace(
+            **dict(zip(group_keys, keys)), 
+            **dict(zip(sum_attrs, sums)),
+        )
+
+
+def _initial(value: Any) -> Any:
+    # Copy sequences so that extending them doesn't modify the input items
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return value
@@ -127,7 +127,7 @@ def item():
 
 @pytest.fixture
 def mock_publish_listings():
-    async def mock_publish_listings(stockx, items, currency):
+    async def mock_publish_listings(stockx, items, currency, **kwargs):
         return [
             UpdateResult(item, created=['new-listing-id-1', 'new-listing-id-2'])
             for item in items
@@ -138,7 +138,7 @@ def mock_publish_listings():
 
 @pytest.fixture
 def mock_update_listings():
-    async def mock_update_listings(stockx, items):
+    async def mock_update_listings(stockx, items, **kwargs):
         return [
             UpdateResult(item, updated=['listing-id-1', 'listing-id-2'])
             for item in items
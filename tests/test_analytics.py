@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import stockx
+from stockx.ext.analytics import SalesAggregates
+
+
+NOW = datetime(2025, 3, 31, tzinfo=timezone.utc)
+
+
+def order(
+        number: str,
+        days_ago: int,
+        status: str = 'COMPLETED',
+        variant_id: str = 'variant-1',
+        amount: float = 100,
+) -> stockx.Order:
+    return stockx.Order.from_json({
+        'orderNumber': number,
+        'listingId': f'listing-{number}',
+        'amount': str(amount),
+        'status': status,
+        'currencyCode': 'EUR',
+        'product': {'productId': 'product-1'},
+        'variant': {'variantId': variant_id},
+        'payout': {
+            'totalPayout': str(amount * 0.85),
+            'adjustments': [
+                {'adjustmentType': 'Transaction Fee (9%)', 'amount': str(-amount * 0.09)},
+                {'adjustmentType': 'Payment Proc. (3%)', 'amount': str(-amount * 0.03)},
+                {'adjustmentType': 'Shipping', 'amount': '-3'},
+            ],
+        },
+        'createdAt': (NOW - timedelta(days=days_ago)).isoformat(),
+    })
+
+
+def test_sales_stats():
+    sales = SalesAggregates(horizon=90)
+    sales.update([
+        order('1', days_ago=0),
+        order('2', days_ago=5, variant_id='variant-2', amount=200),
+        order('3', days_ago=10, status='CANCELED'),
+        order('4', days_ago=40),
+    ])
+
+    stats = sales.stats('product-1', days=30, until=NOW)
+    assert stats.count == 2
+    assert stats.amount == 300
+    assert stats.payout == pytest.approx(255)
+    assert stats.transaction_fee == pytest.approx(-27)
+    assert stats.shipping_cost == -6
+    assert stats.velocity == pytest.approx(2 / 30)
+    assert stats.realized_ratio == pytest.approx(0.85)
+    assert stats.sell_through(listed=2) == 0.5
+
+    assert sales.stats('product-1', 'variant-1', days=60, until=NOW).count == 2
+    assert sales.stats(statuses=['CANCELED'], days=30, until=NOW).count == 1
+    assert sales.stats('product-2', until=NOW).count == 0
+
+
+def test_sales_order_replaced():
+    sales = SalesAggregates()
+    sales.add(order('1', days_ago=0, status='PAYOUTPENDING'))
+    sales.add(order('1', days_ago=0, status='RETURNED'))
+
+    assert len(sales) == 1
+    assert sales.stats(days=1, until=NOW).count == 0
+    assert sales.stats(statuses=['RETURNED'], days=1, until=NOW).count == 1
+
+
+def test_sales_horizon():
+    sales = SalesAggregates(horizon=30)
+    sales.add(order('1', days_ago=35))
+    sales.add(order('2', days_ago=0))
+    sales.add(order('3', days_ago=40))
+
+    assert '1' not in sales, 'Orders past the horizon should be evicted'
+    assert '3' not in sales
+    assert len(sales) == 1
+    assert sales.stats(days=30, until=NOW).count == 1
+    with pytest.raises(ValueError):
+        sales.stats(days=31)
+
+
+def test_sales_horizon_evicts_orders_of_same_day():
+    sales = SalesAggregates(horizon=30)
+    sales.update([
+        order('1', days_ago=35),
+        order('2', days_ago=35),
+        order('3', days_ago=35, variant_id='variant-2'),
+        order('4', days_ago=34, variant_id='variant-2'),
+    ])
+    sales.add(order('5', days_ago=0, variant_id='variant-3'))
+
+    assert len(sales) == 1
+    assert sales.stats(days=30, until=NOW).count == 1
+    assert sales.stats(product_id='product-1', days=30, until=NOW).count == 1
+
+
+def test_sales_merge_and_persist(tmp_path):
+    first = SalesAggregates(tmp_path / 'sales.json')
+    first.update([order('1', days_ago=1), order('2', days_ago=2)])
+    first.save()
+
+    second = SalesAggregates()
+    second.update([order('2', days_ago=2), order('3', days_ago=3)])
+
+    loaded = SalesAggregates.open(tmp_path / 'sales.json')
+    loaded.merge(second)
+
+    assert len(loaded) == 3
+    assert loaded.stats(days=7, until=NOW).count == 3
+    assert loaded.stats(days=7, until=NOW).payout == pytest.approx(255)
@@ -0,0 +1,225 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.api.batch import (
+    batch_completed, 
+    batch_completion, 
+    batch_results,
+)
+from stockx.errors import (
+    StockXBatchTimeout, 
+    StockXIncompleteOperation, 
+    StockXInternalServerError,
+)
+from stockx.ext.inventory import ListedItem
+from stockx.ext.inventory.batch.operations import (
+    stream_update_listings, 
+    update_listings,
+)
+
+
+def batch_status(
+        batch_id: str,
+        completed: bool,
+        queued: int = 0,
+        processed: int = 0,
+) -> stockx.BatchStatus:
+    return MagicMock(
+        spec=stockx.BatchStatus,
+        batch_id=batch_id,
+        status=(
+            stockx.BatchOperationStatus.COMPLETED if completed
+            else stockx.BatchOperationStatus.IN_PROGRESS
+        ),
+        item_statuses=MagicMock(queued=queued, completed=processed, failed=0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_completed_polls_immediately(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', sleep)
+    get_status = AsyncMock(
+        side_effect=lambda batch_id: batch_status(batch_id, completed=True)
+    )
+
+    await batch_completed(['batch-1', 'batch-2'], get_status, timeout=60)
+
+    assert get_status.await_count == 2
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batch_completed_polls_only_queued_batches(monkeypatch):
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', AsyncMock())
+    polls = {'batch-1': 0, 'batch-2': 0}
+
+    async def get_status(batch_id):
+        polls[batch_id] += 1
+        done = batch_id == 'batch-1' or polls[batch_id] > 2
+        return batch_status(batch_id, done, queued=10, processed=polls[batch_id])
+
+    await batch_completed(['batch-1', 'batch-2'], get_status, timeout=60)
+
+    assert polls == {'batch-1': 1, 'batch-2': 3}
+
+
+@pytest.mark.asyncio
+async def test_batch_completed_timeout():
+    get_status = AsyncMock(
+        side_effect=lambda batch_id: batch_status(batch_id, completed=False)
+    )
+
+    with pytest.raises(StockXBatchTimeout) as exc_info:
+        await batch_completed(['batch-1'], get_status, timeout=0)
+
+    assert exc_info.value.queued_batch_ids == ['batch-1']
+
+
+@pytest.mark.asyncio
+async def test_batch_results_streams_completed_batches(monkeypatch):
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', AsyncMock())
+    polls = {'batch-1': 0, 'batch-2': 0}
+    fetched = []
+
+    async def get_status(batch_id):
+        polls[batch_id] += 1
+        return batch_status(batch_id, batch_id == 'batch-1' or polls[batch_id] > 1)
+
+    async def get_items(batch_id):
+        fetched.append(batch_id)
+        return [
+            MagicMock(
+                spec=stockx.BatchUpdateResult,
+                item_id=batch_id,
+                status=stockx.BatchItemStatus.COMPLETED,
+            )
+        ]
+
+    results = batch_results(['batch-1', 'batch-2'], get_status, get_items, 60)
+
+    first = await anext(results)
+    assert first.item_id == 'batch-1'
+    assert fetched == ['batch-1'], 'Slow batches should not delay results'
+
+    assert [result.item_id async for result in results] == ['batch-2']
+
+
+@pytest.mark.asyncio
+async def test_stream_update_listings(mock_stockx, item):
+    inventory = MagicMock(currency=stockx.Currency.EUR)
+    listed_item = ListedItem(item, inventory, ['listing-id-1', 'listing-id-2'])
+    listed_item._item.price = 90.0
+
+    mock_stockx.batch.update_listings = AsyncMock(
+        return_value=MagicMock(batch_id='batch-id')
+    )
+
+    mock_stockx.batch.update_listings_status = AsyncMock(
+        return_value=batch_status('batch-id', completed=True)
+    )
+    mock_stockx.batch.update_listings_items = AsyncMock(
+        return_value=[
+            MagicMock(
+                spec=stockx.BatchUpdateResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_input=MagicMock(listing_id=listing_id),
+                error='',
+            )
+            for listing_id in ('listing-id-1', 'listing-id-2')
+        ]
+    )
+
+    results = [
+        result async for result 
+        in stream_update_listings(mock_stockx, [listed_item])
+    ]
+
+    assert len(results) == 1
+    assert results[0].item is listed_item
+    assert results[0].updated == ('listing-id-1', 'listing-id-2')
+
+
+@pytest.mark.asyncio
+async def test_update_listings_submission_failure(monkeypatch, mock_stockx, item):
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', AsyncMock())
+    inventory = MagicMock(currency=stockx.Currency.EUR)
+    listed_item = ListedItem(
+        item, inventory, ['listing-id-1', 'listing-id-2', 'listing-id-3']
+    )
+    first_completed = asyncio.Event()
+
+    async def submit(inputs):
+        [listing_input] = inputs
+        match listing_input.listing_id:
+            case 'listing-id-2':
+                raise StockXInternalServerError('Submission failed.')
+            case 'listing-id-3':
+                # Accepted after the failure
+                await first_completed.wait()
+        batch_id = listing_input.listing_id.replace('listing-id', 'batch')
+        return MagicMock(batch_id=batch_id)
+
+    async def get_items(batch_id):
+        first_completed.set()
+        return [
+            MagicMock(
+                spec=stockx.BatchUpdateResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_input=MagicMock(listing_id='listing-id-1'),
+                error='',
+            )
+        ]
+
+    mock_stockx.batch.update_listings = submit
+    mock_stockx.batch.update_listings_status = AsyncMock(
+        side_effect=lambda batch_id: batch_status(
+            batch_id, completed=batch_id == 'batch-1'
+        )
+    )
+    mock_stockx.batch.update_listings_items = get_items
+
+    with pytest.raises(StockXIncompleteOperation) as exc_info:
+        await asyncio.wait_for(
+            update_listings(mock_stockx, [listed_item], batch_size=1), 
+            timeout=1,
+        )
+
+    assert exc_info.value.timed_out_batch_ids == ['batch-3']
+    assert exc_info.value.batch_operations == {
+        'batch-3': stockx.BatchOperationType.UPDATE
+    }
+    [result] = exc_info.value.partial_results
+    assert result.updated == ('listing-id-1',)
+
+
+@pytest.mark.asyncio
+async def test_batch_completion_polls_while_submitting(monkeypatch):
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', AsyncMock())
+    events = []
+    second_submitted = asyncio.Event()
+
+    async def submissions():
+        events.append('submit batch-1')
+        yield 'batch-1'
+        await second_submitted.wait()
+        events.append('submit batch-2')
+        yield 'batch-2'
+
+    async def get_status(batch_id):
+        events.append(f'poll {batch_id}')
+        second_submitted.set()
+        return batch_status(batch_id, completed=True)
+
+    completed = [
+        batch_id async for batch_id 
+        in batch_completion(submissions(), get_status, timeout=60)
+    ]
+
+    assert completed == ['batch-1', 'batch-2']
+    assert events == [
+        'submit batch-1', 'poll batch-1', 'submit batch-2', 'poll batch-2'
+    ]
@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from stockx.concurrency import map_bounded
+
+
+@pytest.mark.asyncio
+async def test_map_bounded():
+    running = 0
+    max_running = 0
+
+    async def double(value: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (10 - value))
+        running -= 1
+        return value * 2
+
+    results = await map_bounded(double, range(10), limit=3)
+
+    assert results == [value * 2 for value in range(10)]
+    assert max_running == 3
@@ -0,0 +1,91 @@
+import csv
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import stockx
+from stockx.ext.export import export, flatten, model_columns
+
+
+def order(number: int) -> stockx.Order:
+    return stockx.Order.from_json({
+        'orderNumber': f'order-{number}',
+        'listingId': f'listing-{number}',
+        'amount': '100',
+        'status': 'COMPLETED',
+        'currencyCode': 'EUR',
+        'product': {'productId': 'product-id', 'styleId': 'DD1391-100'},
+        'variant': {'variantId': 'variant-id', 'variantValue': '10'},
+        'payout': {
+            'totalPayout': '88',
+            'adjustments': [
+                {'adjustmentType': 'Transaction Fee', 'amount': '-9', 'percentage': '0.09'},
+            ],
+        },
+        'createdAt': datetime(2025, 1, number, tzinfo=timezone.utc).isoformat(),
+    })
+
+
+async def orders(count: int):
+    for number in range(1, count + 1):
+        yield order(number)
+
+
+def test_flatten():
+    columns = model_columns(stockx.Order)
+    assert 'product.style_id' in columns
+    assert 'payout.adjustments' in columns
+
+    row = flatten(order(1), ['status', 'product.style_id', 'payout.adjustments'])
+
+    assert row['status'] == 'COMPLETED'
+    assert row['product.style_id'] == 'DD1391-100'
+    assert json.loads(row['payout.adjustments'])[0]['adjustmentType'] == 'Transaction Fee'
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson(tmp_path):
+    count = await export(orders(5), tmp_path / 'orders.ndjson', chunk_size=2)
+
+    lines = (tmp_path / 'orders.ndjson').read_text().splitlines()
+    assert count == len(lines) == 5
+    assert json.loads(lines[0])['created_at'] == '2025-01-01T00:00:00+00:00'
+
+
+@pytest.mark.asyncio
+async def test_export_csv_projection_and_files(tmp_path):
+    columns = ['order_number', 'product.style_id', 'amount']
+    count = await export(
+        orders(5),
+        tmp_path / 'orders.csv',
+        columns=columns,
+        chunk_size=2,
+        rows_per_file=3,
+    )
+
+    first, second = sorted(tmp_path.glob('orders-*.csv'))
+    with first.open() as file:
+        rows = list(csv.reader(file))
+    assert count == 5
+    assert rows[0] == columns
+    assert rows[1] == ['order-1', 'DD1391-100', '100.0']
+    assert len(rows) == 4
+    assert len(second.read_text().splitlines()) == 3
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+
+    await export(orders(3), tmp_path / 'orders.parquet', chunk_size=2)
+
+    table = pq.read_table(tmp_path / 'orders.parquet')
+    assert table.num_rows == 3
+    assert table.column('product.style_id').to_pylist() == ['DD1391-100'] * 3
+
+
+@pytest.mark.asyncio
+async def test_export_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        await export([], tmp_path / 'orders.xlsx')
@@ -0,0 +1,49 @@
+from types import SimpleNamespace
+
+from stockx.filter import Filter, compile_filters
+
+
+def test_filter_compile_membership():
+    _filter = Filter(SimpleNamespace, getter=lambda obj: obj.size)
+    assert _filter.compile() is None
+
+    _filter.include(['9', '10'])
+    predicate = _filter.compile()
+
+    assert predicate(SimpleNamespace(size='10'))
+    assert not predicate(SimpleNamespace(size='11'))
+
+
+def test_filter_compile_memoizes_condition():
+    calls = []
+
+    def condition(style_id, allowed):
+        calls.append(style_id)
+        return not allowed.isdisjoint(style_id.split('/'))
+
+    _filter = Filter(
+        SimpleNamespace, 
+        getter=lambda obj: obj.style_id, 
+        condition=condition, 
+        memoize=True,
+    )
+    _filter.include(['B'])
+    predicate = _filter.compile()
+
+    results = [predicate(SimpleNamespace(style_id=s)) for s in ('A/B', 'A/B', 'C')]
+
+    assert results == [True, True, False]
+    assert calls == ['A/B', 'C']
+
+
+def test_compile_filters_skips_empty_filters():
+    sizes = Filter(SimpleNamespace, getter=lambda obj: obj.size)
+    products = Filter(SimpleNamespace, getter=lambda obj: obj.product_id)
+    assert compile_filters([sizes, products])(SimpleNamespace())
+
+    sizes.include(['10'])
+    products.include(['product-1'])
+    predicate = compile_filters([sizes, products])
+
+    assert predicate(SimpleNamespace(size='10', product_id='product-1'))
+    assert not predicate(SimpleNamespace(size='10', product_id='product-2'))
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+import stockx
+from stockx.errors import StockXRequestError
+from stockx.ext.history import HistoryScanner
+
+
+START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def order(day: int) -> stockx.Order:
+    return stockx.Order.from_json({
+        'orderNumber': f'order-{day}',
+        'listingId': f'listing-{day}',
+        'amount': '100',
+        'status': 'COMPLETED',
+        'currencyCode': 'EUR',
+        'product': {'productId': 'product-id'},
+        'variant': {'variantId': 'variant-id'},
+        'createdAt': (START + timedelta(days=day)).isoformat(),
+    })
+
+
+class FakeOrders:
+    def __init__(self, days: int):
+        self.history = [order(day) for day in range(days)]
+        self.windows = []
+
+    async def get_orders_history(self, from_date, to_date, **kwargs):
+        self.windows.append((from_date, to_date))
+        # Later windows complete first
+        await asyncio.sleep(0.01 if from_date == START else 0)
+        for order in self.history:
+            if from_date.date() <= order.created_at.date() <= to_date.date():
+                yield order
+
+
+@pytest.mark.asyncio
+async def test_history_scan_ordered():
+    orders = FakeOrders(days=100)
+    scanner = HistoryScanner(
+        MagicMock(orders=orders),
+        window=timedelta(days=10),
+        pages_per_window=2,
+        page_size=10,
+    )
+
+    scanned = [
+        order async for order in
+        scanner.scan(from_date=START, to_date=START + timedelta(days=99))
+    ]
+
+    assert scanned == orders.history
+    assert len(orders.windows) > 1
+    # One order per day, so windows of 2 pages of 10 orders span 20 days
+    assert scanner.next_window_size() == timedelta(days=20)
+
+
+@pytest.mark.asyncio
+async def test_history_scan_unordered():
+    orders = FakeOrders(days=60)
+    scanner = HistoryScanner(MagicMock(orders=orders), window=timedelta(days=7))
+
+    scanned = [
+        order async for order in
+        scanner.scan(
+            from_date=START,
+            to_date=START + timedelta(days=59),
+            ordered=False,
+        )
+    ]
+
+    assert scanned != orders.history
+    assert sorted(scanned, key=lambda order: order.created_at) == orders.history
+
+
+def test_history_window_size_grows_over_empty_ranges():
+    scanner = HistoryScanner(MagicMock(), window=timedelta(days=30))
+    assert scanner.next_window_size() == timedelta(days=30)
+
+    scanner._days = 120
+    assert scanner.next_window_size() == timedelta(days=240)
+
+    scanner._days = 1000
+    assert scanner.next_window_size() == scanner.max_window
+
+
+@pytest.mark.asyncio
+async def test_history_scan_error():
+    class FailingOrders:
+        async def get_orders_history(self, **kwargs):
+            raise StockXRequestError('Server error')
+            yield
+
+    scanner = HistoryScanner(MagicMock(orders=FailingOrders()))
+    with pytest.raises(StockXRequestError):
+        async for _ in scanner.scan(from_date=START):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_history_scan_naive_dates():
+    orders = FakeOrders(days=0)
+    scanner = HistoryScanner(MagicMock(orders=orders))
+    from_date = datetime.now() - timedelta(days=3)
+
+    assert [order async for order in scanner.scan(from_date=from_date)] == []
+    [(window_from, window_to)] = orders.windows
+    assert window_from == from_date
+    assert window_to.tzinfo is None
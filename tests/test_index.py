@@ -0,0 +1,115 @@
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+import stockx
+from stockx.ext.inventory import Inventory, InventoryIndex, UpdateResult
+
+
+def listing(
+        listing_id: str,
+        variant_id: str = 'variant-id',
+        amount: float = 100.0,
+        status: str = 'ACTIVE',
+) -> stockx.Listing:
+    return stockx.Listing.from_json({
+        'listingId': listing_id,
+        'status': status,
+        'amount': str(amount),
+        'currencyCode': 'EUR',
+        'inventoryType': 'STANDARD',
+        'product': {'productId': 'product-id', 'styleId': 'STYLE-1'},
+        'variant': {'variantId': variant_id, 'variantValue': '10'},
+        'updatedAt': '2024-12-01T10:00:00+00:00',
+    })
+
+
+class FakeListings:
+    def __init__(self, *pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    async def get_all_listings(self, **kwargs):
+        self.calls.append(kwargs)
+        for item in self.pages.pop(0):
+            yield item
+
+
+@pytest.fixture
+def fake_stockx():
+    return MagicMock(listings=FakeListings())
+
+
+@pytest.mark.asyncio
+async def test_index_syncs_incrementally(fake_stockx):
+    fake_stockx.listings.pages = [
+        [listing('listing-1'), listing('listing-2')],
+        [listing('listing-2', status='INACTIVE'), listing('listing-3')],
+    ]
+    index = InventoryIndex(max_staleness=0)
+
+    await index.refresh(fake_stockx)
+    await index.refresh(fake_stockx)
+
+    full, incremental = fake_stockx.listings.calls
+    assert 'from_date' not in full
+    assert incremental['from_date'] <= index.last_sync - timedelta(days=1)
+    assert {l.id for l in index.listings()} == {'listing-1', 'listing-3'}
+
+
+@pytest.mark.asyncio
+async def test_index_reconciles_periodically(fake_stockx):
+    fake_stockx.listings.pages = [[listing('listing-1')], [listing('listing-2')]]
+    index = InventoryIndex(max_staleness=0)
+    await index.sync(fake_stockx)
+
+    index.last_full_sync -= timedelta(days=2)
+    await index.refresh(fake_stockx)
+
+    assert 'from_date' not in fake_stockx.listings.calls[1]
+    assert [l.id for l in index.listings()] == ['listing-2']
+
+
+@pytest.mark.asyncio
+async def test_index_apply_results(fake_stockx):
+    fake_stockx.listings.pages = [[listing('listing-1'), listing('listing-2')]]
+    index = InventoryIndex()
+    await index.sync(fake_stockx)
+
+    item = MagicMock(price=90.0)
+    index.apply([UpdateResult(item, updated=('listing-1',), deleted=('listing-2',))])
+
+    assert [(l.id, l.amount) for l in index.listings()] == [('listing-1', 90.0)]
+    assert not index.stale()
+    index.apply([UpdateResult(item, created=('listing-3',))])
+    assert index.stale()
+
+
+@pytest.mark.asyncio
+async def test_index_persistence(fake_stockx, tmp_path):
+    fake_stockx.listings.pages = [[listing('listing-1')]]
+    path = tmp_path / 'index.json'
+    index = InventoryIndex.open(path)
+    await index.sync(fake_stockx)
+
+    loaded = InventoryIndex.open(path)
+
+    assert list(loaded.listings()) == list(index.listings())
+    assert loaded.last_sync == index.last_sync
+
+
+@pytest.mark.asyncio
+async def test_items_query_uses_index(fake_stockx):
+    fake_stockx.listings.pages = [[
+        listing('listing-1'), 
+        listing('listing-2', variant_id='variant-2'),
+    ]]
+    inventory = Inventory(fake_stockx, index=InventoryIndex())
+
+    items = await inventory.items().filter_by(variant_ids=['variant-2']).all()
+    items_again = await inventory.items().all()
+
+    assert len(fake_stockx.listings.calls) == 1
+    assert [item.listing_ids for item in items] == [['listing-2']]
+    assert len(items_again) == 2
@@ -215,3 +215,44 @@ def test_inventory_calculate_payout(mock_stockx):
     assert inventory.calculate_payout(amount) == expected_payout
 
 
+
+
+@pytest.mark.asyncio
+async def test_inventory_stream_update_requeues_unapplied(
+    mock_stockx,
+    item,
+    monkeypatch,
+):
+    async def stream_update_listings(items, **kwargs):
+        for listed_item in items:
+            yield stockx.ext.inventory.UpdateResult(listed_item)
+
+    update_quantity = AsyncMock(return_value=[])
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.stream_update_listings',
+        stream_update_listings,
+    )
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_quantity', update_quantity
+    )
+
+    inventory = Inventory(mock_stockx)
+    first = ListedItem(item, inventory, ['listing-id-1'])
+    second = ListedItem(
+        stockx.ext.inventory.Item('product-id', 'variant-id-2', price=50.0),
+        inventory,
+        ['listing-id-2'],
+    )
+    first.price = 110.0
+    second.price = 60.0
+    second.quantity += 1
+
+    # Consumer stops after the first result
+    stream = inventory.stream_update()
+    async for result in stream:
+        break
+    await stream.aclose()
+
+    update_quantity.assert_not_awaited()
+    assert inventory._price_updates == {first, second} - {result.item}
+    assert inventory._quantity_updates == {second}
@@ -0,0 +1,53 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.ext.inventory import Item, SkuSizeRow
+
+
+class FakeCatalog:
+    def __init__(self):
+        self.searches = []
+        self.get_all_product_variants = AsyncMock(
+            side_effect=lambda product_id: [
+                MagicMock(
+                    spec=stockx.Variant, 
+                    id=f'{product_id}-{size}', 
+                    variant_value=size,
+                )
+                for size in ('9', '9.5', '10')
+            ]
+        )
+
+    async def search_catalog(self, query, page_size=10, limit=None):
+        self.searches.append(query)
+        if query.startswith('MISSING'):
+            return
+        yield MagicMock(spec=stockx.Product, id=f'product-{query}', style_id=query)
+
+
+@pytest.mark.asyncio
+async def test_item_from_sku_sizes():
+    catalog = FakeCatalog()
+    fake_stockx = MagicMock(catalog=catalog)
+
+    items, unresolved = await Item.from_sku_sizes(fake_stockx, [
+        ('BULK-1', '9', 100.0),
+        SkuSizeRow('BULK-2', '10', 120.0, quantity=3),
+        ('BULK-1', '9.5', 110.0, 2),
+        ('BULK-1', '13', 110.0),
+        ('MISSING-1', '9', 90.0),
+    ])
+
+    assert [(i.variant_id, i.price, i.quantity) for i in items] == [
+        ('product-BULK-1-9', 100.0, 1),
+        ('product-BULK-2-10', 120.0, 3),
+        ('product-BULK-1-9.5', 110.0, 2),
+    ]
+    assert unresolved == [
+        SkuSizeRow('BULK-1', '13', 110.0),
+        SkuSizeRow('MISSING-1', '9', 90.0),
+    ]
+    assert sorted(catalog.searches) == ['BULK-1', 'BULK-2', 'MISSING-1']
+    assert catalog.get_all_product_variants.await_count == 2
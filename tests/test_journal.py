@@ -0,0 +1,128 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.errors import StockXIncompleteOperation
+from stockx.ext.inventory import Inventory, Item, Journal, ListedItem, UpdateResult
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return Journal(tmp_path / 'inventory.journal')
+
+
+def test_journal_state(journal, item):
+    inventory = MagicMock()
+    first = ListedItem(item, inventory, ['listing-1'])
+    second = ListedItem(
+        Item('product-id', 'variant-id-2', price=50.0), inventory, ['listing-2']
+    )
+
+    journal.record_change(first)
+    first._item.price = 80.0
+    journal.record_change(first)
+    journal.record_change(second)
+    journal.record_applied([second])
+    journal.record_timed_out({'batch-1': stockx.BatchOperationType.UPDATE})
+
+    state = Journal(journal.path).state()
+
+    [change] = state.changes
+    assert change.listing_ids == ('listing-1',)
+    assert change.price == 80.0
+    assert state.timed_out_batches == {'batch-1': stockx.BatchOperationType.UPDATE}
+
+
+def test_journal_compact(journal, item):
+    listed_item = ListedItem(item, MagicMock(), ['listing-1'])
+    journal.record_change(listed_item)
+    journal.record_applied([listed_item])
+
+    journal.compact()
+
+    assert journal.path.read_text() == ''
+    assert journal.state().empty()
+
+
+@pytest.mark.asyncio
+async def test_inventory_journals_timed_out_updates(
+    mock_stockx,
+    item,
+    journal,
+    monkeypatch,
+):
+    async def update_listings(items, **kwargs):
+        raise StockXIncompleteOperation(
+            'Timed out',
+            partial_results=[],
+            timed_out_batch_ids=['batch-1'],
+            batch_operations={'batch-1': stockx.BatchOperationType.UPDATE},
+        )
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_listings', update_listings
+    )
+
+    inventory = Inventory(mock_stockx, journal=journal)
+    listed_item = ListedItem(item, inventory, ['listing-1'])
+    listed_item.price = 90.0
+
+    with pytest.raises(StockXIncompleteOperation):
+        await inventory.update()
+
+    state = journal.state()
+    assert [change.price for change in state.changes] == [90.0]
+    assert list(state.timed_out_batches) == ['batch-1']
+
+
+@pytest.mark.asyncio
+async def test_inventory_recover(mock_stockx, item, journal, monkeypatch):
+    # Previous run: registered change never applied
+    previous = ListedItem(item, MagicMock(), ['listing-1', 'listing-2'])
+    previous._item.price = 90.0
+    journal.record_change(previous)
+    journal.close()
+
+    updated = []
+
+    async def update_listings(items, **kwargs):
+        updated.extend(items)
+        return [UpdateResult(item, updated=tuple(item.listing_ids)) for item in items]
+
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_listings', update_listings
+    )
+    inventory = Inventory(mock_stockx, journal=Journal(journal.path))
+    current = ListedItem(
+        Item('product-id', 'variant-id', price=100.0), 
+        inventory, 
+        ['listing-2', 'listing-3'],
+    )
+    query = MagicMock()
+    query.filter_by.return_value.all = AsyncMock(return_value=[current])
+    monkeypatch.setattr(Inventory, 'items', lambda self: query)
+
+    results = await inventory.recover()
+
+    assert updated == [current]
+    assert current.price == 90.0
+    assert len(results) == 1
+    assert inventory.journal.state().empty()
+
+
+@pytest.mark.asyncio
+async def test_inventory_journals_change_price(mock_stockx, item, journal, monkeypatch):
+    async def update_listings(items, **kwargs):
+        return [UpdateResult(item, updated=tuple(item.listing_ids)) for item in items]
+
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_listings', update_listings
+    )
+    inventory = Inventory(mock_stockx, journal=journal)
+    listed_item = ListedItem(item, inventory, ['listing-1'])
+
+    await inventory.change_price([listed_item], new_price=80.0)
+    await inventory.update()
+
+    assert listed_item.price == 80.0
+    assert journal.state().empty()
@@ -0,0 +1,75 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.api.listings import Listings
+from stockx.errors import StockXOperationTimeout
+
+
+def operation(status: stockx.OperationStatus, id: str = 'operation-id'):
+    return MagicMock(
+        spec=stockx.Operation, id=id, listing_id='listing-id', status=status
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr('stockx.api.listings.asyncio.sleep', sleep)
+    return sleeps
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_backs_off(sleeps):
+    listings = Listings(MagicMock())
+    listings.get_listing_operation = AsyncMock(side_effect=[
+        operation(stockx.OperationStatus.PENDING),
+        operation(stockx.OperationStatus.PENDING),
+        operation(stockx.OperationStatus.SUCCEEDED),
+    ])
+
+    result = await listings.wait_for_operation(
+        operation(stockx.OperationStatus.PENDING)
+    )
+
+    assert result.status == stockx.OperationStatus.SUCCEEDED
+    assert sleeps == [0.5, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_operation_timeout():
+    listings = Listings(MagicMock())
+    listings.get_listing_operation = AsyncMock(
+        return_value=operation(stockx.OperationStatus.PENDING)
+    )
+
+    with pytest.raises(StockXOperationTimeout) as exc_info:
+        await listings.wait_for_operation(
+            operation(stockx.OperationStatus.PENDING), timeout=0.01
+        )
+    assert exc_info.value.operation_id == 'operation-id'
+
+
+@pytest.mark.asyncio
+async def test_operations_succeeded(sleeps):
+    listings = Listings(MagicMock())
+    listings.get_listing_operation = AsyncMock(
+        side_effect=lambda listing_id, operation_id: operation(
+            stockx.OperationStatus.FAILED if operation_id == 'failed'
+            else stockx.OperationStatus.SUCCEEDED
+        )
+    )
+
+    succeeded = await listings.operations_succeeded([
+        operation(stockx.OperationStatus.PENDING, id='succeeded'),
+        operation(stockx.OperationStatus.PENDING, id='failed'),
+        operation(stockx.OperationStatus.SUCCEEDED),
+    ])
+
+    assert succeeded == [True, False, True]
+    assert sleeps == [0.5, 0.5]
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+import stockx
+from stockx.ext.inventory.market import MarketSnapshot
+
+
+def market_data(variant_id: str) -> stockx.MarketData:
+    return MagicMock(
+        spec=stockx.MarketData,
+        variant_id=variant_id,
+        currency_code=stockx.Currency.EUR,
+        lowest_ask_amount=100.0,
+        highest_bid_amount=90.0,
+        earn_more_amount=95.0,
+        sell_faster_amount=92.0,
+        flex_lowest_ask_amount=110.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_market_snapshot_shares_product_fetch():
+    fetches = []
+
+    async def fetch(product_id):
+        fetches.append(product_id)
+        await asyncio.sleep(0)
+        return [market_data('variant-1'), market_data('variant-2')]
+
+    snapshot = MarketSnapshot(fetch, payout_calculator=lambda x: x * 0.9)
+    first, second, missing = await asyncio.gather(
+        snapshot.variant('product-id', 'variant-1'),
+        snapshot.variant('product-id', 'variant-2'),
+        snapshot.variant('product-id', 'variant-3'),
+    )
+
+    assert fetches == ['product-id']
+    assert first.lowest_ask.amount == 100.0
+    assert first.lowest_ask.payout == 90.0
+    assert second is not None
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_market_snapshot_expires_and_invalidates():
+    fetches = []
+
+    async def fetch(product_id):
+        fetches.append(product_id)
+        return [market_data('variant-1')]
+
+    snapshot = MarketSnapshot(fetch, payout_calculator=lambda x: x, ttl=60)
+    await snapshot.product('product-id')
+    await snapshot.product('product-id')
+    assert len(fetches) == 1
+
+    snapshot.invalidate()
+    await snapshot.product('product-id')
+    assert len(fetches) == 2
+
+    snapshot.ttl = -1
+    await snapshot.product('product-id')
+    assert len(fetches) == 3
+
+
+@pytest.mark.asyncio
+async def test_market_snapshot_discards_failed_fetch():
+    calls = 0
+
+    async def fetch(product_id):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError('unavailable')
+        return [market_data('variant-1')]
+
+    snapshot = MarketSnapshot(fetch, payout_calculator=lambda x: x)
+    with pytest.raises(RuntimeError):
+        await snapshot.product('product-id')
+
+    assert 'variant-1' in await snapshot.product('product-id')
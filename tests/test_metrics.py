@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.api.batch import batch_completed
+from stockx.api.client.retry import retry
+from stockx.api.client.throttle import throttle
+from stockx.cache import cache_by
+from stockx.errors import StockXRequestError
+from stockx.metrics import (
+    Histogram,
+    MetricsRecorder,
+    endpoint_template,
+    use_metrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    recorder = MetricsRecorder()
+    use_metrics(recorder)
+    yield recorder
+    use_metrics(None)
+
+
+def test_histogram_quantiles():
+    histogram = Histogram()
+    for value in range(1, 1001):
+        histogram.record(value / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.mean == pytest.approx(0.5005)
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.1)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.1)
+    assert histogram.quantile(1) == 1
+
+    other = Histogram()
+    other.record(5)
+    histogram.merge(other)
+    assert histogram.count == 1001
+    assert histogram.max == 5
+
+
+def test_endpoint_template():
+    assert endpoint_template(
+        '/catalog/products/5e6a1e57-1c7d-435a-82bd-5666a13560fe/variants'
+    ) == '/catalog/products/{id}/variants'
+    assert endpoint_template('/selling/orders/75238716-75138474') == '/selling/orders/{id}'
+    assert endpoint_template('/catalog/search') == '/catalog/search'
+
+
+@pytest.mark.asyncio
+async def test_request_metrics(metrics):
+    response = MagicMock(status=200, reason='OK')
+    response.json = AsyncMock(return_value={'productId': 'product-id'})
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=response)
+    request.__aexit__ = AsyncMock(return_value=None)
+
+    client = stockx.StockXAPIClient('host', 'v2', 'key', 'id', 'secret', 'token')
+    client._auth_headers = {'x-api-key': 'key'}
+    client._session = MagicMock(request=MagicMock(return_value=request))
+
+    # Call without the throttle and retry decorators
+    do = stockx.StockXAPIClient._do.__wrapped__.__wrapped__
+    await do(client, 'GET', '/catalog/products/abc-123')
+
+    assert metrics.requests == {('GET', '/catalog/products/{id}', 200): 1}
+    assert metrics.latency['GET', '/catalog/products/{id}'].count == 1
+
+
+@pytest.mark.asyncio
+async def test_throttle_and_retry_metrics(metrics):
+    attempts = 0
+
+    @throttle(seconds=0)
+    @retry(max_attempts=3, initial_delay=0, timeout=10)
+    async def request():
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise StockXRequestError('Unavailable', status_code=503)
+        return attempts
+
+    await asyncio.gather(request(), request(), request())
+
+    assert metrics.throttle_wait.count == 3
+    assert metrics.max_queue_depth == 2
+    assert metrics.retries == {503: 1}
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics(metrics):
+    @cache_by('product_id')
+    async def get_product(product_id):
+        return {'productId': product_id}
+
+    await get_product('product-1')
+    await get_product('product-1')
+    await get_product('product-2')
+
+    name = get_product.__qualname__
+    assert metrics.cache_hits[name] == 1
+    assert metrics.cache_misses[name] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_metrics(metrics):
+    async def create_listings_status(batch_id):
+        return MagicMock(
+            spec=stockx.BatchStatus,
+            status=stockx.BatchOperationStatus.COMPLETED,
+        )
+
+    await batch_completed(['batch-1', 'batch-2'], create_listings_status, timeout=60)
+
+    assert metrics.batch_durations['create_listings'].count == 2
+
+
+def test_prometheus_metrics():
+    prometheus_client = pytest.importorskip('prometheus_client')
+    from stockx.metrics import PrometheusMetrics
+
+    registry = prometheus_client.CollectorRegistry()
+    metrics = PrometheusMetrics(registry)
+    metrics.request('GET', '/catalog/search', 200, 0.2)
+
+    assert registry.get_sample_value(
+        'stockx_requests_total',
+        {'method': 'GET', 'endpoint': '/catalog/search', 'status': '200'},
+    ) == 1
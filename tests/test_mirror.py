@@ -0,0 +1,70 @@
+import pytest
+
+import stockx
+from stockx.ext import CatalogMirror
+
+
+def product(product_id, title, style_id='', brand='', colorway=''):
+    return stockx.Product(
+        product_id=product_id,
+        title=title,
+        style_id=style_id,
+        brand=brand,
+        product_attributes=stockx.ProductAttributes(colorway=colorway),
+    )
+
+
+@pytest.fixture
+def mirror():
+    mirror = CatalogMirror()
+    mirror.update([
+        product(
+            'dunk', 'Nike Dunk Low Retro White Black', 
+            'DD1391-100', 'Nike', 'White/Black',
+        ),
+        product(
+            'jordan', 'Jordan 1 Retro High OG Chicago', 
+            '555088-101', 'Jordan', 'White/Varsity Red',
+        ),
+        product(
+            'samba', 'adidas Samba OG Cloud White', 
+            'B75806', 'adidas', 'Cloud White/Core Black',
+        ),
+    ])
+    return mirror
+
+
+def test_mirror_search_exact_and_prefix(mirror):
+    assert [hit.product.id for hit in mirror.search('dunk low')] == ['dunk']
+    assert [hit.product.id for hit in mirror.search('jor chi')] == ['jordan']
+    assert [hit.product.id for hit in mirror.search('DD1391-100')] == ['dunk']
+
+
+def test_mirror_search_fuzzy(mirror):
+    assert [hit.product.id for hit in mirror.search('jordn chicgo')] == ['jordan']
+    assert mirror.search('jordn chicgo', fuzzy=False) == []
+
+
+def test_mirror_search_ranking(mirror):
+    hits = mirror.search('white')
+    assert {hit.product.id for hit in hits} == {'dunk', 'jordan', 'samba'}
+    # Title matches rank above colorway-only matches
+    assert hits[-1].product.id == 'jordan'
+    assert hits == sorted(hits, key=lambda hit: -hit.score)
+
+
+def test_mirror_update_and_remove(mirror):
+    mirror.add(product('dunk', 'Nike Dunk High Panda', 'DD1399-105', 'Nike'))
+    assert mirror.search('low retro') == []
+    assert [hit.product.id for hit in mirror.search('panda')] == ['dunk']
+
+    mirror.remove('dunk')
+    assert mirror.search('panda') == []
+    assert 'dunk' not in mirror
+
+
+def test_mirror_persistence(mirror, tmp_path):
+    mirror.save(tmp_path / 'catalog.json')
+    loaded = CatalogMirror.open(tmp_path / 'catalog.json')
+    assert len(loaded) == 3
+    assert loaded.search('samba') == mirror.search('samba')
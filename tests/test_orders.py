@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.api.base import StockXAPIBase
+from stockx.ext import OrderSync
+
+
+NOW = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+
+def order(number: str, status: str, days_ago: int = 0) -> stockx.Order:
+    return stockx.Order.from_json({
+        'orderNumber': number,
+        'listingId': f'listing-{number}',
+        'amount': '100',
+        'status': status,
+        'currencyCode': 'EUR',
+        'product': {'productId': 'product-id'},
+        'variant': {'variantId': 'variant-id'},
+        'createdAt': (NOW - timedelta(days=days_ago)).isoformat(),
+    })
+
+
+class FakeOrders:
+    def __init__(self):
+        self.history = []
+        self.active = []
+        self.history_calls = []
+        self.get_order = AsyncMock()
+
+    async def get_orders_history(self, **kwargs):
+        self.history_calls.append(kwargs)
+        for order in self.history:
+            yield order
+
+    async def get_active_orders(self, **kwargs):
+        for order in self.active:
+            yield order
+
+
+@pytest.mark.asyncio
+async def test_order_sync_incremental(tmp_path):
+    orders = FakeOrders()
+    fake_stockx = MagicMock(orders=orders)
+    store = OrderSync(tmp_path / 'orders.json')
+
+    orders.history = [order('1', 'COMPLETED', days_ago=5)]
+    orders.active = [order('2', 'SHIPPED', days_ago=1)]
+    changed = await store.sync(fake_stockx)
+
+    assert {o.number for o in changed} == {'1', '2'}
+    assert store.high_water_mark == NOW - timedelta(days=1)
+    assert orders.history_calls[0]['from_date'] is None
+
+    # Order 2 completed and left the active orders
+    orders.history = []
+    orders.active = [order('3', 'CREATED')]
+    orders.get_order.return_value = order('2', 'COMPLETED', days_ago=1)
+    reloaded = OrderSync.open(tmp_path / 'orders.json')
+    changed = await reloaded.sync(fake_stockx)
+
+    assert orders.history_calls[1]['from_date'] == NOW - timedelta(days=2)
+    orders.get_order.assert_awaited_once_with('2')
+    assert {o.number for o in changed} == {'2', '3'}
+    assert reloaded.get('2').status == stockx.OrderStatusClosed.COMPLETED
+    assert [o.number for o in reloaded.pending()] == ['3']
+
+
+@pytest.mark.asyncio
+async def test_page_prefetch():
+    pages = {
+        1: {'orders': [1, 2], 'hasNextPage': True},
+        2: {'orders': [3, 4], 'hasNextPage': True},
+        3: {'orders': [5], 'hasNextPage': False},
+    }
+    requested = []
+
+    async def get(endpoint, params):
+        requested.append(params['pageNumber'])
+        return MagicMock(data=pages[params['pageNumber']])
+
+    api = StockXAPIBase(MagicMock(get=get))
+    results = api._page('/orders', 'orders', prefetch=True)
+
+    assert await anext(results) == 1
+    await asyncio.sleep(0)
+    assert requested == [1, 2], 'Next page should be requested right away'
+    assert [item async for item in results] == [2, 3, 4, 5]
+    assert requested == [1, 2, 3]
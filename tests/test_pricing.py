@@ -0,0 +1,107 @@
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+import stockx
+from stockx.ext.inventory import ItemMarketData, MarketValue
+from stockx.ext.inventory import pricing
+from stockx.ext.inventory.pricing import (
+    Fees,
+    PricingInputs,
+    beat_lowest_ask,
+    calculate_payouts,
+    column,
+    evaluate_pricing,
+    where,
+)
+from stockx.ext.inventory.simulation import simulate
+
+
+FEES = Fees(
+    transaction_fee=0.1,
+    payment_fee=0.03,
+    shipping_fee=5.0,
+    minimum_transaction_fee=7.0,
+)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(pricing, 'np', None)
+    elif pricing.np is None:
+        pytest.skip('NumPy is not installed')
+    return request.param
+
+
+@pytest.fixture
+def inputs(backend):
+    items = [MagicMock(price=price, quantity=1) for price in (200.0, 50.0, 120.0)]
+    market_data = [
+        ItemMarketData(
+            currency=stockx.Currency.EUR, 
+            lowest_ask=MarketValue(180.0, 0.0)
+        ),
+        ItemMarketData(
+            currency=stockx.Currency.EUR, 
+            lowest_ask=MarketValue(45.0, 0.0)
+        ),
+        ItemMarketData(currency=stockx.Currency.EUR),
+    ]
+    return PricingInputs.from_items(items, market_data, FEES)
+
+
+def test_calculate_payouts(backend):
+    payouts = calculate_payouts([200.0, 50.0], FEES)
+
+    # The minimum transaction fee applies to the second amount
+    assert list(payouts) == pytest.approx([200 - 20 - 6 - 5, 50 - 7 - 1.5 - 5])
+    assert calculate_payouts(200.0, FEES) == pytest.approx(169.0)
+
+
+def test_evaluate_pricing(inputs):
+    def undercut(c):
+        new_price = c.lowest_ask - 1
+        return where(c.payout(new_price) > 100, new_price, c.price)
+
+    result = evaluate_pricing(inputs, undercut)
+
+    assert list(result.new_prices) == [179.0, 50.0, 120.0]
+    assert list(result.changed) == [True, False, False]
+    assert list(result.payouts) == pytest.approx(
+        list(calculate_payouts([179.0, 50.0, 120.0], FEES))
+    )
+    assert result.changes() == [(inputs.items[0], 179.0)]
+
+
+def test_evaluate_pricing_keeps_price_without_market_data(inputs):
+    result = evaluate_pricing(inputs, lambda c: c.lowest_ask)
+
+    assert list(result.new_prices) == [180.0, 45.0, 120.0]
+    assert list(result.changed) == [True, True, False]
+
+
+def test_beat_lowest_ask_strategy(inputs):
+    result = evaluate_pricing(
+        inputs, 
+        beat_lowest_ask(beat_by=2, condition=lambda c: c.lowest_ask > 100)
+    )
+
+    assert list(result.new_prices) == [178.0, 50.0, 120.0]
+
+
+def test_simulate(inputs):
+    inputs = replace(inputs, quantity=column([3, 1, 1]))
+
+    report = simulate(inputs, beat_lowest_ask(beat_by=1))
+
+    payout_delta = calculate_payouts(179.0, FEES) - calculate_payouts(200.0, FEES)
+    assert report.changed_count == 2
+    assert [price.new_price for price in report.prices()] == [179.0, 44.0]
+    assert report.prices()[0].payout_delta == pytest.approx(payout_delta)
+    assert len(report.prices(changed_only=False)) == 3
+    assert report.total_payout_delta == pytest.approx(
+        3 * payout_delta 
+        + calculate_payouts(44.0, FEES) - calculate_payouts(50.0, FEES)
+    )
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from stockx.processing import group_and_sum
+
+
+def test_group_and_sum():
+    items = [
+        SimpleNamespace(variant_id='1', price=100, quantity=2, ids=['a']),
+        SimpleNamespace(variant_id='2', price=200, quantity=1, ids=['b']),
+        SimpleNamespace(variant_id='1', price=100, quantity=3, ids=['c', 'd']),
+        SimpleNamespace(variant_id='1', price=110, quantity=1, ids=['e']),
+    ]
+
+    groups = list(group_and_sum(
+        iter(items), 
+        group_keys=('variant_id', 'price'), 
+        sum_attrs=('quantity', 'ids'),
+    ))
+
+    assert [(g.variant_id, g.price, g.quantity, g.ids) for g in groups] == [
+        ('1', 100, 5, ['a', 'c', 'd']),
+        ('2', 200, 1, ['b']),
+        ('1', 110, 1, ['e']),
+    ]
+
+
+def test_group_and_sum_does_not_mutate_items():
+    items = [
+        SimpleNamespace(variant_id='1', quantity=2, ids=['a']),
+        SimpleNamespace(variant_id='1', quantity=3, ids=['b']),
+    ]
+
+    group, = group_and_sum(
+        items, 
+        group_keys=('variant_id',), 
+        sum_attrs=('quantity', 'ids'),
+    )
+
+    assert group.quantity == 5
+    assert group.ids == ['a', 'b']
+    assert group is not items[0] and group is not items[1]
+    assert [(i.quantity, i.ids) for i in items] == [(2, ['a']), (3, ['b'])]
+
+
+def test_group_and_sum_unsortable_keys():
+    items = [
+        SimpleNamespace(key=None, quantity=1),
+        SimpleNamespace(key='a', quantity=1),
+        SimpleNamespace(key=None, quantity=1),
+    ]
+
+    groups = group_and_sum(items, group_keys=('key',), sum_attrs=('quantity',))
+
+    assert [(g.key, g.quantity) for g in groups] == [(None, 2), ('a', 1)]
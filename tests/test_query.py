@@ -0,0 +1,224 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.ext.inventory import AccessPath, Inventory
+
+
+def listing(
+        listing_id: str, 
+        variant_id: str, 
+        size: str, 
+        product_id: str = 'product-1',
+) -> stockx.Listing:
+    return stockx.Listing.from_json({
+        'listingId': listing_id,
+        'status': 'ACTIVE',
+        'amount': '100',
+        'currencyCode': 'EUR',
+        'inventoryType': 'STANDARD',
+        'product': {'productId': product_id, 'styleId': 'QUERY-STYLE-1'},
+        'variant': {'variantId': variant_id, 'variantValue': size},
+    })
+
+
+class FakeStockX:
+    def __init__(self, listings, count=None):
+        self.calls = []
+        self.count = count
+        # Product ID -> event its listings are held until
+        self.held = {}
+        self._listings = listings
+        self.catalog = MagicMock()
+        self.catalog.search_catalog = self.search_catalog
+        self.catalog.get_all_product_variants = AsyncMock(return_value=[
+            MagicMock(spec=stockx.Variant, id='variant-9', variant_value='9'),
+            MagicMock(spec=stockx.Variant, id='variant-10', variant_value='10'),
+        ])
+        self.listings = MagicMock()
+        self.listings.get_all_listings = self.get_all_listings
+        self.listings.count_listings = self.count_listings
+
+    async def search_catalog(self, query, **kwargs):
+        if query.startswith('QUERY-STYLE'):
+            yield MagicMock(spec=stockx.Product, id='product-1', style_id=query)
+        elif query == 'QUERY-PARTIAL':
+            yield MagicMock(
+                spec=stockx.Product, id='product-2', style_id='QUERY-PARTIAL-1/X'
+            )
+
+    async def count_listings(self, product_ids=None, **kwargs):
+        if self.count is not None:
+            return self.count
+        return sum(
+            listing.product.id in product_ids for listing in self._listings
+        )
+
+    async def get_all_listings(self, **kwargs):
+        self.calls.append(kwargs)
+        product_ids = kwargs.get('product_ids')
+        for listing in self._listings:
+            if not product_ids or listing.product.id in product_ids:
+                if listing.product.id in self.held:
+                    await self.held[listing.product.id].wait()
+                yield listing
+
+
+@pytest.fixture
+def fake_stockx():
+    return FakeStockX([
+        listing('listing-1', 'variant-9', '9'),
+        listing('listing-2', 'variant-10', '10'),
+    ], count=250)
+
+
+@pytest.mark.asyncio
+async def test_query_pushes_down_styles_and_sizes(fake_stockx):
+    inventory = Inventory(fake_stockx)
+
+    items = await (
+        inventory.items()
+        .filter_by(style_ids=['QUERY-STYLE-1'], sizes=['10'])
+        .all()
+    )
+
+    [call] = fake_stockx.calls
+    assert call['product_ids'] == {'product-1'}
+    assert call['variant_ids'] == {'variant-10'}
+    assert [item.listing_ids for item in items] == [['listing-2']]
+
+
+@pytest.mark.asyncio
+async def test_query_unresolved_style_scans_all(fake_stockx):
+    inventory = Inventory(fake_stockx)
+
+    items = await inventory.items().filter_by(style_ids=['UNKNOWN-1']).all()
+
+    [call] = fake_stockx.calls
+    assert call['product_ids'] is None
+    assert items == []
+
+
+@pytest.mark.asyncio
+async def test_query_partial_style_match_scans_all(fake_stockx):
+    inventory = Inventory(fake_stockx)
+
+    await inventory.items().filter_by(style_ids=['QUERY-PARTIAL']).all()
+
+    [call] = fake_stockx.calls
+    assert call['product_ids'] is None
+
+
+@pytest.mark.asyncio
+async def test_query_without_matching_variants_skips_requests(fake_stockx):
+    inventory = Inventory(fake_stockx)
+
+    items = await (
+        inventory.items()
+        .filter_by(style_ids=['QUERY-STYLE-2'], sizes=['14'])
+        .all()
+    )
+
+    assert fake_stockx.calls == []
+    assert items == []
+
+
+@pytest.mark.asyncio
+async def test_query_explain(fake_stockx):
+    query = Inventory(fake_stockx).items().filter_by(
+        style_ids=['QUERY-STYLE-3'], 
+        sizes=['10'],
+    )
+
+    plan = await query.explain(count=True)
+
+    assert plan.access_path is AccessPath.TARGETED
+    assert plan.server_filters == ('style_ids', 'sizes')
+    assert plan.variant_ids == {'variant-10'}
+    assert plan.estimated_pages == 3
+    assert plan.estimated_requests == plan.lookups + 3
+    assert fake_stockx.calls == [], 'Explain should not retrieve listings'
+
+
+@pytest.mark.asyncio
+async def test_query_explain_full_scan(fake_stockx):
+    query = (
+        Inventory(fake_stockx).items()
+        .filter_by(sizes=['10'])
+        .filter(lambda item: item.price > 50)
+    )
+
+    plan = await query.explain()
+
+    assert plan.access_path is AccessPath.FULL_SCAN
+    assert plan.server_filters == ()
+    assert plan.memory_filters == ('sizes', 'filter(0)')
+    assert plan.estimated_requests is None
+
+
+@pytest.mark.asyncio
+async def test_query_stats(fake_stockx):
+    query = Inventory(fake_stockx).items().filter_by(sizes=['10'])
+
+    items = await query.all()
+
+    assert query.stats.access_path is AccessPath.FULL_SCAN
+    assert query.stats.estimated_pages == 1
+    assert query.stats.listings_scanned == 2
+    assert query.stats.listings_matched == 1
+    assert query.stats.items_returned == len(items) == 1
+
+
+@pytest.mark.asyncio
+async def test_query_stream_partitions_by_product():
+    fake_stockx = FakeStockX([
+        listing('listing-1', 'variant-9', '9', product_id='product-1'),
+        listing('listing-2', 'variant-9', '9', product_id='product-1'),
+        listing('listing-3', 'variant-a', '9', product_id='product-2'),
+    ])
+    query = (
+        Inventory(fake_stockx).items()
+        .filter_by(product_ids=['product-1', 'product-2'])
+    )
+
+    fake_stockx.held['product-2'] = asyncio.Event()
+
+    stream = query.stream()
+    first = await asyncio.wait_for(anext(stream), timeout=1)
+
+    assert first.listing_ids == ['listing-1', 'listing-2']
+    assert [call['product_ids'] for call in fake_stockx.calls] == [
+        {'product-1'}, {'product-2'}
+    ], 'Products should be requested concurrently'
+
+    fake_stockx.held['product-2'].set()
+    rest = [item async for item in stream]
+    assert [item.listing_ids for item in rest] == [['listing-3']]
+    assert query.stats.items_returned == 2
+
+
+@pytest.mark.asyncio
+async def test_query_stream_full_scan_by_product():
+    fake_stockx = FakeStockX([
+        listing('listing-1', 'variant-9', '9', product_id='product-1'),
+        listing('listing-2', 'variant-9', '9', product_id='product-1'),
+        listing('listing-3', 'variant-a', '9', product_id='product-2'),
+    ])
+    fake_stockx.held['product-2'] = asyncio.Event()
+    query = Inventory(fake_stockx).items().filter_by(sizes=['9'])
+
+    stream = query.stream()
+    first = await asyncio.wait_for(anext(stream), timeout=1)
+
+    assert first.listing_ids == ['listing-1', 'listing-2'], (
+        'Complete products should not wait for the end of the scan'
+    )
+
+    fake_stockx.held['product-2'].set()
+    rest = [item async for item in stream]
+    assert [item.listing_ids for item in rest] == [['listing-3']]
+    assert len(fake_stockx.calls) == 1
+    assert query.stats.access_path is AccessPath.FULL_SCAN
+    assert query.stats.listings_scanned == 3
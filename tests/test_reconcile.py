@@ -0,0 +1,198 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import stockx
+from stockx.errors import StockXIncompleteOperation
+from stockx.ext.inventory import BatchReconciler, Inventory, Journal, ListedItem
+
+
+def batch_status(completed: bool) -> stockx.BatchStatus:
+    return MagicMock(
+        spec=stockx.BatchStatus,
+        status=(
+            stockx.BatchOperationStatus.COMPLETED if completed
+            else stockx.BatchOperationStatus.IN_PROGRESS
+        ),
+        item_statuses=None,
+    )
+
+
+def incomplete(operation: stockx.BatchOperationType) -> StockXIncompleteOperation:
+    return StockXIncompleteOperation(
+        'Timed out',
+        partial_results=[],
+        timed_out_batch_ids=['batch-id'],
+        batch_operations={'batch-id': operation},
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr('stockx.api.batch.asyncio.sleep', AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_reconcile_delete(mock_stockx, item):
+    listed_item = ListedItem(item, MagicMock(), ['listing-id-1', 'listing-id-2'])
+    mock_stockx.batch.delete_listings_status = AsyncMock(
+        side_effect=[batch_status(False), batch_status(True)]
+    )
+    mock_stockx.batch.delete_listings_items = AsyncMock(
+        return_value=[
+            MagicMock(
+                spec=stockx.BatchDeleteResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_id='listing-id-2',
+                error='',
+            )
+        ]
+    )
+    completed = []
+    reconciler = BatchReconciler(mock_stockx, callbacks=[completed.append])
+
+    reconciliation = reconciler.reconcile(
+        incomplete(stockx.BatchOperationType.DELETE), [listed_item]
+    )
+    [result] = await reconciliation
+
+    assert result.item is listed_item
+    assert result.deleted == ('listing-id-2',)
+    assert listed_item.listing_ids == ['listing-id-1']
+    assert mock_stockx.batch.delete_listings_status.await_count == 2
+    assert completed == [reconciliation]
+    assert not reconciler.pending
+
+
+@pytest.mark.asyncio
+async def test_reconcile_create(mock_stockx, item):
+    listed_item = ListedItem(item, MagicMock(), ['listing-id-1'])
+    mock_stockx.batch.create_listings_status = AsyncMock(
+        return_value=batch_status(True)
+    )
+    mock_stockx.batch.create_listings_items = AsyncMock(
+        return_value=[
+            MagicMock(
+                spec=stockx.BatchCreateResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_input=MagicMock(
+                    variant_id=item.variant_id, amount=item.price
+                ),
+                listing_id='listing-id-2',
+                error='',
+            )
+        ]
+    )
+    reconciler = BatchReconciler(mock_stockx)
+
+    [result] = await reconciler.reconcile(
+        incomplete(stockx.BatchOperationType.CREATE), [listed_item]
+    )
+
+    assert result.created == ('listing-id-2',)
+    assert listed_item.listing_ids == ['listing-id-1', 'listing-id-2']
+
+
+@pytest.mark.asyncio
+async def test_reconcile_timeout(mock_stockx):
+    mock_stockx.batch.update_listings_status = AsyncMock(
+        return_value=batch_status(False)
+    )
+    mock_stockx.batch.update_listings_items = AsyncMock(return_value=[])
+    completed = []
+    reconciler = BatchReconciler(mock_stockx, timeout=0)
+    reconciler.add_callback(completed.append)
+
+    reconciler.reconcile(incomplete(stockx.BatchOperationType.UPDATE))
+
+    with pytest.raises(StockXIncompleteOperation) as exc_info:
+        await reconciler.wait()
+    assert exc_info.value.timed_out_batch_ids == ['batch-id']
+    assert not completed
+
+
+def test_reconcile_unknown_operation(mock_stockx):
+    error = StockXIncompleteOperation(
+        'Timed out', partial_results=[], timed_out_batch_ids=['batch-id']
+    )
+    with pytest.raises(ValueError):
+        BatchReconciler(mock_stockx).reconcile(error)
+
+
+@pytest.mark.asyncio
+async def test_inventory_reconciles_on_exit(mock_stockx, item, monkeypatch):
+    async def update_listings(**kwargs):
+        raise incomplete(stockx.BatchOperationType.UPDATE)
+
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_listings', update_listings
+    )
+    monkeypatch.setattr(Inventory, 'load', AsyncMock())
+    mock_stockx.batch.update_listings_status = AsyncMock(
+        return_value=batch_status(True)
+    )
+    mock_stockx.batch.update_listings_items = AsyncMock(
+        return_value=[
+            MagicMock(
+                spec=stockx.BatchUpdateResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_input=MagicMock(listing_id='listing-id-1'),
+                error='',
+            )
+        ]
+    )
+    reconciler = BatchReconciler(mock_stockx)
+    completed = []
+    reconciler.add_callback(completed.append)
+
+    async with Inventory(mock_stockx, reconciler=reconciler) as inventory:
+        listed_item = ListedItem(item, inventory, ['listing-id-1'])
+        listed_item.price = 90.0
+
+    [reconciliation] = completed
+    [result] = reconciliation.result()
+    assert result.item is listed_item
+    assert result.updated == ('listing-id-1',)
+
+
+@pytest.mark.asyncio
+async def test_reconciled_change_keeps_newer_change(
+    mock_stockx, 
+    item, 
+    tmp_path, 
+    monkeypatch,
+):
+    async def update_listings(**kwargs):
+        raise incomplete(stockx.BatchOperationType.UPDATE)
+
+    monkeypatch.setattr(
+        'stockx.ext.inventory.inventory.update_listings', update_listings
+    )
+    mock_stockx.batch.update_listings_status = AsyncMock(
+        return_value=batch_status(True)
+    )
+    mock_stockx.batch.update_listings_items = AsyncMock(
+        return_value=[
+            MagicMock(
+                spec=stockx.BatchUpdateResult,
+                status=stockx.BatchItemStatus.COMPLETED,
+                listing_input=MagicMock(listing_id='listing-id-1'),
+                error='',
+            )
+        ]
+    )
+    journal = Journal(tmp_path / 'inventory.journal')
+    reconciler = BatchReconciler(mock_stockx)
+    inventory = Inventory(mock_stockx, journal=journal, reconciler=reconciler)
+    listed_item = ListedItem(item, inventory, ['listing-id-1'])
+    listed_item.price = 90.0
+
+    with pytest.raises(StockXIncompleteOperation):
+        await inventory.update()
+
+    # Changed again before the timed out batch is reconciled
+    listed_item.price = 80.0
+    await reconciler.wait()
+
+    [change] = journal.state().changes
+    assert change.price == 80.0
@@ -38,3 +38,53 @@ async def test_search_product_by_url_not_found(mock_stockx):
     assert product is None
 
 
+
+
+def product(product_id: str, style_id: str, url_key: str = '', title: str = ''):
+    return stockx.Product(
+        product_id=product_id, style_id=style_id, url_key=url_key, title=title
+    )
+
+
+def test_product_index_lookups():
+    index = search.ProductIndex()
+    index.add(product(
+        'product-1', 
+        style_id='DD1391-100/DD1503-101', 
+        url_key='nike-dunk-low', 
+        title='Nike Dunk Low "Panda"',
+    ))
+    index.add(product('product-2', 'DD1391'))
+
+    assert index.by_sku('dd1503-101').id == 'product-1'
+    assert index.by_sku('DD1391').id == 'product-2'
+    assert index.by_sku('DD1503') is None
+    assert index.by_url('https://stockx.com/nike-dunk-low').id == 'product-1'
+    assert index.by_title('nike dunk low panda').id == 'product-1'
+
+
+def test_product_index_persistence(tmp_path):
+    index = search.ProductIndex(tmp_path / 'products.json')
+    index.add(product('product-1', 'CW2288-111', 'nike-air-force-1-low-white'))
+    index.save()
+
+    loaded = search.ProductIndex.open(tmp_path / 'products.json')
+
+    assert len(loaded) == 1
+    assert loaded.by_sku('CW2288-111') == index.by_sku('CW2288-111')
+
+
+@pytest.mark.asyncio
+async def test_product_by_sku_checks_index(mock_stockx, monkeypatch):
+    index = search.ProductIndex()
+    await index.warm(mock_stockx, ['adidas'])
+    monkeypatch.setattr(search, '_index', index)
+
+    async def search_catalog(**kwargs):
+        raise AssertionError('Index should be checked first')
+        yield
+
+    monkeypatch.setattr(mock_stockx.catalog, 'search_catalog', search_catalog)
+
+    product = await search.product_by_sku(mock_stockx, '1203a342-500')
+    assert product.id == 'product-id'
@@ -0,0 +1,42 @@
+from stockx.ext.inventory.batch.sizing import BatchSizeController, chunked
+
+
+def test_batch_size_controller_shrinks_on_failures():
+    controller = BatchSizeController(size=100, min_size=10)
+
+    controller.record_completion(size=100, latency=5, failed=50)
+    assert controller.size == 50
+
+    controller.record_completion(size=50, latency=5, failed=0)
+    assert controller.size == 62, 'Clean full batches should grow the size'
+
+
+def test_batch_size_controller_shrinks_on_latency():
+    controller = BatchSizeController(size=100, target_latency=10)
+
+    controller.record_completion(size=100, latency=20)
+    assert controller.size == 75
+
+
+def test_batch_size_controller_request_too_large():
+    controller = BatchSizeController(size=100, min_size=10)
+
+    controller.record_too_large(100)
+    assert controller.max_size == 50
+    assert controller.size == 50
+
+    controller.record_completion(size=50, latency=1)
+    assert controller.size == 50, 'Size should never exceed the max size'
+
+
+def test_chunked_reads_size_before_each_chunk():
+    controller = BatchSizeController(size=4, min_size=2)
+    chunks = chunked(range(10), controller)
+
+    assert next(chunks) == (0, 1, 2, 3)
+    controller.record_too_large(4)
+    assert list(chunks) == [(4, 5), (6, 7), (8, 9)]
+
+
+def test_fixed_batch_size():
+    assert list(chunked(range(5), 2)) == [(0, 1), (2, 3), (4,)]